@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Benchmarks for the LiveObjects runtime.
+
+Each size builds a synthetic image of N objects with M slots in a scratch copy
+of liveobjects.py, snapshots it, reloads it, and times the hot paths. Results
+are printed (or written with --out) as JSON so runs can be diffed.
+
+  python3 bench_liveobjects.py
+  python3 bench_liveobjects.py --sizes 12,1000,100000 --slots 8 --method-ratio 0.25 --out before.json
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+RUNTIME = Path(__file__).with_name("liveobjects.py")
+DEFAULT_SIZES = "12,1000,10000"
+
+
+def load_runtime(path: Path, tag: str) -> Any:
+  """Import a copy of the runtime as its own module, so FILEPATH points at the copy."""
+  spec = importlib.util.spec_from_file_location(f"liveobjects_bench_{tag}", path)
+  module = importlib.util.module_from_spec(spec)
+  with contextlib.redirect_stdout(io.StringIO()):
+    spec.loader.exec_module(module)
+  return module
+
+
+def timed(fn: Callable[[], Any], number: int = 1, repeat: int = 1) -> Dict[str, float]:
+  """Best of `repeat` runs of `number` calls."""
+  best = float("inf")
+  for _ in range(repeat):
+    start = time.perf_counter()
+    for _ in range(number):
+      fn()
+    best = min(best, time.perf_counter() - start)
+  return {"seconds": best, "ops": number, "per_op_us": best / number * 1e6}
+
+
+def build_image(lo: Any, boot: Any, objects: int, slots: int, method_ratio: float) -> Any:
+  """Grow a hydrated image to `objects` objects; returns the shared prototype."""
+  methods = int(round(slots * method_ratio))
+  proto = boot.fresh("BenchProto")
+  proto.jadd_slot("UniversalTraits*", lo.PARENT, "'UniversalTraits'", boot.objsearch("UniversalTraits"))
+  proto.jadd_slot("base", lo.FIELD, "1", 1)
+  proto.jadd_slot("inherited", lo.METHOD, "lambda self: self.base + 1")
+  for i in range(len(boot.oblist), objects):
+    obj = boot.fresh(f"Bench{i}")
+    obj.jadd_slot("proto*", lo.PARENT, "'BenchProto'", proto)
+    for k in range(slots - methods):
+      obj.jadd_slot(f"f{k}", lo.FIELD, repr(i + k), i + k)
+    for k in range(methods):
+      # A handful of distinct sources, as real images repeat their methods.
+      obj.jadd_slot(f"m{k}", lo.METHOD, f"lambda self: self.base + {k % 8}")
+  return proto
+
+
+def bench_size(objects: int, slots: int, method_ratio: float, ops: int, seed: int) -> Dict[str, Any]:
+  rng = random.Random(seed)
+  timings: Dict[str, Dict[str, float]] = {}
+  with tempfile.TemporaryDirectory(prefix="lo-bench-") as tmp:
+    path = Path(tmp) / "liveobjects.py"
+    shutil.copyfile(RUNTIME, path)
+    lo = load_runtime(path, f"{objects}_build")
+    boot = lo.BootObject()
+    lo.GLOBAL_ENV["boot"] = boot
+    with contextlib.redirect_stdout(io.StringIO()):
+      with boot.loading():
+        lo.HYDRATE(boot)
+      timings["build"] = timed(lambda: build_image(lo, boot, objects, slots, method_ratio))
+      timings["snapshot_full"] = timed(lambda: boot.snapshot(full=True))
+      sample = rng.sample(boot.oblist, min(len(boot.oblist), max(1, objects // 100)))
+      for obj in sample:
+        obj.jadd_slot("touched", lo.FIELD, "1", 1)
+      timings["snapshot_delta"] = timed(lambda: boot.snapshot(full=False))
+      timings["snapshot_full"]["bytes"] = path.stat().st_size
+
+    # Reload the snapshot: the module compile, source hydrate and binary image.
+    start = time.perf_counter()
+    lo = load_runtime(path, f"{objects}_load")
+    timings["load_module"] = {"seconds": time.perf_counter() - start, "ops": 1}
+    boot = lo.BootObject()
+    lo.GLOBAL_ENV["boot"] = boot
+    with contextlib.redirect_stdout(io.StringIO()):
+      with boot.loading():
+        timings["hydrate"] = timed(lambda: lo.HYDRATE(boot))
+      timings["apply_deltas"] = timed(boot.apply_deltas)
+      image = lo.BootObject()
+      timings["load_image"] = timed(lambda: image.load_image(strict=False))
+
+    methods = [s for obj in boot.oblist for s in obj.slots.values() if s.kind == lo.METHOD]
+    sources = [s.source for s in methods][:ops]
+    lo._METHOD_CODE_CACHE.clear()
+    timings["compile_method_cold"] = timed(lambda: [lo._compile_method(src) for src in sources])
+    timings["compile_method_cold"]["ops"] = len(sources)
+    timings["compile_method_warm"] = timed(lambda: [lo._compile_method(src) for src in sources])
+    timings["compile_method_warm"]["ops"] = len(sources)
+
+    bench = [obj for obj in boot.oblist if obj.name.startswith("Bench")]
+    targets = [rng.choice(bench) for _ in range(ops)]
+    field = "f0" if all("f0" in obj.slots for obj in targets) else "base"
+    it = iter(targets * 4)
+    timings["getattr_field"] = timed(lambda: getattr(next(it), field), number=ops, repeat=3)
+    it = iter(targets * 4)
+    timings["getattr_inherited_call"] = timed(lambda: next(it).inherited(), number=ops, repeat=3)
+    names = [obj.name for obj in targets]
+    serials = [obj.serial for obj in targets]
+    it = iter(names * 4)
+    timings["objsearch"] = timed(lambda: boot.objsearch(next(it)), number=ops, repeat=3)
+    it = iter(serials * 4)
+    timings["sersearch"] = timed(lambda: boot.sersearch(next(it)), number=ops, repeat=3)
+
+    executor = boot.objsearch("Command_executor")
+    command = f"boot.objsearch({names[0]!r})"
+    timings["eval_in_context"] = timed(lambda: lo._eval_in_context(boot, command, executor), number=ops, repeat=3)
+
+    manager = boot.objsearch("PrimaObjectManager")
+    clone_count = max(1, min(ops, 1000))
+    with contextlib.redirect_stdout(io.StringIO()):
+      timings["clone_object"] = timed(lambda: manager.callback_clone_object(names[0]), number=clone_count)
+
+  for entry in timings.values():
+    entry["per_op_us"] = entry["seconds"] / entry["ops"] * 1e6
+  return {"objects": objects, "slots": slots, "method_ratio": method_ratio, "timings": timings}
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description="Benchmark the LiveObjects runtime.")
+  parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated object counts (12 is the stock image)")
+  parser.add_argument("--slots", type=int, default=8, help="Slots per synthetic object")
+  parser.add_argument("--method-ratio", type=float, default=0.5, help="Fraction of synthetic slots that are methods")
+  parser.add_argument("--ops", type=int, default=10000, help="Operations per micro-benchmark")
+  parser.add_argument("--seed", type=int, default=1)
+  parser.add_argument("--out", help="Write the JSON report here instead of stdout")
+  args = parser.parse_args()
+
+  results: List[Dict[str, Any]] = []
+  for size in [int(chunk) for chunk in args.sizes.split(",") if chunk]:
+    results.append(bench_size(size, args.slots, args.method_ratio, args.ops, args.seed))
+    print(f"{size} objects done", file=sys.stderr)
+  report = {
+    "python": platform.python_version(),
+    "platform": platform.platform(),
+    "runtime": str(RUNTIME),
+    "results": results,
+  }
+  text = json.dumps(report, indent=2)
+  if args.out:
+    Path(args.out).write_text(text + "\n")
+  else:
+    print(text)
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,61 @@
+"""Shared fixtures: each test gets its own copy of the runtime and its image files."""
+
+import importlib.util
+import itertools
+import shutil
+from pathlib import Path
+
+import pytest
+
+RUNTIME = Path(__file__).with_name("liveobjects.py")
+# A standalone script (run it directly); importing it hydrates in place.
+collect_ignore = ["test_load.py"]
+_loaded = itertools.count()
+
+
+@pytest.fixture
+def load_runtime(tmp_path):
+  """Return a loader that imports the tmp_path copy of the runtime as a fresh module."""
+  path = tmp_path / "liveobjects.py"
+  shutil.copy(RUNTIME, path)
+
+  def load():
+    spec = importlib.util.spec_from_file_location(f"liveobjects_test_{next(_loaded)}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+  return load
+
+
+@pytest.fixture
+def lo(load_runtime):
+  return load_runtime()
+
+
+@pytest.fixture
+def reopen(load_runtime):
+  """Return a function that loads the runtime again the way main() does and gives back boot."""
+
+  def reopen():
+    module = load_runtime()
+    boot = module.BootObject()
+    module.GLOBAL_ENV["boot"] = boot
+    with boot.lock.write(), boot.loading():
+      module.HYDRATE(boot)
+      boot.apply_deltas()
+      boot.replay_journal()
+      boot.open_journal()
+    return boot
+
+  return reopen
+
+
+@pytest.fixture
+def boot(lo):
+  boot = lo.BootObject()
+  lo.GLOBAL_ENV["boot"] = boot
+  with boot.lock.write(), boot.loading():
+    lo.HYDRATE(boot)
+    boot.open_journal()
+  return boot
@@ -1,91 +1,376 @@
 """
 Single-file LiveObjects runtime (Python).
 State and runtime travel together in this file; snapshots overwrite the base file and write suffixed backups.
+Between full snapshots, changed slots are appended to a `.delta` sidecar that is replayed after hydrate,
+and every slot mutation since the last snapshot is logged to a `.journal` that is replayed after that.
 Commands:
   python3 liveobjects.py -c "snapshot;exit"
   python3 liveobjects.py -c "boot.objsearch('NativeDialog').go('Hello world')"
+  python3 liveobjects.py -f edits.py      (whole script compiled once; `snapshot`/`exit` lines allowed)
+  python3 liveobjects.py --fast --timings -c "..."   (defer startup hooks to first lookup; print phase times)
+  python3 liveobjects.py --mapped --fast -c "..."   (mmap the image; objects read their slots on first touch)
+  python3 liveobjects.py --async          (asyncio REPL; `async def` slot methods are awaited)
+  python3 liveobjects.py -c "boot.autosave_changes = 500; boot.autosave_seconds = 60; snapshot"   (background saves)
+  python3 liveobjects.py --serve /tmp/liveobjects.sock   (or --serve 127.0.0.1:7700; one command per line, JSON replies)
 """
 
 import argparse
+import ast
+import atexit
+import difflib
+import hashlib
+import importlib.util
+import inspect
+import io
+import ipaddress
+import json
+import marshal
+import mmap
+import os
+import queue
 import re
+import shutil
+import socket
+import stat
 import subprocess
+import sys
 import textwrap
+import threading
+import time
+import weakref
+import zlib
+from contextlib import contextmanager, redirect_stdout
+from functools import lru_cache
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional
-
-try:
-  import objc
-  from Cocoa import (
-    NSApp,
-    NSApplication,
-    NSApplicationActivationPolicyRegular,
-    NSBackingStoreBuffered,
-    NSButton,
-    NSColor,
-    NSMakeRect,
-    NSRunningApplication,
-    NSScrollView,
-    NSSplitView,
-    NSSplitViewDividerStyleThin,
-    NSTableColumn,
-    NSTableView,
-    NSTextField,
-    NSTextView,
-    NSView,
-    NSViewHeightSizable,
-    NSViewWidthSizable,
-    NSWindow,
-    NSWindowStyleMaskClosable,
-    NSWindowStyleMaskMiniaturizable,
-    NSWindowStyleMaskResizable,
-    NSWindowStyleMaskTitled,
-  )
-except Exception:
-  objc = None
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def _lazy_module(name: str) -> Any:
+  """Return `name` as a module that is only executed on first attribute access."""
+  module = sys.modules.get(name)
+  if module is not None:
+    return module
+  spec = importlib.util.find_spec(name)
+  loader = importlib.util.LazyLoader(spec.loader)
+  spec.loader = loader
+  module = importlib.util.module_from_spec(spec)
+  sys.modules[name] = module
+  parent, _, child = name.rpartition(".")
+  if parent:
+    setattr(sys.modules[parent], child, module)
+  loader.exec_module(module)
+  return module
+
+
+# Only the asyncio REPL and the command server need these; a `-c` run should
+# not pay for importing them.
+asyncio = _lazy_module("asyncio")
+futures = _lazy_module("concurrent.futures")
+multiprocessing = _lazy_module("multiprocessing")
+socketserver = _lazy_module("socketserver")
+
+# Importing pyobjc costs more than everything else at startup, so the Cocoa
+# names below start out as proxies that import it on first use (see
+# _load_cocoa). Without pyobjc installed they are plain None.
+_COCOA_NAMES = (
+  "NSApp",
+  "NSAppleScript",
+  "NSApplication",
+  "NSApplicationActivationPolicyRegular",
+  "NSBackingStoreBuffered",
+  "NSButton",
+  "NSColor",
+  "NSMakeRect",
+  "NSRunningApplication",
+  "NSScrollView",
+  "NSSplitView",
+  "NSSplitViewDividerStyleThin",
+  "NSTableColumn",
+  "NSTableView",
+  "NSTextField",
+  "NSTextView",
+  "NSView",
+  "NSViewHeightSizable",
+  "NSViewWidthSizable",
+  "NSWindow",
+  "NSWindowStyleMaskClosable",
+  "NSWindowStyleMaskMiniaturizable",
+  "NSWindowStyleMaskResizable",
+  "NSWindowStyleMaskTitled",
+)
+_COCOA_AVAILABLE = importlib.util.find_spec("objc") is not None
+_COCOA: Optional[Dict[str, Any]] = None
+_IMPORT_START = time.perf_counter()
 
 FILEPATH = Path(__file__)
 SNAPSHOT_MARKER = "# === LIVEOBJECTS SNAPSHOT ==="
-
+DELTA_MARKER = "# === LIVEOBJECTS DELTA ==="
+DELTA_END = "# === END DELTA ==="
+# fsync the journal after every record instead of only flushing it.
+JOURNAL_FSYNC = False
+IMAGE_VERSION = 1
+# Full snapshots also write a marshal image that main() loads instead of
+# executing the generated hydrate() source, as long as it matches the file.
+BINARY_IMAGE = True
+# Also write a mapped image (--mapped): an offset table over per-object
+# records, so loading it reads each object's slots only when first touched.
+MAPPED_IMAGE = False
+MAPPED_MAGIC = b"LOMAP001"
+
+# Objects the runtime looks up by name rather than through links; collect_garbage
+# treats them as roots alongside the BootObject, Lobby and applications.
+GC_ROOTS = ["Command_executor", "Keyboard_input_object", "Inspector", "NativeDialog", "OS"]
 FIELD = "FIELD"
 METHOD = "METHOD"
 PARENT = "PARENT"
 
 
+def _fsync_dir(directory: Path) -> None:
+  try:
+    fd = os.open(directory, os.O_RDONLY)
+  except OSError:
+    return
+  try:
+    os.fsync(fd)
+  except OSError:
+    pass
+  finally:
+    os.close(fd)
+
+
+def _atomic_write(path: Path, data: Any) -> None:
+  """Write through a fsynced temp file and rename it over `path`."""
+  raw = data.encode("utf-8") if isinstance(data, str) else data
+  tmp = path.with_name(f".{path.name}.tmp")
+  try:
+    with open(tmp, "wb") as handle:
+      handle.write(raw)
+      handle.flush()
+      os.fsync(handle.fileno())
+    if path.exists():
+      shutil.copymode(path, tmp)
+    os.replace(tmp, path)
+  except BaseException:
+    tmp.unlink(missing_ok=True)
+    raise
+  _fsync_dir(path.parent)
+
+
+class _JournalFile:
+  """Append-only journal handle that creates the file on its first record.
+
+  A session that changes nothing never touches the disk, so a read-only
+  directory works; if the file cannot be written, journaling stops with
+  one warning and the session carries on.
+  """
+
+  def __init__(self, path: Path, age: int) -> None:
+    self.path = path
+    self.age = age
+    self._handle = None
+    self._failed = False
+
+  def tell(self) -> int:
+    if self._handle is not None:
+      return self._handle.tell()
+    try:
+      return self.path.stat().st_size
+    except OSError:
+      return 0
+
+  def exists(self) -> bool:
+    return self._handle is not None or self.path.exists()
+
+  def append(self, line: str) -> None:
+    if self._failed:
+      return
+    try:
+      if self._handle is None:
+        self._handle = self.path.open("a")
+        if self._handle.tell() == 0:
+          self._handle.write(json.dumps({"op": "base", "age": self.age}) + "\n")
+      self._handle.write(line)
+      self._handle.flush()
+      if JOURNAL_FSYNC:
+        os.fsync(self._handle.fileno())
+    except OSError as exc:
+      self._failed = True
+      print(f"Warning: journal {self.path} is not writable ({exc}); changes are kept until the next snapshot only")
+
+  def flush(self) -> None:
+    if self._handle is not None:
+      self._handle.flush()
+
+  def close(self) -> None:
+    if self._handle is not None:
+      self._handle.close()
+      self._handle = None
+
+
+# The code above SNAPSHOT_MARKER, read once and reused by every snapshot.
+_RUNTIME_PREFIX: Optional[bytes] = None
+
+
+def load_runtime_prefix() -> bytes:
+  global _RUNTIME_PREFIX
+  if _RUNTIME_PREFIX is None:
+    text = FILEPATH.read_text()
+    marker_line = "\n" + SNAPSHOT_MARKER
+    if marker_line in text:
+      text = text.split(marker_line, 1)[0]
+    elif SNAPSHOT_MARKER in text:
+      text = text.split(SNAPSHOT_MARKER, 1)[0]
+    _RUNTIME_PREFIX = (text.rstrip() + "\n\n").encode("utf-8")
+  return _RUNTIME_PREFIX
+
+
+def _load_cocoa() -> Dict[str, Any]:
+  """Import objc and the Cocoa names once, replacing the proxies everywhere."""
+  global _COCOA
+  if _COCOA is None:
+    loaded: Dict[str, Any] = dict.fromkeys(("objc",) + _COCOA_NAMES)
+    try:
+      import objc as objc_module
+      import Cocoa
+    except Exception:
+      pass
+    else:
+      loaded["objc"] = objc_module
+      for name in _COCOA_NAMES:
+        loaded[name] = getattr(Cocoa, name, None)
+    _COCOA = loaded
+    globals().update(loaded)
+    GLOBAL_ENV.update(loaded)
+  return _COCOA
+
+
+class _CocoaProxy:
+  """Stands in for a Cocoa symbol until first use, then forwards to it."""
+  __slots__ = ("_name",)
+
+  def __init__(self, name: str) -> None:
+    self._name = name
+
+  def _target(self) -> Any:
+    target = _load_cocoa()[self._name]
+    if target is None:
+      raise RuntimeError(f"Cocoa symbol {self._name} is not available")
+    return target
+
+  def __getattr__(self, key: str) -> Any:
+    return getattr(self._target(), key)
+
+  def __call__(self, *args, **kwargs) -> Any:
+    return self._target()(*args, **kwargs)
+
+  def __bool__(self) -> bool:
+    return _load_cocoa()[self._name] is not None
+
+  def __repr__(self) -> str:
+    return f"<lazy Cocoa {self._name}>"
+
+
+def _forward(op: str) -> Callable:
+  def method(self, *args):
+    args = tuple(arg._target() if isinstance(arg, _CocoaProxy) else arg for arg in args)
+    return getattr(self._target(), op)(*args)
+  method.__name__ = op
+  return method
+
+
+# Style masks and sizing constants are ints that get or-ed together.
+for _op in ("__or__", "__ror__", "__and__", "__rand__", "__xor__", "__lshift__", "__rshift__",
+            "__int__", "__index__", "__eq__", "__ne__", "__hash__"):
+  setattr(_CocoaProxy, _op, _forward(_op))
+
+
+if _COCOA_AVAILABLE:
+  objc = _CocoaProxy("objc")
+  globals().update({name: _CocoaProxy(name) for name in _COCOA_NAMES})
+else:
+  objc = None
+  globals().update(dict.fromkeys(_COCOA_NAMES))
+
+
 def _escape_osascript(text: str) -> str:
   return text.replace('"', '\\"')
 
 
+class AppleScriptService:
+  """Runs AppleScript for the native helpers without a process per call.
+
+  Scripts run in-process through NSAppleScript when the Cocoa bridge loaded,
+  else through `osascript` if it is on PATH. With neither (e.g. Linux) the
+  backend is "none" and every call returns None at once, without an exec.
+  NSAppleScript is only safe on the main thread, so calls from any other
+  thread (server workers, the autosaver) go through `osascript` instead.
+  """
+
+  def __init__(self) -> None:
+    self._backend: Optional[str] = None
+    self._osascript: Optional[bool] = None
+
+  @property
+  def backend(self) -> str:
+    if self._backend is None:
+      if NSAppleScript:
+        self._backend = "inproc"
+      elif shutil.which("osascript"):
+        self._backend = "osascript"
+      else:
+        self._backend = "none"
+    return self._backend
+
+  def _has_osascript(self) -> bool:
+    if self._osascript is None:
+      self._osascript = shutil.which("osascript") is not None
+    return self._osascript
+
+  def run(self, script: str) -> Optional[str]:
+    """Return the script's result as text, or None if it failed or no backend exists."""
+    backend = self.backend
+    if backend == "inproc" and threading.current_thread() is not threading.main_thread():
+      backend = "osascript" if self._has_osascript() else "none"
+    if backend == "inproc":
+      desc, error = NSAppleScript.alloc().initWithSource_(script).executeAndReturnError_(None)
+      if desc is None:
+        return None
+      return (desc.stringValue() or "").strip()
+    if backend == "osascript":
+      try:
+        result = subprocess.run(["osascript", "-e", script], check=False, capture_output=True, text=True)
+      except OSError:
+        self._osascript = False
+        if self._backend == "osascript":
+          self._backend = "none"
+        return None
+      return result.stdout.strip() if result.returncode == 0 else None
+    return None
+
+
+APPLESCRIPT = AppleScriptService()
+
+
+@lru_cache(maxsize=None)
+def _hostname() -> str:
+  return socket.gethostname()
+
+
 def _native_dialog(message: str) -> None:
   """Tiny macOS dialog helper; falls back to stdout elsewhere."""
   safe = _escape_osascript(str(message))
   script = f'display dialog "{safe}" buttons {{"OK"}} default button "OK"'
-  try:
-    result = subprocess.run(
-      ["osascript", "-e", script],
-      check=False,
-      capture_output=True,
-      text=True,
-    )
-    if result.returncode != 0:
-      print(message)
-  except FileNotFoundError:
+  with _unlocked():
+    out = APPLESCRIPT.run(script)
+  if out is None:
     print(message)
 
 
 def _osascript_run(script: str) -> str:
-  try:
-    result = subprocess.run(
-      ["osascript", "-e", script],
-      check=False,
-      capture_output=True,
-      text=True,
-    )
-    if result.returncode != 0:
-      return ""
-    return result.stdout.strip()
-  except FileNotFoundError:
-    return ""
+  with _unlocked():
+    out = APPLESCRIPT.run(script)
+  return out if out is not None else ""
 
 
 def _choose_from_list_native(prompt: str, items: List[str]) -> Optional[str]:
@@ -130,111 +415,564 @@ def _prompt_text_native(prompt: str, default: str = "") -> Optional[str]:
 #
 # 2. _eval_in_context() - Evaluates code with access to boot object and
 #    GLOBAL_ENV. Used by dynamically evaluated code in Manager classes and
-#    slot methods. Must be in GLOBAL_ENV for eval'd code to call it.
+#    slot methods. Must be in GLOBAL_ENV for eval'd code to call it. Each
+#    caller keeps one EvalNamespace, and compiled commands are LRU-cached.
 #
 # 3. OS Helper Functions (_native_dialog, _choose_from_list_native, etc.) -
 #    Platform-specific utilities for macOS that don't belong in the object
-#    model. These are simple wrappers around osascript calls.
+#    model. They run AppleScript through APPLESCRIPT: in-process on the main
+#    thread, via osascript from other threads, and print instead elsewhere.
 # ============================================================================
 
 
-def _eval_in_context(boot: "BootObject", code: str) -> Any:
-  env = dict(GLOBAL_ENV)
-  env["boot"] = boot
-  code = code.strip()
+class ScriptExit(Exception):
+  """Raised by an `exit` line inside a batch script."""
+
+
+class _ScriptCommands(ast.NodeTransformer):
+  """Give bare `snapshot` and `exit` statements in a script their command meaning."""
+
+  def visit_Expr(self, node: ast.Expr) -> ast.stmt:
+    word = node.value.id if isinstance(node.value, ast.Name) else None
+    if word == "snapshot":
+      call = ast.Call(ast.Attribute(ast.Name("boot", ast.Load()), "snapshot", ast.Load()), [], [])
+      return ast.copy_location(ast.Expr(call), node)
+    if word == "exit":
+      return ast.copy_location(ast.Raise(ast.Call(ast.Name("ScriptExit", ast.Load()), [], []), None), node)
+    return node
+
+
+class EvalNamespace(dict):
+  """Globals for evaluated commands: the caller's own names over GLOBAL_ENV.
+
+  Missing names fall through to GLOBAL_ENV, so nothing is copied and later
+  GLOBAL_ENV changes are visible; names a command assigns persist here.
+  """
+
+  def __missing__(self, key: str) -> Any:
+    return GLOBAL_ENV[key]
+
+
+# One persistent namespace per caller (the executing object, or the boot).
+_EVAL_CONTEXTS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _eval_namespace(boot: "BootObject", caller: Any = None) -> EvalNamespace:
+  owner = boot if caller is None else caller
+  env = _EVAL_CONTEXTS.get(owner)
+  if env is None:
+    env = _EVAL_CONTEXTS[owner] = EvalNamespace(boot=boot)
+  return env
+
+
+@lru_cache(maxsize=1024)
+def _compile_command(code: str) -> Tuple[str, Any]:
   try:
-    compiled = compile(code, "<cmd>", "eval")
-    return eval(compiled, env, {})
+    return "eval", compile(code, "<cmd>", "eval")
   except SyntaxError:
-    compiled = compile(code, "<cmd>", "exec")
-    exec(compiled, env, {})
-    return None
+    return "exec", compile(code, "<cmd>", "exec")
 
 
-def _compile_method(source: str) -> Callable:
+def _eval_in_context(boot: "BootObject", code: str, caller: Any = None) -> Any:
+  mode, compiled = _compile_command(code.strip())
+  env = _eval_namespace(boot, caller)
+  if mode == "eval":
+    return eval(compiled, env)
+  exec(compiled, env)
+  return None
+
+
+# Compiled method code keyed by a digest of the dedented source, so identical
+# sources shared across objects (taglines, go, gstartup...) compile once.
+_METHOD_CODE_CACHE: Dict[str, Tuple[str, Any]] = {}
+_method_cache_dirty = False
+METHOD_CACHE_ON_DISK = False
+# METHOD slots added while an image loads (see BootObject.loading) keep only
+# their source until first dispatch unless this is off; edits always compile.
+LAZY_METHODS = True
+
+
+def _method_digest(source: str) -> Tuple[str, str]:
   cleaned = textwrap.dedent(source.strip("\n"))
+  return cleaned, hashlib.blake2b(cleaned.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _method_code(source: str) -> Tuple[str, Any]:
+  global _method_cache_dirty
+  cleaned, digest = _method_digest(source)
+  entry = _METHOD_CODE_CACHE.get(digest)
+  if entry is None:
+    try:
+      entry = ("eval", compile(cleaned, "<string>", "eval"))
+    except SyntaxError:
+      entry = ("exec", compile(cleaned, "<string>", "exec"))
+    _METHOD_CODE_CACHE[digest] = entry
+    _method_cache_dirty = True
+  return entry
+
+
+def _compile_method(source: str) -> Callable:
+  mode, code = _method_code(source)
+  if mode == "eval":
+    return eval(code, GLOBAL_ENV, {})
+  namespace: Dict[str, Any] = {}
+  exec(code, GLOBAL_ENV, namespace)
+  funcs = [val for val in namespace.values() if callable(val)]
+  if not funcs:
+    raise ValueError("No callable found in method source")
+  return funcs[-1]
+
+
+def _method_cache_path() -> Path:
+  return FILEPATH.with_name(f".{FILEPATH.name}.{sys.implementation.cache_tag}.methods")
+
+
+def load_method_cache(path: Optional[Path] = None) -> int:
+  """Seed the compiled-method cache from disk; stale or unreadable files are ignored."""
+  path = path or _method_cache_path()
   try:
-    return eval(cleaned, GLOBAL_ENV, {})
-  except SyntaxError:
-    namespace: Dict[str, Any] = {}
-    exec(cleaned, GLOBAL_ENV, namespace)
-    funcs = [val for val in namespace.values() if callable(val)]
-    if not funcs:
-      raise ValueError("No callable found in method source")
-    return funcs[-1]
+    magic, entries = marshal.loads(path.read_bytes())
+  except (OSError, EOFError, ValueError, TypeError):
+    return 0
+  if magic != importlib.util.MAGIC_NUMBER:
+    return 0
+  for digest, entry in entries.items():
+    _METHOD_CODE_CACHE.setdefault(digest, entry)
+  return len(entries)
+
+
+def prune_method_cache(sources: Iterable[str]) -> int:
+  """Drop cached code for every source not in `sources`; returns how many went."""
+  global _method_cache_dirty
+  keep = {_method_digest(source)[1] for source in sources}
+  stale = [digest for digest in _METHOD_CODE_CACHE if digest not in keep]
+  for digest in stale:
+    del _METHOD_CODE_CACHE[digest]
+  if stale:
+    _method_cache_dirty = True
+  return len(stale)
+
+
+def save_method_cache(path: Optional[Path] = None) -> Optional[Path]:
+  global _method_cache_dirty
+  if not _method_cache_dirty:
+    return None
+  path = path or _method_cache_path()
+  try:
+    _atomic_write(path, marshal.dumps((importlib.util.MAGIC_NUMBER, _METHOD_CODE_CACHE)))
+  except OSError as exc:
+    print(f"method cache not saved: {exc}")
+    return None
+  _method_cache_dirty = False
+  return path
 
 
 GLOBAL_ENV: Dict[str, Any] = {
+  "asyncio": asyncio,
   "subprocess": subprocess,
   "textwrap": textwrap,
   "_native_dialog": _native_dialog,
+  "_hostname": _hostname,
+  "os": os,
   "_eval_in_context": _eval_in_context,
   "_choose_from_list_native": _choose_from_list_native,
   "_prompt_text_native": _prompt_text_native,
   "objc": objc,
-  "NSApplication": globals().get("NSApplication"),
-  "NSApp": globals().get("NSApp"),
-  "NSRunningApplication": globals().get("NSRunningApplication"),
-  "NSWindow": globals().get("NSWindow"),
-  "NSScrollView": globals().get("NSScrollView"),
-  "NSSplitView": globals().get("NSSplitView"),
-  "NSTableView": globals().get("NSTableView"),
-  "NSTableColumn": globals().get("NSTableColumn"),
-  "NSTextView": globals().get("NSTextView"),
-  "NSTextField": globals().get("NSTextField"),
-  "NSColor": globals().get("NSColor"),
-  "NSButton": globals().get("NSButton"),
-  "NSView": globals().get("NSView"),
-  "NSMakeRect": globals().get("NSMakeRect"),
-  "NSBackingStoreBuffered": globals().get("NSBackingStoreBuffered"),
-  "NSWindowStyleMaskTitled": globals().get("NSWindowStyleMaskTitled"),
-  "NSWindowStyleMaskClosable": globals().get("NSWindowStyleMaskClosable"),
-  "NSWindowStyleMaskResizable": globals().get("NSWindowStyleMaskResizable"),
-  "NSWindowStyleMaskMiniaturizable": globals().get("NSWindowStyleMaskMiniaturizable"),
-  "NSViewWidthSizable": globals().get("NSViewWidthSizable"),
-  "NSViewHeightSizable": globals().get("NSViewHeightSizable"),
-  "NSSplitViewDividerStyleThin": globals().get("NSSplitViewDividerStyleThin"),
-  "NSApplicationActivationPolicyRegular": globals().get("NSApplicationActivationPolicyRegular"),
+  **{name: globals()[name] for name in _COCOA_NAMES},
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Slot:
   name: str
   kind: str
   source: str
   value: Any = None
+  # Set once more than one slot table holds this Slot (see ProtoObject._own_slot);
+  # writers then replace it with a private copy instead of mutating it.
+  shared: bool = False
+
+  def __post_init__(self) -> None:
+    # Every object repeats the same slot names, kinds and short sources;
+    # interning makes them share one string each.
+    self.name = sys.intern(self.name)
+    self.kind = sys.intern(self.kind)
+    if isinstance(self.source, str) and len(self.source) <= 256:
+      self.source = sys.intern(self.source)
+
+  def method(self) -> Callable:
+    """Return the compiled callable, compiling a lazy METHOD slot on first use."""
+    if self.value is None:
+      self.value = _compile_method(self.source)
+    return self.value
+
+
+def _invalidate_lookups() -> None:
+  ProtoObject.lookup_epoch += 1
+
+
+def _is_parent_slot(name: str, slot: Slot) -> bool:
+  return slot.kind == PARENT or name.endswith("*")
+
+
+class _Held:
+  """Context manager for one side of an RWLock."""
+
+  __slots__ = ("acquire", "release")
+
+  def __init__(self, acquire: Callable[[], None], release: Callable[[], None]) -> None:
+    self.acquire = acquire
+    self.release = release
+
+  def __enter__(self) -> None:
+    self.acquire()
+
+  def __exit__(self, *exc) -> None:
+    self.release()
+
+
+class RWLock:
+  """Many concurrent readers or one writer; waiting writers block new readers
+  and take the write side in arrival order.
+
+  Both sides are reentrant per thread, and the writer may also take the read
+  side. A reader asking for the write side would wait on itself, so that
+  raises RuntimeError instead.
+  """
+
+  def __init__(self) -> None:
+    # The mutex guards the counters; the condition is only waited on when
+    # contended, and only notified when someone is waiting.
+    self._mutex = threading.Lock()
+    self._cond = threading.Condition(self._mutex)
+    self._waiting = 0
+    self._readers: Dict[int, int] = {}
+    self._writer: Optional[int] = None
+    self._depth = 0
+    self._writers_waiting = 0
+    # Write tickets: the next one to hand out, the one being served, and
+    # those whose holders gave up waiting.
+    self._tickets = 0
+    self._turn = 0
+    self._abandoned: set = set()
+    self._read = _Held(self.acquire_read, self.release_read)
+    self._write = _Held(self.acquire_write, self.release_write)
+
+  def read(self) -> _Held:
+    return self._read
+
+  def write(self) -> _Held:
+    return self._write
+
+  def reading(self) -> bool:
+    """True if the calling thread holds the read side."""
+    return threading.get_ident() in self._readers
+
+  def writing(self) -> bool:
+    """True if the calling thread holds the write side."""
+    return self._writer == threading.get_ident()
+
+  def _wait(self) -> None:
+    self._waiting += 1
+    try:
+      self._cond.wait()
+    finally:
+      self._waiting -= 1
+
+  def acquire_read(self) -> None:
+    me = threading.get_ident()
+    with self._mutex:
+      depth = self._readers.get(me)
+      if depth is None and self._writer != me:
+        while self._writer is not None or self._writers_waiting:
+          self._wait()
+      self._readers[me] = (depth or 0) + 1
+
+  def release_read(self) -> None:
+    me = threading.get_ident()
+    with self._mutex:
+      depth = self._readers[me] - 1
+      if depth:
+        self._readers[me] = depth
+        return
+      del self._readers[me]
+      if not self._readers and self._waiting:
+        self._cond.notify_all()
+
+  def acquire_write(self) -> None:
+    me = threading.get_ident()
+    if self._writer == me:
+      # Only the owning thread touches the depth, so re-entry needs no lock.
+      self._depth += 1
+      return
+    with self._mutex:
+      if me in self._readers:
+        raise RuntimeError("cannot take the write lock while holding the read lock")
+      ticket = self._tickets
+      self._tickets += 1
+      if self._writer is not None or self._readers or ticket != self._turn:
+        self._writers_waiting += 1
+        try:
+          while self._writer is not None or self._readers or ticket != self._turn:
+            self._wait()
+        except BaseException:
+          if ticket == self._turn:
+            self._next_turn()
+          else:
+            self._abandoned.add(ticket)
+          self._cond.notify_all()
+          raise
+        finally:
+          self._writers_waiting -= 1
+      self._next_turn()
+      self._writer = me
+      self._depth = 1
+
+  def _next_turn(self) -> None:
+    self._turn += 1
+    while self._turn in self._abandoned:
+      self._abandoned.discard(self._turn)
+      self._turn += 1
+
+  def release_write(self) -> None:
+    if self._depth > 1:
+      self._depth -= 1
+      return
+    with self._mutex:
+      self._depth = 0
+      self._writer = None
+      if self._waiting:
+        self._cond.notify_all()
+
+  @contextmanager
+  def released(self):
+    """Give up every hold the calling thread has for the block, then take them back.
+
+    For blocking calls (a UI event loop, a modal dialog) made by code that
+    may run under the lock, so other threads are not stalled meanwhile.
+    """
+    me = threading.get_ident()
+    wrote = self._depth if self._writer == me else 0
+    with self._mutex:
+      read = self._readers.pop(me, 0)
+      if wrote:
+        self._depth = 0
+        self._writer = None
+      if (wrote or read) and self._waiting:
+        self._cond.notify_all()
+    try:
+      yield
+    finally:
+      if wrote:
+        self.acquire_write()
+        self._depth = wrote
+      if read:
+        self.acquire_read()
+        with self._mutex:
+          self._readers[me] = read
+
+
+@contextmanager
+def _unlocked():
+  """Release the runtime lock, if this thread holds it, around a blocking call."""
+  boot = GLOBAL_ENV.get("boot")
+  if boot is None:
+    yield
+    return
+  with boot.lock.released():
+    yield
+
+
+_MISSING = (None, None)
 
 
 class ProtoObject:
+  # Fixed per-object state lives in __slots__; a __dict__ only materialises
+  # when code hangs ad-hoc attributes (Cocoa windows and the like) on an object.
+  __slots__ = ("name", "boot", "slots", "_serial", "_cow", "_lookup_cache", "_lookup_epoch", "__dict__", "__weakref__")
+  _is_boot = False
+  # Bumped whenever any slot table or parent link changes; per-object lookup
+  # caches compare against it and flush themselves when they are stale.
+  lookup_epoch: int = 0
+
   def __init__(self, name: str, boot: "BootObject"):
-    self.name = name
+    self.name = sys.intern(name)
     self.boot = boot
     self.slots: Dict[str, Slot] = {}
-    self.serial: int = -1
+    # True while `slots` is a table shared with a clone or its source.
+    self._cow = False
+    self.serial = -1
+    self._lookup_cache: Optional[Dict[str, tuple]] = None
+    self._lookup_epoch: int = ProtoObject.lookup_epoch
+
+  @classmethod
+  def _unloaded(cls, name: str, boot: "BootObject", serial: int) -> "ProtoObject":
+    """An object with `slots` left unset, for a mapped image to fill on first touch."""
+    obj = cls.__new__(cls)
+    init = object.__setattr__
+    init(obj, "name", sys.intern(name))
+    init(obj, "boot", boot)
+    init(obj, "_cow", False)
+    init(obj, "_serial", serial)
+    init(obj, "_lookup_cache", None)
+    init(obj, "_lookup_epoch", ProtoObject.lookup_epoch)
+    return obj
 
   def __repr__(self) -> str:
     return f"<ProtoObject {self.name}#{self.serial}>"
 
+  @property
+  def serial(self) -> int:
+    return self._serial
+
+  @serial.setter
+  def serial(self, value: int) -> None:
+    old = getattr(self, "_serial", None)
+    self._serial = value
+    registry = self._registry()
+    members = registry.__dict__.get("_members")
+    if members is None or members.get(id(self)) is not self:
+      return
+    index = registry._by_serial
+    if index.get(old) is self:
+      del index[old]
+    index[value] = self
+
+  def _registry(self) -> "BootObject":
+    return self if self._is_boot else self.boot
+
+  def _plain_attr(self, key: str) -> bool:
+    return hasattr(type(self), key)
+
+  def __setattr__(self, key: str, value: Any) -> None:
+    if not self._plain_attr(key):
+      slot = self.slots.get(key)
+      if slot is not None and slot.kind == FIELD:
+        if slot.value is not value:
+          with self._registry().lock.write():
+            if slot.shared or self._cow:
+              slot = self._own_slot(key)
+            slot.value = value
+            # The old source text no longer describes the value.
+            slot.source = None
+            if key.endswith("*"):
+              # A `*` field is a parent link; cached lookups may go through it.
+              _invalidate_lookups()
+            self._mark_dirty(key)
+        return
+    object.__setattr__(self, key, value)
+
+  def _share_slots(self, source: "ProtoObject") -> None:
+    """Adopt `source`'s slot table copy-on-write; either side copies before writing."""
+    self.slots = source.slots
+    self._cow = source._cow = True
+    self._lookup_cache = None
+
+  def _own_slots(self) -> Dict[str, Slot]:
+    """Return a slot table private to this object, splitting off a shared one first."""
+    if self._cow:
+      slots = dict(self.slots)
+      for slot in slots.values():
+        slot.shared = True
+      self.slots = slots
+      self._cow = False
+    return self.slots
+
+  def _own_slot(self, name: str) -> Optional[Slot]:
+    """Return a Slot this object may mutate in place, copying a shared one."""
+    slots = self._own_slots()
+    slot = slots.get(name)
+    if slot is not None and slot.shared:
+      slot = slots[name] = Slot(slot.name, slot.kind, slot.source, slot.value)
+      _invalidate_lookups()
+    return slot
+
+  def _load_slots(self) -> Dict[str, Slot]:
+    # Only objects opened from a mapped image leave `slots` unset.
+    registry = self._registry()
+    mapped = registry.__dict__.get("_mapped")
+    if mapped is None:
+      raise AttributeError("slots")
+    slots = mapped.materialize(self)
+    if not mapped.pending():
+      registry._mapped = None
+    return slots
+
+  def _mark_dirty(self, name: str) -> None:
+    registry = self._registry()
+    dirty = registry.__dict__.get("_dirty")
+    # Objects created since the last save are written whole, so only
+    # persisted ones need per-slot bookkeeping.
+    if dirty is not None and registry._persisted.get(self.serial) is self:
+      dirty.setdefault(self, set()).add(name)
+    registry._changes += 1
+    if registry._recording():
+      registry._journal_slot(self, name)
+    if name in AUTOSAVE_SETTINGS and self is registry and registry.__dict__.get("_autosaver") is not None:
+      registry._autosaver.start()
+
   def __getattr__(self, key: str) -> Any:
-    slots = self.__dict__.get("slots", {})
-    if key in slots:
-      slot = slots[key]
-      if slot.kind == METHOD:
-        return slot.value.__get__(self, self.__class__)
-      return slot.value
-    raise AttributeError(key)
-
-  def jadd_slot(self, name: str, kind: str, source: str, value: Any = None) -> None:
+    if key in _PROTO_STATE or key.startswith("__"):
+      if key == "slots":
+        return self._load_slots()
+      raise AttributeError(key)
+    cache = self._lookup_cache
+    if cache is None or self._lookup_epoch != ProtoObject.lookup_epoch:
+      cache = self._lookup_cache = {}
+      self._lookup_epoch = ProtoObject.lookup_epoch
+    entry = cache.get(key)
+    if entry is None:
+      slot = self.lookup_slot(key)
+      if slot is None:
+        entry = _MISSING
+      elif slot.kind == METHOD:
+        bound = slot.method().__get__(self, self.__class__)
+        if _PROFILER is not None:
+          bound = _PROFILER.wrap(self, key, bound)
+        entry = (slot, bound)
+      else:
+        entry = (slot, None)
+      cache[key] = entry
+    slot, bound = entry
+    if slot is None:
+      raise AttributeError(key)
+    return slot.value if bound is None else bound
+
+  def lookup_slot(self, key: str) -> Optional[Slot]:
+    """Find a slot here or, depth-first, through `*`-suffixed and PARENT slots."""
+    seen = set()
+    stack: List[ProtoObject] = [self]
+    while stack:
+      obj = stack.pop()
+      if id(obj) in seen:
+        continue
+      seen.add(id(obj))
+      slots = obj.slots
+      slot = slots.get(key)
+      if slot is not None:
+        return slot
+      parents = [
+        s.value for n, s in slots.items() if _is_parent_slot(n, s) and isinstance(s.value, ProtoObject)
+      ]
+      stack.extend(reversed(parents))
+    return None
+
+  def jadd_slot(
+    self, name: str, kind: str, source: str, value: Any = None, eager: Optional[bool] = None
+  ) -> None:
     if name.startswith("widget_"):
       value = None
     if kind == METHOD:
-      compiled = _compile_method(source)
-      self.slots[name] = Slot(name, METHOD, source, compiled)
-    elif kind == PARENT:
-      self.slots[name] = Slot(name, PARENT, source, value)
+      if eager is None:
+        eager = not (LAZY_METHODS and self._registry()._loading)
+      slot = Slot(name, METHOD, source, _compile_method(source) if eager else None)
     else:
-      self.slots[name] = Slot(name, FIELD, source, value)
+      slot = Slot(name, PARENT if kind == PARENT else FIELD, source, value)
+    with self._registry().lock.write():
+      self._own_slots()[name] = slot
+      _invalidate_lookups()
+      self._mark_dirty(name)
+      self._reindex(name)
 
   def jaddSlots(self, mapping: Dict[str, Any]) -> None:
     for name, spec in mapping.items():
@@ -245,30 +983,430 @@ class ProtoObject:
       self.jadd_slot(name, kind, source, value)
 
   def delete_slot(self, name: str) -> None:
-    if name in self.slots:
-      del self.slots[name]
+    with self._registry().lock.write():
+      if name in self.slots:
+        del self._own_slots()[name]
+        _invalidate_lookups()
+        self._mark_dirty(name)
+        self._reindex(name)
+
+  def _reindex(self, name: str) -> None:
+    index = self._registry().__dict__.get("_index")
+    if index is not None and index.tracks(self):
+      index.update(self, name)
 
   def slot_names(self, kind: str) -> List[str]:
     return sorted([n for n, slot in self.slots.items() if slot.kind == kind])
 
 
+def _line_delta(base: List[str], target: List[str]) -> list:
+  """Encode target as (start, end) copies from base plus runs of new lines."""
+  ops: list = []
+  matcher = difflib.SequenceMatcher(None, base, target)
+  for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+    if tag == "equal":
+      ops.append((i1, i2))
+    elif j2 > j1:
+      ops.append(target[j1:j2])
+  return ops
+
+
+def _apply_line_delta(base: List[str], ops: list) -> List[str]:
+  out: List[str] = []
+  for op in ops:
+    if isinstance(op, tuple):
+      out.extend(base[op[0]:op[1]])
+    else:
+      out.extend(op)
+  return out
+
+
+_PROTO_STATE = frozenset(ProtoObject.__slots__)
+
+
+_TOKEN_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+@lru_cache(maxsize=4096)
+def _source_tokens(source: str) -> frozenset:
+  return frozenset(_TOKEN_RE.findall(source))
+
+
+class SlotIndex:
+  """Slot name -> objects, and method-source identifier -> (object, slot name).
+
+  Built on first query by BootObject.slot_index(); afterwards jadd_slot,
+  delete_slot, register and unregister keep it current.
+  """
+
+  def __init__(self, registry: "BootObject") -> None:
+    self.registry = registry
+    self.by_name: Dict[str, Dict[int, ProtoObject]] = {}
+    self.by_token: Dict[str, Dict[Tuple[int, str], ProtoObject]] = {}
+    self._tokens: Dict[Tuple[int, str], frozenset] = {}
+    for obj in registry.oblist:
+      self.add_object(obj)
+
+  def tracks(self, obj: ProtoObject) -> bool:
+    return self.registry._members.get(id(obj)) is obj
+
+  def update(self, obj: ProtoObject, name: str) -> None:
+    """Re-read one slot of `obj` (added, replaced or deleted)."""
+    key = (id(obj), name)
+    slot = obj.slots.get(name)
+    if slot is None:
+      holders = self.by_name.get(name)
+      if holders is not None:
+        holders.pop(id(obj), None)
+        if not holders:
+          del self.by_name[name]
+      tokens = frozenset()
+    else:
+      self.by_name.setdefault(name, {})[id(obj)] = obj
+      source = slot.source if slot.kind == METHOD else None
+      tokens = _source_tokens(source) if isinstance(source, str) else frozenset()
+    old = self._tokens.get(key, frozenset())
+    if tokens == old:
+      return
+    for token in old - tokens:
+      entries = self.by_token[token]
+      del entries[key]
+      if not entries:
+        del self.by_token[token]
+    for token in tokens - old:
+      self.by_token.setdefault(token, {})[key] = obj
+    if tokens:
+      self._tokens[key] = tokens
+    else:
+      del self._tokens[key]
+
+  def add_object(self, obj: ProtoObject) -> None:
+    for name in obj.slots:
+      self.update(obj, name)
+
+  def remove_object(self, obj: ProtoObject) -> None:
+    for name in [name for name, holders in self.by_name.items() if id(obj) in holders]:
+      holders = self.by_name[name]
+      del holders[id(obj)]
+      if not holders:
+        del self.by_name[name]
+      for token in self._tokens.pop((id(obj), name), ()):
+        entries = self.by_token[token]
+        del entries[(id(obj), name)]
+        if not entries:
+          del self.by_token[token]
+
+  def implementors(self, name: str) -> List[ProtoObject]:
+    """Objects that define slot `name` themselves, in serial order."""
+    return sorted(self.by_name.get(name, {}).values(), key=lambda obj: obj.serial)
+
+  def senders(self, *tokens: str) -> List[Tuple[ProtoObject, str]]:
+    """(object, method slot) pairs whose source mentions every one of `tokens`."""
+    if not tokens:
+      return []
+    found = [self.by_token.get(token, {}) for token in tokens]
+    found.sort(key=len)
+    hits = [(key, obj) for key, obj in found[0].items() if all(key in other for other in found[1:])]
+    return sorted(((obj, key[1]) for key, obj in hits), key=lambda hit: (hit[0].serial, hit[1]))
+
+
+class MappedImage:
+  """A memory-mapped image: per-object marshal records behind an offset table.
+
+  BootObject.open_mapped_image() registers an unloaded object for every
+  entry; an object's slot table is decoded from the mapping the first time
+  its `slots` are touched, and the file is unmapped once all of them are.
+  """
+
+  def __init__(self, path: Path) -> None:
+    with open(path, "rb") as handle:
+      self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+      if self._map[:8] != MAPPED_MAGIC:
+        raise ValueError(f"{path} is not a mapped image")
+      index_at = int.from_bytes(self._map[8:16], "little")
+      self.header, self.entries = marshal.loads(self._map[index_at:])
+    except Exception:
+      self._map.close()
+      raise
+    self._spans: Dict[int, Tuple[int, int]] = {}
+    self._by_serial: Dict[int, ProtoObject] = {}
+    self._lock = threading.RLock()
+
+  @staticmethod
+  def write(path: Path, header: tuple, records: List[Tuple[int, str, bool, bytes]]) -> None:
+    """Write (serial, name, is_boot, record) entries and their offset table."""
+    out = io.BytesIO()
+    out.write(MAPPED_MAGIC + bytes(8))
+    entries = []
+    for serial, name, is_boot, record in records:
+      entries.append((serial, name, is_boot, out.tell(), len(record)))
+      out.write(record)
+    index_at = out.tell()
+    out.write(marshal.dumps((header, entries)))
+    data = out.getbuffer()
+    data[8:16] = index_at.to_bytes(8, "little")
+    _atomic_write(path, bytes(data))
+
+  def adopt(self, obj: ProtoObject, serial: int, span: Optional[Tuple[int, int]] = None) -> None:
+    """Bind an image serial to `obj`; with a span its slots load on first touch."""
+    self._by_serial[serial] = obj
+    if span is not None:
+      self._spans[id(obj)] = span
+
+  def pending(self) -> int:
+    """Objects whose slots have not been read yet."""
+    return len(self._spans)
+
+  def read(self, offset: int, length: int) -> Dict[str, Slot]:
+    """Decode one object's record into a slot table, resolving its links."""
+    slots, links = marshal.loads(self._map[offset:offset + length])
+    table: Dict[str, Slot] = {}
+    env = globals()
+    for slot_name, kind, source, tag, payload in slots:
+      table[slot_name] = Slot(slot_name, kind, source, eval(payload, env) if tag else payload)
+    for slot_name, target_serial in links:
+      table[slot_name].value = self._by_serial.get(target_serial)
+    return table
+
+  def materialize(self, obj: ProtoObject) -> Dict[str, Slot]:
+    with self._lock:
+      try:
+        return object.__getattribute__(obj, "slots")
+      except AttributeError:
+        pass
+      span = self._spans.get(id(obj))
+      if span is None:
+        raise AttributeError("slots")
+      obj.slots = table = self.read(*span)
+      del self._spans[id(obj)]
+      if not self._spans:
+        self.close()
+      return table
+
+  def close(self) -> None:
+    self._spans.clear()
+    self._by_serial.clear()
+    self._map.close()
+
+
+class SnapshotHistory:
+  """Index of snapshot backups with retention and reverse-delta compression.
+
+  The newest backup is kept as a plain `liveobjects.py.N` copy; each older age
+  is stored as a zlib-compressed line delta against the next newer age, so the
+  newest can be read directly and older ones by walking the chain back.
+  A backup of a binary-format runtime also names the versioned image
+  (`liveobjects.py.image.N`) its stub loads; that image lives as long as it.
+  """
+
+  def __init__(self, base_path: Path):
+    self.base_path = base_path
+    self.index_path = base_path.with_name(f"{base_path.name}.history")
+    self.entries: List[dict] = []
+    self.next_age = 0
+    self._load()
+
+  def _load(self) -> None:
+    try:
+      data = json.loads(self.index_path.read_text())
+      self.entries = data["entries"]
+      self.next_age = data["next_age"]
+      return
+    except (OSError, ValueError, KeyError):
+      pass
+    # No index yet: adopt whatever numbered backups are already on disk.
+    prefix = self.base_path.name + "."
+    for path in self.base_path.parent.iterdir():
+      suffix = path.name[len(prefix):] if path.name.startswith(prefix) else ""
+      if suffix.isdigit():
+        self.entries.append({"age": int(suffix), "time": path.stat().st_mtime, "base": None})
+    self.entries.sort(key=lambda e: e["age"])
+    self.next_age = self.entries[-1]["age"] + 1 if self.entries else 0
+    if self.entries:
+      self._save()
+
+  def _save(self) -> None:
+    data = {"version": 1, "next_age": self.next_age, "entries": self.entries}
+    _atomic_write(self.index_path, json.dumps(data, indent=1))
+
+  def full_path(self, age: int) -> Path:
+    return self.base_path.with_name(f"{self.base_path.name}.{age}")
+
+  def delta_path(self, age: int) -> Path:
+    return self.base_path.with_name(f"{self.base_path.name}.{age}.zdiff")
+
+  def image_path(self, age: int) -> Path:
+    return self.base_path.with_name(f"{self.base_path.name}.image.{age}")
+
+  def ages(self) -> List[int]:
+    return [entry["age"] for entry in self.entries]
+
+  def _decode(self, entry: dict, newer_lines: Optional[List[str]]) -> List[str]:
+    if entry["base"] is None:
+      return self.full_path(entry["age"]).read_text().splitlines(keepends=True)
+    ops = marshal.loads(zlib.decompress(self.delta_path(entry["age"]).read_bytes()))
+    return _apply_line_delta(newer_lines or [], ops)
+
+  def _write_delta(self, entry: dict, lines: List[str], base_age: int, base_lines: List[str]) -> None:
+    payload = zlib.compress(marshal.dumps(_line_delta(base_lines, lines)), 6)
+    _atomic_write(self.delta_path(entry["age"]), payload)
+    self.full_path(entry["age"]).unlink(missing_ok=True)
+    entry["base"] = base_age
+
+  def read(self, age: int) -> str:
+    """Reconstruct the backup text for `age`."""
+    newer: Optional[List[str]] = None
+    for entry in reversed(self.entries):
+      newer = self._decode(entry, newer)
+      if entry["age"] == age:
+        return "".join(newer)
+    raise KeyError(age)
+
+  def add(self, age: int, source: Path, policy: Optional[dict] = None, image: Optional[int] = None) -> Path:
+    """Record `source` as the newest backup, delta-encoding the previous newest.
+
+    The backup is a hard link to `source` where the filesystem allows it, so
+    the runtime file must afterwards be replaced rather than rewritten in place.
+    `image` is the age of the versioned image a binary-format `source` loads.
+    """
+    path = self.full_path(age)
+    path.unlink(missing_ok=True)
+    try:
+      os.link(source, path)
+    except OSError:
+      shutil.copyfile(source, path)
+    if self.entries and self.entries[-1]["base"] is None:
+      prev = self.entries[-1]
+      lines = path.read_text().splitlines(keepends=True)
+      self._write_delta(prev, self._decode(prev, None), age, lines)
+    entry = {"age": age, "time": time.time(), "base": None}
+    if image is not None:
+      entry["image"] = image
+    self.entries.append(entry)
+    self.next_age = max(self.next_age, age + 1)
+    if policy:
+      self.prune(**policy)
+    self._save()
+    return path
+
+  def retained(self, keep_last: Optional[int] = None, keep_hourly: int = 0, keep_daily: int = 0) -> set:
+    if keep_last is None:
+      return set(self.ages())
+    keep = {entry["age"] for entry in self.entries[-max(keep_last, 1):]}
+    for fmt, count in (("%Y-%m-%d %H", keep_hourly), ("%Y-%m-%d", keep_daily)):
+      buckets: Dict[str, int] = {}
+      for entry in reversed(self.entries):
+        bucket = time.strftime(fmt, time.localtime(entry["time"]))
+        if bucket not in buckets and len(buckets) < count:
+          buckets[bucket] = entry["age"]
+      keep.update(buckets.values())
+    return keep
+
+  def prune(self, keep_last: Optional[int] = None, keep_hourly: int = 0, keep_daily: int = 0) -> List[int]:
+    """Drop ages outside the retention policy, re-basing surviving deltas."""
+    keep = self.retained(keep_last, keep_hourly, keep_daily)
+    if len(keep) == len(self.entries):
+      return []
+    removed: List[int] = []
+    images: set = set()
+    survivors: List[dict] = []
+    newer: Optional[List[str]] = None
+    kept_lines: Optional[List[str]] = None
+    kept_age: Optional[int] = None
+    for entry in reversed(self.entries):
+      lines = self._decode(entry, newer)
+      newer = lines
+      if entry["age"] not in keep:
+        self.full_path(entry["age"]).unlink(missing_ok=True)
+        self.delta_path(entry["age"]).unlink(missing_ok=True)
+        removed.append(entry["age"])
+        if entry.get("image") is not None:
+          images.add(entry["image"])
+        continue
+      if entry["base"] is not None and entry["base"] != kept_age:
+        self._write_delta(entry, lines, kept_age, kept_lines or [])
+      survivors.append(entry)
+      kept_lines, kept_age = lines, entry["age"]
+    self.entries = list(reversed(survivors))
+    for image in images - {entry.get("image") for entry in survivors}:
+      self.image_path(image).unlink(missing_ok=True)
+    self._save()
+    return removed
+
+
 class BootObject(ProtoObject):
+  _is_boot = True
+  # Nesting depth of loading(); nonzero while an image, delta or journal loads.
+  _loading = 0
   def __init__(self):
     super().__init__("BootObject", self)
     if "boot" in self.__dict__:
       del self.__dict__["boot"]
+    # Guards the registry and every slot table: mutations take the write
+    # side, so readers on other threads never see a half-applied change.
+    self.lock = RWLock()
+    # Slot-level change tracking for delta snapshots: object -> touched slot
+    # names, plus the serial -> object map as of the last persisted state.
+    self._dirty: Dict[ProtoObject, set] = {}
+    self._persisted: Dict[int, ProtoObject] = {}
+    self._delta_count: int = 0
+    self._journal = None
+    # Callables fed every change record (see ReplicaPool); they turn on
+    # slot-level recording just as an open journal does.
+    self._record_sinks: List[Callable[[dict], None]] = []
+    self._serial_high: int = 0
+    # Event-loop integration: the running REPL loop, its live tasks and
+    # periodic jobs registered before the loop started.
+    self._loop: Optional[asyncio.AbstractEventLoop] = None
+    self._tasks: set = set()
+    self._periodic: List[Tuple[float, Callable, str]] = []
+    # Objects whose startup hook was deferred (--fast) until first lookup,
+    # and the per-thread flag that keeps their writes out of the journal.
+    self._pending_startup: Dict[int, ProtoObject] = {}
+    self._starting = threading.local()
+    # Save bookkeeping: changes since the last save, captured deltas waiting
+    # to be written in order, and the locks for writing them and the journal.
+    self._changes = 0
+    self._saved_at = time.monotonic()
+    self._unsaved: List[tuple] = []
+    self._save_lock = threading.Lock()
+    self._journal_lock = threading.Lock()
+    # Bytes trimmed off the journal's head since it was last reset.
+    self._journal_shift = 0
+    self._last_save_bytes = 0
+    self._autosaver: Optional["AutoSaver"] = None
+    # Set in a forked read replica, which must never touch the image files.
+    self._replica = False
     self.serial = 0
     self.objects: Dict[str, ProtoObject] = {}
-    self.oblist: List[ProtoObject] = []
+    self.oblist = []
     self.age: int = 0
     self.bootObj = self
     self._reset_registry()
     self._ensure_boot_slots()
 
+  def _plain_attr(self, key: str) -> bool:
+    # The registry attributes (objects, oblist, age...) shadow boot slots of
+    # the same name and are plain instance state, not slot writes.
+    return key in self.__dict__ or hasattr(type(self), key)
+
+  @contextmanager
+  def loading(self):
+    """Load an image: METHOD slots added meanwhile compile on first call."""
+    self._loading += 1
+    try:
+      yield
+    finally:
+      self._loading -= 1
+
   def _reset_registry(self) -> None:
+    self._index = None
+    self._mapped = None
     self.objects = {}
     self.oblist = []
     self.slots = {}
+    _invalidate_lookups()
     self.register(self)
 
   def _ensure_boot_slots(self) -> None:
@@ -303,49 +1441,325 @@ class BootObject(ProtoObject):
       self.jadd_slot("bootObj", FIELD, "boot", self)
     if "tagline" not in self.slots:
       self.jadd_slot("tagline", METHOD, "lambda self: 'Boot object'", None)
+    if "snapshot_compact_every" not in self.slots:
+      self.jadd_slot("snapshot_compact_every", FIELD, "20", 20)
+    if "snapshot_format" not in self.slots:
+      self.jadd_slot("snapshot_format", FIELD, repr("source"), "source")
+    if "snapshot_keep_last" not in self.slots:
+      self.jadd_slot("snapshot_keep_last", FIELD, "20", 20)
+    if "snapshot_keep_hourly" not in self.slots:
+      self.jadd_slot("snapshot_keep_hourly", FIELD, "24", 24)
+    if "snapshot_keep_daily" not in self.slots:
+      self.jadd_slot("snapshot_keep_daily", FIELD, "30", 30)
+    if "gc_roots" not in self.slots:
+      self.jadd_slot("gc_roots", FIELD, repr(GC_ROOTS), list(GC_ROOTS))
+    if "autosave_changes" not in self.slots:
+      self.jadd_slot("autosave_changes", FIELD, "0", 0)
+    if "autosave_seconds" not in self.slots:
+      self.jadd_slot("autosave_seconds", FIELD, "0", 0)
+    if "autosave_quiet" not in self.slots:
+      self.jadd_slot("autosave_quiet", FIELD, "1.0", 1.0)
+
+  @property
+  def oblist(self) -> List[ProtoObject]:
+    """Registered objects in registration order; change it via register/unregister."""
+    cached = self.__dict__.get("_oblist")
+    if cached is None:
+      with self.lock.read():
+        cached = self.__dict__["_oblist"] = list(self._members.values())
+    return cached
+
+  @oblist.setter
+  def oblist(self, objs: Iterable[ProtoObject]) -> None:
+    # Identity-keyed, insertion-ordered membership plus a serial index, so
+    # register, unregister and sersearch never scan the object list.
+    members = {id(obj): obj for obj in objs}
+    self.__dict__["_members"] = members
+    self.__dict__["_by_serial"] = {obj.serial: obj for obj in members.values()}
+    self.__dict__["_oblist"] = None
 
   def register(self, obj: ProtoObject) -> None:
-    self.objects[obj.name] = obj
-    if obj not in self.oblist:
-      self.oblist.append(obj)
+    with self.lock.write():
+      self.objects[obj.name] = obj
+      if id(obj) not in self._members:
+        self._members[id(obj)] = obj
+        self._by_serial[obj.serial] = obj
+        self._oblist = None
+        self._changes += 1
+        if self.__dict__.get("_index") is not None:
+          self._index.add_object(obj)
+        if self._recording():
+          if obj.serial < 0:
+            self._serial_high += 1
+            obj.serial = self._serial_high
+          self._journal_append({"op": "new", "serial": obj.serial, "name": obj.name})
+
+  def unregister(self, obj: ProtoObject) -> None:
+    with self.lock.write():
+      if obj is self or self._members.pop(id(obj), None) is None:
+        return
+      self._pending_startup.pop(id(obj), None)
+      if self._index is not None:
+        self._index.remove_object(obj)
+      self._oblist = None
+      self._changes += 1
+      if self._by_serial.get(obj.serial) is obj:
+        del self._by_serial[obj.serial]
+      if self.objects.get(obj.name) is obj:
+        del self.objects[obj.name]
+      self._journal_append({"op": "drop", "serial": obj.serial})
+
+  def clear_dirty(self) -> None:
+    """Treat the current image as persisted; later deltas diff against it."""
+    self._dirty = {}
+    self._persisted = {obj.serial: obj for obj in self.oblist}
+    self._changes = 0
+    self._saved_at = time.monotonic()
 
   def objsearch(self, name: str) -> Optional[ProtoObject]:
-    return self.objects.get(name)
+    obj = self.objects.get(name)
+    if self._pending_startup and obj is not None:
+      self._start_pending(obj)
+    return obj
 
   def sersearch(self, serial: int) -> Optional[ProtoObject]:
+    obj = self._by_serial.get(serial)
+    if self._pending_startup and obj is not None:
+      self._start_pending(obj)
+    return obj
+
+  def slot_index(self) -> SlotIndex:
+    """The slot name/source index, built on first use and maintained after that."""
+    if self.__dict__.get("_index") is None:
+      self._index = SlotIndex(self)
+    return self._index
+
+  def compile_methods(self) -> List[tuple]:
+    """Compile every pending METHOD slot; returns (object, slot, error) failures."""
+    failures: List[tuple] = []
     for obj in self.oblist:
-      if obj.serial == serial:
-        return obj
-    return None
+      for slot in list(obj.slots.values()):
+        if slot.kind != METHOD or slot.value is not None:
+          continue
+        try:
+          slot.method()
+        except Exception as exc:
+          failures.append((obj.name, slot.name, exc))
+    return failures
 
   def prototypes(self) -> List[ProtoObject]:
-    return [obj for obj in self.oblist if obj is not self]
+    with self.lock.read():
+      return [obj for obj in self.oblist if obj is not self]
 
   def fresh(self, name: str, tagline: Optional[str] = None) -> ProtoObject:
-    obj = ProtoObject(name, self)
-    obj.jadd_slot("i_am_a", FIELD, repr(name), name)
-    obj.jadd_slot("serial_number", FIELD, repr(obj.serial), obj.serial)
-    if tagline:
-      obj.jadd_slot("tagline", METHOD, f"lambda self: {repr(tagline)}", None)
-    self.register(obj)
-    return obj
-
-  def startup_all(self) -> None:
+    with self.lock.write():
+      obj = ProtoObject(name, self)
+      self.register(obj)
+      obj.jadd_slot("i_am_a", FIELD, repr(name), name)
+      obj.jadd_slot("serial_number", FIELD, repr(obj.serial), obj.serial)
+      if tagline:
+        obj.jadd_slot("tagline", METHOD, f"lambda self: {repr(tagline)}", None)
+      return obj
+
+  def clone(self, source: ProtoObject, name: Optional[str] = None) -> ProtoObject:
+    """Register a new object sharing `source`'s slots until either side writes one."""
+    with self.lock.write():
+      obj = ProtoObject(name or f"Clone of {source.name}", self)
+      self.register(obj)
+      obj._share_slots(source)
+      if self.__dict__.get("_index") is not None:
+        self._index.add_object(obj)
+      self._journal_append({"op": "clone", "obj": obj.serial, "source": source.serial})
+      if "i_am_a" not in obj.slots:
+        obj.jadd_slot("i_am_a", FIELD, repr(obj.name), obj.name)
+      if "serial_number" not in obj.slots:
+        obj.jadd_slot("serial_number", FIELD, repr(obj.serial), obj.serial)
+      return obj
+
+  def _gc_roots(self, extra: Iterable[str] = ()) -> List[ProtoObject]:
+    roots: List[ProtoObject] = [self]
+    lobby = self.objects.get("Lobby")
+    if lobby is not None:
+      roots.append(lobby)
+    roots += [obj for obj in self.oblist if getattr(obj, "isApplication", None) == "yes"]
+    names = list(self.slots["gc_roots"].value or []) if "gc_roots" in self.slots else []
+    for name in names + list(extra):
+      obj = self.objects.get(name)
+      if obj is not None:
+        roots.append(obj)
+    return roots
+
+  def collect_garbage(
+    self, dry_run: bool = True, compact: bool = False, roots: Iterable[str] = ()
+  ) -> Dict[str, Any]:
+    """Mark objects reachable from the roots and sweep the rest.
+
+    Marking follows parent slots and ProtoObject-valued fields. Roots are the
+    BootObject, Lobby, objects with isApplication == 'yes', the `gc_roots`
+    slot and `roots`. Links to objects that are no longer registered are
+    reported and, unless dry_run, cleared. compact=True then writes a full
+    snapshot, which renumbers serials densely.
+    """
+    self._ensure_boot_slots()
+    # A dry run only reads, so it can share the lock with other readers.
+    with self.lock.read() if dry_run else self.lock.write():
+      live: Dict[int, ProtoObject] = {}
+      dangling: List[Tuple[ProtoObject, str, ProtoObject]] = []
+      stack = self._gc_roots(roots)
+      while stack:
+        obj = stack.pop()
+        if id(obj) in live:
+          continue
+        live[id(obj)] = obj
+        for name, slot in obj.slots.items():
+          target = slot.value
+          if not isinstance(target, ProtoObject):
+            continue
+          if not (_is_parent_slot(name, slot) or slot.kind == FIELD):
+            continue
+          if self._members.get(id(target)) is not target:
+            dangling.append((obj, name, target))
+          elif id(target) not in live:
+            stack.append(target)
+      garbage = [obj for obj in self.oblist if id(obj) not in live]
+      report = {
+        "roots": [obj.name for obj in self._gc_roots(roots)],
+        "live": len(live),
+        "garbage": [(obj.serial, obj.name) for obj in garbage],
+        "dangling": [(obj.name, name, target.name) for obj, name, target in dangling],
+        "dry_run": dry_run,
+      }
+      if dry_run:
+        return report
+      for obj in garbage:
+        self.unregister(obj)
+      for obj, name, _ in dangling:
+        obj._own_slot(name).value = None
+        obj._mark_dirty(name)
+      _invalidate_lookups()
+      if compact:
+        self.snapshot(full=True)
+      return report
+
+  def startup_all(self, defer: bool = False) -> None:
+    """Run every object's startup hook, or with defer=True each one on first lookup."""
+    if defer:
+      self._pending_startup = dict(self._members)
+      return
     for obj in list(self.oblist):
-      fn = getattr(obj, "startup", None)
-      if callable(fn):
-        try:
-          fn()
-        except Exception as exc:
-          print(f"startup failed on {obj.name}: {exc}")
+      self._pending_startup.pop(id(obj), None)
+      self._start(obj)
 
-  def boot(self) -> None:
+  def _start(self, obj: ProtoObject) -> None:
+    fn = getattr(obj, "startup", None)
+    if callable(fn):
+      try:
+        self._settle(fn())
+      except Exception as exc:
+        print(f"startup failed on {obj.name}: {exc}")
+
+  def start_deferred(self) -> None:
+    """Run the startup hooks still deferred by startup_all(defer=True)."""
+    for obj in list(self._pending_startup.values()):
+      self._start_pending(obj)
+
+  def _start_pending(self, obj: ProtoObject) -> None:
+    if self._pending_startup.pop(id(obj), None) is not None:
+      # Like startup_all() before the journal opens: hooks redo these writes
+      # on every start, so they are not journaled.
+      outer = getattr(self._starting, "active", False)
+      self._starting.active = True
+      try:
+        self._start(obj)
+      finally:
+        self._starting.active = outer
+
+  def _loop_running(self) -> bool:
+    try:
+      return asyncio.get_running_loop() is self._loop
+    except RuntimeError:
+      return False
+
+  def _settle(self, result: Any) -> Any:
+    """Resolve an awaitable result: a task on the REPL loop, else run to completion.
+
+    Futures and tasks (from spawn or every, say) are already scheduled and
+    come back unchanged.
+    """
+    if not inspect.isawaitable(result) or asyncio.isfuture(result):
+      return result
+    if self._loop_running():
+      return self.spawn(result)
+
+    async def wait():
+      return await result
+    return asyncio.run(wait())
+
+  def spawn(self, awaitable: Awaitable, name: Optional[str] = None) -> "asyncio.Task":
+    """Schedule a coroutine on the REPL loop; failures are printed, not raised.
+
+    A future or task passed in is already scheduled and is returned as is.
+    """
+    if asyncio.isfuture(awaitable):
+      return awaitable
+    if asyncio.iscoroutine(awaitable):
+      task = self._loop.create_task(awaitable, name=name)
+    else:
+      task = asyncio.ensure_future(awaitable, loop=self._loop)
+      if name:
+        task.set_name(name)
+    self._tasks.add(task)
+
+    def done(t: "asyncio.Task") -> None:
+      self._tasks.discard(t)
+      if not t.cancelled() and t.exception() is not None:
+        print(f"task {t.get_name()} failed: {t.exception()}")
+    task.add_done_callback(done)
+    return task
+
+  def every(self, seconds: float, fn: Callable, name: Optional[str] = None) -> Optional["asyncio.Task"]:
+    """Call fn (sync or async) every `seconds` on the REPL loop.
+
+    Safe to call from startup hooks: before the loop starts the job is queued.
+    e.g. `self.boot.every(300, self.boot.snapshot, "autosnapshot")`
+    """
+    name = name or getattr(fn, "__name__", "periodic")
+    if not self._loop_running():
+      self._periodic.append((seconds, fn, name))
+      return None
+    return self.spawn(self._run_every(seconds, fn, name), name)
+
+  async def _run_every(self, seconds: float, fn: Callable, name: str) -> None:
+    while True:
+      await asyncio.sleep(seconds)
+      try:
+        result = fn()
+        if inspect.isawaitable(result):
+          await result
+      except Exception as exc:
+        print(f"{name} failed: {exc}")
+
+  def _start_periodic(self) -> None:
+    pending, self._periodic = self._periodic, []
+    for seconds, fn, name in pending:
+      self.every(seconds, fn, name)
+
+  async def _cancel_tasks(self) -> None:
+    tasks = list(self._tasks)
+    for task in tasks:
+      task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+  def _run_lobby(self) -> None:
     lobby = self.objsearch("Lobby")
     if lobby and hasattr(lobby, "go"):
       try:
-        lobby.go()
+        self._settle(lobby.go())
       except Exception as exc:
         print(f"Lobby failed: {exc}")
+
+  def boot(self) -> None:
+    self._run_lobby()
     kb = self.objsearch("Keyboard_input_object")
     if kb and hasattr(kb, "get_input"):
       kb.get_input()
@@ -353,18 +1767,20 @@ class BootObject(ProtoObject):
     keyboard_loop(self)
 
   def run_command(self, command: str) -> Optional[str]:
+    """Run one command under the write lock, or the read lock if the caller holds it."""
     cmd = command.strip()
     if not cmd:
       return None
     if cmd == "exit":
       return "EXIT"
-    if cmd == "snapshot":
-      self.snapshot()
-      return None
-    executor = self.objects.get("Command_executor")
-    if executor:
-      result = executor.execute(cmd)
-      return "EXIT" if result == "EXIT" else result
+    with self._command_guard():
+      if cmd == "snapshot":
+        self.snapshot()
+        return None
+      executor = self.objects.get("Command_executor")
+      if executor:
+        result = self._settle(executor.execute(cmd))
+        return "EXIT" if result == "EXIT" else result
     return None
 
   def run_commands(self, commands: Iterable[str]) -> None:
@@ -375,38 +1791,52 @@ class BootObject(ProtoObject):
       if result is not None:
         print(result)
 
+  def _command_guard(self) -> _Held:
+    """The lock side a command runs under: the read side if the caller holds it, else the write side."""
+    return self.lock.read() if self.lock.reading() else self.lock.write()
+
+  def run_script(self, source: str, filename: str = "<script>") -> bool:
+    """Compile a whole script once and run it as one command; returns True if it hit `exit`.
+
+    Statements consisting only of `snapshot` or `exit` keep their command meaning.
+    """
+    tree = ast.fix_missing_locations(_ScriptCommands().visit(ast.parse(source, filename)))
+    code = compile(tree, filename, "exec")
+    env = _eval_namespace(self, self.objects.get("Command_executor"))
+    with self._command_guard():
+      try:
+        exec(code, env)
+      except ScriptExit:
+        return True
+    return False
+
   def _base_filename(self) -> str:
-    match = re.match(r"^(?P<base>.+\\.py)(?:\\.\\d+)?$", FILEPATH.name)
+    match = re.match(r"^(?P<base>.+\.py)(?:\.\d+)?$", FILEPATH.name)
     return match.group("base") if match else FILEPATH.name
 
+  def history(self) -> SnapshotHistory:
+    history = self.__dict__.get("_history")
+    if history is None:
+      history = SnapshotHistory(FILEPATH.with_name(self._base_filename()))
+      self.__dict__["_history"] = history
+    return history
+
+  def _retention_policy(self) -> dict:
+    return {
+      "keep_last": self.slots["snapshot_keep_last"].value,
+      "keep_hourly": self.slots["snapshot_keep_hourly"].value or 0,
+      "keep_daily": self.slots["snapshot_keep_daily"].value or 0,
+    }
+
   def _next_snapshot_number(self) -> int:
-    base = self._base_filename()
-    prefix = base + "."
-    max_num = -1
-    for path in FILEPATH.parent.iterdir():
-      name = path.name
-      if not name.startswith(prefix):
-        continue
-      suffix = name[len(prefix):]
-      if suffix.isdigit():
-        max_num = max(max_num, int(suffix))
-    return max_num + 1
+    return max(self.history().next_age, self.age + 1)
 
   def _snapshot_path(self, age: int) -> Path:
     base = self._base_filename()
     return FILEPATH.with_name(f"{base}.{age}")
 
-  def _runtime_text(self) -> str:
-    return FILEPATH.read_text()
-
-  def _runtime_prefix(self) -> str:
-    text = self._runtime_text()
-    marker_line = "\n" + SNAPSHOT_MARKER
-    if marker_line in text:
-      return text.split(marker_line, 1)[0].rstrip() + "\n\n"
-    if SNAPSHOT_MARKER in text:
-      return text.split(SNAPSHOT_MARKER, 1)[0].rstrip() + "\n\n"
-    return text.rstrip() + "\n\n"
+  def _runtime_prefix(self) -> bytes:
+    return load_runtime_prefix()
 
   def _literal_for_field(self, name: str, value: Any) -> str:
     if name == "objects":
@@ -415,13 +1845,457 @@ class BootObject(ProtoObject):
       return "[]"
     if name.startswith("widget_"):
       return "None"
-    return repr(value)
+    literal = repr(value)
+    if value is None or type(value) in (str, int, bool):
+      return literal
+    # Anything else must read back as the same literal, or it would make
+    # the journal, delta or snapshot that holds it unloadable.
+    try:
+      ast.literal_eval(literal)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+      if literal != "set()":
+        print(f"Warning: {name} = {literal[:60]} has no literal form; it is saved as None")
+        return "None"
+    return literal
 
   def _slot_source(self, slot: Slot) -> str:
+    if slot.name.startswith("widget_"):
+      return "None"
     if slot.source is None:
       return repr(slot.value)
     return slot.source
 
+  def _delta_path(self) -> Path:
+    return FILEPATH.with_name(f"{self._base_filename()}.delta")
+
+  def _slot_line(self, var_name: str, slot_name: str, slot: Slot) -> str:
+    if slot.kind == METHOD:
+      return f"{var_name}.jadd_slot({repr(slot_name)}, METHOD, {repr(slot.source)}, None)"
+    source = self._slot_source(slot)
+    if slot.kind == PARENT:
+      return f"{var_name}.jadd_slot({repr(slot_name)}, PARENT, {repr(source)}, None)"
+    value = None if isinstance(slot.value, ProtoObject) else slot.value
+    literal = self._literal_for_field(slot_name, value)
+    return f"{var_name}.jadd_slot({repr(slot_name)}, FIELD, {repr(source)}, {literal})"
+
+  def _link_lines(self, obj: ProtoObject, slot_names: Iterable[str]) -> List[str]:
+    lines: List[str] = []
+    for slot_name in slot_names:
+      slot = obj.slots.get(slot_name)
+      if slot is None or not isinstance(slot.value, ProtoObject):
+        continue
+      fn = "object_link" if _is_parent_slot(slot_name, slot) else "field_link"
+      lines.append(f"{fn}(obj_by_serial, {obj.serial}, {repr(slot_name)}, {slot.value.serial})")
+    return lines
+
+  def _render_delta_segment(
+    self,
+    created: List[ProtoObject],
+    changed: List[tuple],
+    removed: List[ProtoObject],
+  ) -> str:
+    lines: List[str] = [f"{DELTA_MARKER} base {self.age}"]
+    lines.append("obj_by_serial = {o.serial: o for o in boot.oblist}")
+    for obj in created:
+      lines.append(f"o{obj.serial} = boot.fresh({repr(obj.name)})")
+      lines.append(f"o{obj.serial}.serial = {obj.serial}")
+      lines.append(f"obj_by_serial[{obj.serial}] = o{obj.serial}")
+    for obj, names in changed:
+      var_name = "boot" if obj is self else f"obj_by_serial[{obj.serial}]"
+      for slot_name in sorted(names):
+        slot = obj.slots.get(slot_name)
+        if slot is None:
+          lines.append(f"{var_name}.delete_slot({repr(slot_name)})")
+        else:
+          lines.append(self._slot_line(var_name, slot_name, slot))
+    for obj in removed:
+      lines.append(f"boot.unregister(obj_by_serial[{obj.serial}])")
+    for obj, names in changed:
+      lines.extend(self._link_lines(obj, names))
+    lines.append(DELTA_END)
+    lines.append("")
+    return "\n".join(lines)
+
+  def apply_deltas(self, path: Optional[Path] = None) -> int:
+    """Replay delta segments written since the last full snapshot.
+
+    Segments recorded against another age (left over from a snapshot that
+    crashed before cleaning up) and a torn trailing segment are skipped.
+    """
+    path = path or self._delta_path()
+    try:
+      text = path.read_text()
+    except FileNotFoundError:
+      text = ""
+    env = dict(globals())
+    env["boot"] = self
+    count = 0
+    with self.loading():
+      for segment in text.split(DELTA_MARKER)[1:]:
+        header, _, body = segment.partition("\n")
+        if header.strip() != f"base {self.age}":
+          continue
+        if DELTA_END not in body:
+          print(f"Ignoring incomplete delta segment {count} in {path}")
+          break
+        # Statements run one at a time so a bad one costs only itself.
+        try:
+          statements = [ast.Module([stmt], []) for stmt in ast.parse(body, str(path)).body]
+        except SyntaxError:
+          statements = [line for line in body.splitlines() if line.strip() and line != DELTA_END]
+        for statement in statements:
+          try:
+            exec(compile(statement, str(path), "exec"), env)
+          except Exception as exc:
+            print(f"Skipping delta statement in segment {count} of {path}: {type(exc).__name__}: {exc}")
+        count += 1
+    self._delta_count = count
+    self.clear_dirty()
+    return count
+
+  def _journal_path(self) -> Path:
+    return FILEPATH.with_name(f"{self._base_filename()}.journal")
+
+  def _check_writer(self, action: str) -> None:
+    if self._replica:
+      raise RuntimeError(f"{action} is not allowed in a read replica")
+
+  def open_journal(self) -> None:
+    """Start logging slot mutations, one JSON line each, until the next snapshot."""
+    self._check_writer("opening the journal")
+    path = self._journal_path()
+    serials = [obj.serial for obj in self.oblist] + list(self._persisted)
+    self._serial_high = max(serials + [0])
+    self._journal = _JournalFile(path, self.age)
+
+  def close_journal(self) -> None:
+    handle = self.__dict__.get("_journal")
+    if handle is not None:
+      handle.close()
+      self._journal = None
+
+  def _reset_journal(self) -> None:
+    self._check_writer("resetting the journal")
+    path = self._journal_path()
+    was_open = self.__dict__.get("_journal") is not None
+    self.close_journal()
+    with self._journal_lock:
+      if path.exists():
+        _atomic_write(path, json.dumps({"op": "base", "age": self.age}) + "\n")
+      self._journal_shift = 0
+    if was_open:
+      self.open_journal()
+
+  def _journal_mark(self) -> Optional[int]:
+    """Where the journal ends now, stable across later trims; None if it is closed."""
+    with self._journal_lock:
+      handle = self.__dict__.get("_journal")
+      return None if handle is None else handle.tell() + self._journal_shift
+
+  def _trim_journal(self, mark: Optional[int]) -> None:
+    """Drop the records logged before `mark`, which a written delta now holds."""
+    self._check_writer("trimming the journal")
+    if mark is None:
+      if self.__dict__.get("_journal") is None:
+        self._reset_journal()
+      return
+    with self._journal_lock:
+      handle = self.__dict__.get("_journal")
+      if handle is None or not handle.exists():
+        return
+      handle.flush()
+      path = self._journal_path()
+      data = path.read_bytes()
+      header = data.index(b"\n") + 1
+      cut = max(mark - self._journal_shift, header)
+      handle.close()
+      _atomic_write(path, data[:header] + data[cut:])
+      self._journal_shift += cut - header
+      self._journal = _JournalFile(path, self.age)
+
+  def _recording(self) -> bool:
+    return self.__dict__.get("_journal") is not None or bool(self.__dict__.get("_record_sinks"))
+
+  def _journal_append(self, record: dict) -> None:
+    for sink in self.__dict__.get("_record_sinks", ()):
+      sink(record)
+    if self.__dict__.get("_journal") is None or getattr(self._starting, "active", False):
+      return
+    line = json.dumps(record) + "\n"
+    # A delta being written on another thread may swap the handle (_trim_journal).
+    with self._journal_lock:
+      handle = self.__dict__.get("_journal")
+      if handle is None:
+        return
+      handle.append(line)
+
+  def _journal_slot(self, obj: ProtoObject, name: str) -> None:
+    slot = obj.slots.get(name)
+    if slot is None:
+      self._journal_append({"op": "del", "obj": obj.serial, "name": name})
+      return
+    record = {"op": "slot", "obj": obj.serial, "name": name, "kind": slot.kind, "source": slot.source}
+    if isinstance(slot.value, ProtoObject):
+      record["link"] = slot.value.serial
+    elif slot.kind == FIELD:
+      record["value"] = self._literal_for_field(name, slot.value)
+    self._journal_append(record)
+
+  def replay_journal(self, path: Optional[Path] = None) -> int:
+    """Re-apply journaled mutations made after the last snapshot; returns records applied."""
+    path = path or self._journal_path()
+    try:
+      lines = path.read_text().splitlines()
+    except FileNotFoundError:
+      return 0
+    by_serial = {obj.serial: obj for obj in self.oblist}
+    count = 0
+    with self.loading():
+      for number, line in enumerate(lines, 1):
+        try:
+          record = json.loads(line)
+        except ValueError:
+          break
+        if record.get("op") == "base":
+          if record.get("age") != self.age:
+            return 0
+          continue
+        try:
+          count += self.apply_record(record, by_serial)
+        except Exception as exc:
+          print(f"Skipping journal record {number} ({record.get('op')}) in {path}: {type(exc).__name__}: {exc}")
+    return count
+
+  def apply_record(self, record: dict, by_serial: Dict[int, ProtoObject]) -> bool:
+    """Apply one journal/change record; by_serial is kept in step. False if it did not apply."""
+    op = record.get("op")
+    if op == "new":
+      if record["serial"] not in by_serial:
+        obj = ProtoObject(record["name"], self)
+        obj.serial = record["serial"]
+        self.register(obj)
+        by_serial[obj.serial] = obj
+      return True
+    if op == "drop":
+      obj = by_serial.pop(record["serial"], None)
+      if obj is not None:
+        self.unregister(obj)
+      return True
+    if op == "renumber":
+      self._renumber(dict(record["serials"]))
+      by_serial.clear()
+      by_serial.update(self._by_serial)
+      self.age = record["age"]
+      if "age" in self.slots:
+        self._own_slot("age").value = self.age
+      return True
+    obj = by_serial.get(record.get("obj"))
+    if obj is None:
+      return False
+    if op == "del":
+      obj.delete_slot(record["name"])
+    elif op == "clone":
+      source = by_serial.get(record["source"])
+      if source is not None:
+        obj._share_slots(source)
+        if self._index is not None:
+          self._index.add_object(obj)
+    elif "link" in record:
+      obj.jadd_slot(record["name"], record["kind"], record["source"], by_serial.get(record["link"]))
+    else:
+      value = eval(record["value"], globals()) if "value" in record else None
+      obj.jadd_slot(record["name"], record["kind"], record["source"], value)
+    return True
+
+  def _image_path(self, age: Optional[int] = None) -> Path:
+    """The image cache beside the runtime, or the versioned image of snapshot `age`."""
+    if age is None:
+      return FILEPATH.with_name(f"{self._base_filename()}.image")
+    return self.history().image_path(age)
+
+  @staticmethod
+  def _runtime_stamp() -> Tuple[int, int]:
+    st = FILEPATH.stat()
+    return (st.st_size, st.st_mtime_ns)
+
+  def _link_tables(self) -> Tuple[List[tuple], List[tuple]]:
+    parent_links: List[tuple] = []
+    field_links: List[tuple] = []
+    for obj in self.oblist:
+      for slot_name, slot in obj.slots.items():
+        if not isinstance(slot.value, ProtoObject):
+          continue
+        if _is_parent_slot(slot_name, slot):
+          parent_links.append((obj.serial, slot_name, slot.value.serial))
+        elif slot.kind == FIELD:
+          field_links.append((obj.serial, slot_name, slot.value.serial))
+    return parent_links, field_links
+
+  def _field_payload(self, name: str, value: Any) -> tuple:
+    """Encode a FIELD value as (0, marshalable value) or (1, source literal)."""
+    if name == "objects":
+      return (0, {})
+    if name == "oblist":
+      return (0, [])
+    if name.startswith("widget_") or isinstance(value, ProtoObject):
+      return (0, None)
+    try:
+      marshal.dumps(value)
+    except ValueError:
+      return (1, self._literal_for_field(name, value))
+    return (0, value)
+
+  def _slot_records(self, obj: ProtoObject) -> List[tuple]:
+    slots = []
+    for slot_name, slot in obj.slots.items():
+      if slot.kind == FIELD:
+        slots.append((slot_name, FIELD, slot.source) + self._field_payload(slot_name, slot.value))
+      else:
+        slots.append((slot_name, slot.kind, slot.source, 0, None))
+    return slots
+
+  def write_image(self, path: Optional[Path] = None, age: Optional[int] = None) -> Path:
+    """Write the image as marshal data for load_image(); pairs with the current runtime file."""
+    self._check_writer("writing the image")
+    path = path or self._image_path()
+    parent_links, field_links = self._link_tables()
+    records = [(obj.serial, obj.name, obj is self, self._slot_records(obj)) for obj in self.oblist]
+    header = (IMAGE_VERSION, self._runtime_stamp(), self.age if age is None else age)
+    _atomic_write(path, marshal.dumps((header, records, parent_links, field_links)))
+    return path
+
+  def load_image(self, path: Optional[Path] = None, strict: bool = True, digest: Optional[str] = None) -> bool:
+    """Hydrate from a binary image in one pass; False if it is missing or stale.
+
+    With strict=False the image is trusted even if the runtime file changed,
+    which is how the stub hydrate() of a binary-format snapshot loads it; the
+    stub passes the sha256 digest of the image it wrote, and any other image
+    is refused.
+    """
+    path = path or self._image_path()
+    try:
+      data = path.read_bytes()
+      if digest is not None and hashlib.sha256(data).hexdigest() != digest:
+        return False
+      header, records, parent_links, field_links = marshal.loads(data)
+      version, stamp, age = header
+    except (OSError, EOFError, ValueError, TypeError):
+      return False
+    if version != IMAGE_VERSION or (strict and tuple(stamp) != self._runtime_stamp()):
+      return False
+    self.age = age
+    self._reset_registry()
+    self._ensure_boot_slots()
+    GLOBAL_ENV["boot"] = self
+    obj_by_serial: Dict[int, ProtoObject] = {}
+    env = globals()
+    for serial, name, is_boot, slots in records:
+      if is_boot:
+        obj = self
+      else:
+        obj = ProtoObject(name, self)
+        self.register(obj)
+      obj.serial = serial
+      obj_by_serial[serial] = obj
+      table = obj.slots
+      for slot_name, kind, source, tag, payload in slots:
+        value = eval(payload, env) if tag else payload
+        table[slot_name] = Slot(slot_name, kind, source, value)
+    _invalidate_lookups()
+    if not LAZY_METHODS:
+      self.compile_methods()
+    for child_serial, slot_name, parent_serial in parent_links:
+      object_link(obj_by_serial, child_serial, slot_name, parent_serial)
+    for child_serial, slot_name, target_serial in field_links:
+      field_link(obj_by_serial, child_serial, slot_name, target_serial)
+    self.bootObj = self
+    self.clear_dirty()
+    return True
+
+  def _mapped_image_path(self) -> Path:
+    return FILEPATH.with_name(f"{self._base_filename()}.mimage")
+
+  def write_mapped_image(self, path: Optional[Path] = None) -> Path:
+    """Write the image as one marshal record per object for open_mapped_image()."""
+    self._check_writer("writing the mapped image")
+    path = path or self._mapped_image_path()
+    records = []
+    for obj in self.oblist:
+      links = [
+        (slot_name, slot.value.serial)
+        for slot_name, slot in obj.slots.items()
+        if isinstance(slot.value, ProtoObject) and (_is_parent_slot(slot_name, slot) or slot.kind == FIELD)
+      ]
+      record = marshal.dumps((self._slot_records(obj), links))
+      records.append((obj.serial, obj.name, obj is self, record))
+    MappedImage.write(path, (IMAGE_VERSION, self._runtime_stamp(), self.age), records)
+    return path
+
+  def open_mapped_image(self, path: Optional[Path] = None, strict: bool = True) -> bool:
+    """Register every object from a mapped image, leaving their slots unread.
+
+    Each object's slot table is decoded on first touch; False if the image
+    is missing, unreadable or (with strict) stale.
+    """
+    path = path or self._mapped_image_path()
+    try:
+      mapped = MappedImage(path)
+      version, stamp, age = mapped.header
+    except (OSError, EOFError, ValueError, TypeError):
+      return False
+    if version != IMAGE_VERSION or (strict and tuple(stamp) != self._runtime_stamp()):
+      mapped.close()
+      return False
+    self.age = age
+    self._reset_registry()
+    self._ensure_boot_slots()
+    GLOBAL_ENV["boot"] = self
+    boot_span = None
+    for serial, name, is_boot, offset, length in mapped.entries:
+      if is_boot:
+        self.serial = serial
+        boot_span = (offset, length)
+        mapped.adopt(self, serial)
+      else:
+        obj = ProtoObject._unloaded(name, self, serial)
+        self.register(obj)
+        mapped.adopt(obj, serial, (offset, length))
+    if boot_span is not None:
+      self.slots.update(mapped.read(*boot_span))
+    if mapped.pending():
+      self._mapped = mapped
+    else:
+      mapped.close()
+    _invalidate_lookups()
+    self.bootObj = self
+    self.clear_dirty()
+    return True
+
+  def _render_image_stub(self, age: int, digest: str) -> str:
+    lines = [
+      SNAPSHOT_MARKER,
+      "def hydrate(boot: BootObject) -> None:",
+      f"  boot.age = {age}",
+      f"  image = boot._image_path({age})",
+      f"  if not boot.load_image(image, strict=False, digest={digest!r}):",
+      "    raise RuntimeError(f'binary image {image} is missing, unreadable or not the one this snapshot wrote')",
+      "",
+      "HYDRATE = hydrate",
+      "",
+      "if __name__ == '__main__':",
+      "  main()",
+      "",
+    ]
+    return "\n".join(lines)
+
+  def export_source(self, path: Optional[Path] = None) -> Path:
+    """Write the runtime with a full source hydrate() section, whatever snapshot_format says."""
+    path = path or FILEPATH.with_name(f"{self._base_filename()}.export")
+    parent_links, field_links = self._link_tables()
+    section = self._render_snapshot_section(self.age, parent_links, field_links)
+    _atomic_write(path, self._runtime_prefix() + section.encode("utf-8"))
+    return path
+
   def _render_snapshot_section(
     self,
     age: int,
@@ -446,25 +2320,13 @@ class BootObject(ProtoObject):
       lines.append(f"  obj_by_serial[{obj.serial}] = {var_name}")
       lines.append("  #Fields:")
       for slot_name in obj.slot_names(FIELD):
-        slot = obj.slots[slot_name]
-        literal = self._literal_for_field(slot_name, slot.value)
-        source = self._slot_source(slot)
-        lines.append(
-          f"  {var_name}.jadd_slot({repr(slot_name)}, FIELD, {repr(source)}, {literal})"
-        )
+        lines.append("  " + self._slot_line(var_name, slot_name, obj.slots[slot_name]))
       lines.append("  #Parents:")
       for slot_name in obj.slot_names(PARENT):
-        slot = obj.slots[slot_name]
-        source = self._slot_source(slot)
-        lines.append(
-          f"  {var_name}.jadd_slot({repr(slot_name)}, PARENT, {repr(source)}, None)"
-        )
+        lines.append("  " + self._slot_line(var_name, slot_name, obj.slots[slot_name]))
       lines.append("  #Methods:")
       for slot_name in obj.slot_names(METHOD):
-        slot = obj.slots[slot_name]
-        lines.append(
-          f"  {var_name}.jadd_slot({repr(slot_name)}, METHOD, {repr(slot.source)}, None)"
-        )
+        lines.append("  " + self._slot_line(var_name, slot_name, obj.slots[slot_name]))
       lines.append("")
     lines.append("  # Parent links")
     for child_serial, slot_name, parent_serial in parent_links:
@@ -477,6 +2339,7 @@ class BootObject(ProtoObject):
         f"  field_link(obj_by_serial, {child_serial}, {repr(slot_name)}, {target_serial})"
       )
     lines.append("  boot.bootObj = boot")
+    lines.append("  boot.clear_dirty()")
     lines.append("")
     lines.append("HYDRATE = hydrate")
     lines.append("")
@@ -485,54 +2348,170 @@ class BootObject(ProtoObject):
     lines.append("")
     return "\n".join(lines)
 
-  def snapshot(self) -> Path:
-    self._ensure_boot_slots()
-    for idx, obj in enumerate(self.oblist):
+  def _run_shutdowns(self) -> None:
+    for obj in self.oblist:
+      if id(obj) in self._pending_startup:
+        continue
       shutdown = getattr(obj, "shutdown", None)
       if callable(shutdown):
         try:
-          shutdown()
+          self._settle(shutdown())
         except Exception as exc:
           print(f"shutdown failed on {obj.name}: {exc}")
-      obj.serial = idx
-      if "serial_number" in obj.slots:
-        obj.slots["serial_number"].value = obj.serial
-
-    parent_links: List[tuple] = []
-    parent_restore: List[tuple] = []
-    field_links: List[tuple] = []
-    field_restore: List[tuple] = []
 
+  def start_autosave(self) -> "AutoSaver":
+    """Start the background autosaver (idempotent); the autosave_* slots configure it."""
+    if self._autosaver is None:
+      self._autosaver = AutoSaver(self).start()
+    return self._autosaver
+
+  def stop_autosave(self) -> None:
+    if self._autosaver is not None:
+      self._autosaver.stop()
+      self._autosaver = None
+
+  def autosave_stats(self) -> Dict[str, Any]:
+    if self._autosaver is not None:
+      return self._autosaver.stats()
+    return {"running": False, "pending_changes": self._changes, "unwritten_deltas": len(self._unsaved)}
+
+  def snapshot(self, full: Optional[bool] = None, hooks: bool = True) -> Path:
+    """Persist the image: append a delta of changed slots, or rewrite it whole.
+
+    By default a delta is written while fewer than `snapshot_compact_every`
+    deltas exist since the last full snapshot; full=True forces compaction.
+    A delta is captured under the write lock and written after releasing
+    it. hooks=False skips the shutdown hooks, as the autosaver does.
+    """
+    self._check_writer("snapshot")
+    with self.lock.write():
+      if full is None:
+        limit = self.slots["snapshot_compact_every"].value if "snapshot_compact_every" in self.slots else 0
+        full = not self._persisted or self._delta_count >= (limit or 0)
+      if full:
+        self._flush_saves()
+        return self._snapshot_full(hooks)
+      path = self._capture_delta(hooks)
+    self._flush_saves()
+    return path
+
+  def _capture_delta(self, hooks: bool = True) -> Path:
+    """Render the changes since the last save and queue them for _flush_saves()."""
+    self._ensure_boot_slots()
+    if hooks:
+      self._run_shutdowns()
+    live = {id(obj) for obj in self.oblist}
+    removed = [obj for obj in self._persisted.values() if id(obj) not in live]
+    created: List[ProtoObject] = []
+    next_serial = max(list(self._persisted) + [obj.serial for obj in self.oblist]) + 1
+    taken = {obj.serial for obj in self.oblist}
     for obj in self.oblist:
-      for slot_name, slot in obj.slots.items():
-        if slot.kind == PARENT or slot_name.endswith("*"):
-          target = slot.value
-          parent_serial = target.serial if isinstance(target, ProtoObject) else target
-          parent_links.append((obj.serial, slot_name, parent_serial))
-          parent_restore.append((obj, slot_name, target))
-          slot.value = None
-        elif slot.kind == FIELD and isinstance(slot.value, ProtoObject):
-          target = slot.value
-          field_links.append((obj.serial, slot_name, target.serial))
-          field_restore.append((obj, slot_name, target))
-          slot.value = None
+      if self._persisted.get(obj.serial) is obj:
+        continue
+      if obj.serial < 0 or obj.serial in self._persisted:
+        while next_serial in taken:
+          next_serial += 1
+        obj.serial = next_serial
+        taken.add(next_serial)
+        if "serial_number" in obj.slots:
+          obj._own_slot("serial_number").value = obj.serial
+      created.append(obj)
+    fresh = {id(obj) for obj in created}
+    changed = [(obj, set(obj.slots)) for obj in created]
+    changed += [
+      (obj, names) for obj, names in self._dirty.items() if id(obj) in live and id(obj) not in fresh
+    ]
+    path = self._delta_path()
+    if not (created or changed or removed):
+      self.clear_dirty()
+      print("Snapshot: no changes since last save")
+      return path
+    segment = self._render_delta_segment(created, changed, removed)
+    self._delta_count += 1
+    self._unsaved.append((path, segment, self._delta_count, self._journal_mark()))
+    self.clear_dirty()
+    return path
+
+  def _flush_saves(self) -> None:
+    """Write captured deltas in capture order; this needs only the save lock."""
+    self._check_writer("writing a delta")
+    with self._save_lock:
+      while self._unsaved:
+        path, segment, count, mark = self._unsaved[0]
+        with path.open("a") as handle:
+          handle.write(segment)
+          handle.flush()
+          os.fsync(handle.fileno())
+        self._trim_journal(mark)
+        del self._unsaved[0]
+        self._last_save_bytes = len(segment.encode("utf-8"))
+        print(f"Snapshot delta {count} appended to {path}")
+
+  @staticmethod
+  def _set_serial(obj: ProtoObject, serial: int) -> None:
+    obj.serial = serial
+    slot = obj.slots.get("serial_number")
+    if slot is not None and slot.value != serial:
+      obj._own_slot("serial_number").value = serial
+
+  def _renumber(self, serials: Dict[int, int]) -> None:
+    """Apply a full snapshot's renumbering (old -> new serial), as a replica does."""
+    for obj in self.oblist:
+      if obj.serial in serials:
+        self._set_serial(obj, serials[obj.serial])
+    self._by_serial = {obj.serial: obj for obj in self.oblist}
+
+  def _snapshot_full(self, hooks: bool = True) -> Path:
+    self._ensure_boot_slots()
+    if hooks:
+      self._run_shutdowns()
+    # Unjournaled objects may still share serial -1, so go by position here.
+    moved = [[obj.serial, idx] for idx, obj in enumerate(self.oblist) if obj.serial != idx]
+    for idx, obj in enumerate(self.oblist):
+      self._set_serial(obj, idx)
+    self._by_serial = {obj.serial: obj for obj in self.oblist}
+
+    # Link slots are rendered as None plus object_link/field_link lines, so
+    # the live slots are left untouched (clones may share them).
+    parent_links, field_links = self._link_tables()
 
     age = self._next_snapshot_number()
-    content = self._runtime_prefix() + self._render_snapshot_section(age, parent_links, field_links)
+    binary = self.slots["snapshot_format"].value == "binary"
+    if binary:
+      # Each binary snapshot keeps its own image, so its backups can roll back.
+      image = self.write_image(self._image_path(age), age)
+      section = self._render_image_stub(age, hashlib.sha256(image.read_bytes()).hexdigest())
+    else:
+      section = self._render_snapshot_section(age, parent_links, field_links)
+    content = self._runtime_prefix() + section.encode("utf-8")
 
-    backup_path = self._snapshot_path(age)
-    backup_path.write_text(self._runtime_text())
-    FILEPATH.write_text(content)
+    old_image = self.age if self._image_path(self.age).exists() else None
+    backup_path = self.history().add(age, FILEPATH, self._retention_policy(), image=old_image)
+    _atomic_write(FILEPATH, content)
+    self._last_save_bytes = len(content)
 
     self.age = age
     if "age" in self.slots:
-      self.slots["age"].value = age
-
-    for obj, slot_name, value in parent_restore:
-      obj.slots[slot_name].value = value
-    for obj, slot_name, value in field_restore:
-      obj.slots[slot_name].value = value
-
+      self._own_slot("age").value = age
+
+    if BINARY_IMAGE:
+      self.write_image()
+    if MAPPED_IMAGE:
+      self.write_mapped_image()
+    self._delta_path().unlink(missing_ok=True)
+    self._delta_count = 0
+    self.clear_dirty()
+    self._reset_journal()
+
+    for sink in self._record_sinks:
+      sink({"op": "renumber", "age": age, "serials": moved})
+
+    if METHOD_CACHE_ON_DISK:
+      # Code for sources no longer in the image would otherwise pile up on disk.
+      prune_method_cache(
+        slot.source for obj in self.oblist for slot in obj.slots.values() if slot.kind == METHOD and slot.source
+      )
+      save_method_cache()
     print(f"Snapshot saved to {FILEPATH} (age {age}); backup at {backup_path}")
     return FILEPATH
 
@@ -540,6 +2519,171 @@ class BootObject(ProtoObject):
 # Expose runtime classes to eval'ed methods.
 GLOBAL_ENV["ProtoObject"] = ProtoObject
 GLOBAL_ENV["BootObject"] = BootObject
+GLOBAL_ENV["FIELD"] = FIELD
+GLOBAL_ENV["METHOD"] = METHOD
+GLOBAL_ENV["PARENT"] = PARENT
+GLOBAL_ENV["ScriptExit"] = ScriptExit
+GLOBAL_ENV["_unlocked"] = _unlocked
+
+
+# --- Slot profiling -----------------------------------------------------------
+# Opt-in. While a profiler is installed, __getattr__ wraps each bound METHOD
+# it caches; installing or removing one flushes the lookup caches, so with no
+# profiler the dispatch path is exactly the unprofiled one.
+_PROFILER: Optional["SlotProfiler"] = None
+
+
+class _CallStats:
+  __slots__ = ("calls", "primitive", "self_time", "total_time", "exceptions", "callers")
+
+  def __init__(self) -> None:
+    self.calls = 0
+    self.primitive = 0
+    self.self_time = 0.0
+    self.total_time = 0.0
+    self.exceptions = 0
+    self.callers: Dict[tuple, list] = {}
+
+
+class SlotProfiler:
+  """Call counts, self/total time and exceptions per (object, slot).
+
+  Stats are keyed by object identity, so a renumbered or renamed object
+  keeps one row; reports label it with its name and serial at that time.
+  """
+
+  def __init__(self) -> None:
+    self.stats: Dict[tuple, _CallStats] = {}
+    self._owners: Dict[int, "weakref.ref"] = {}
+    self._lock = threading.Lock()
+    self._local = threading.local()
+
+  def wrap(self, obj: ProtoObject, name: str, fn: Callable) -> Callable:
+    key = (id(obj), name)
+    with self._lock:
+      owner = self._owners.get(key[0])
+      if owner is None or owner() is not obj:
+        # A new object at a collected one's address starts fresh rows.
+        self._forget(key[0])
+        self._owners[key[0]] = weakref.ref(obj)
+
+    def profiled(*args, **kwargs):
+      return self.call(key, fn, args, kwargs)
+    profiled.__wrapped__ = fn
+    return profiled
+
+  def _forget(self, ident: int) -> None:
+    for key in [key for key in self.stats if key[0] == ident]:
+      del self.stats[key]
+
+  def _label(self, key: tuple) -> tuple:
+    owner = self._owners.get(key[0])
+    obj = owner() if owner is not None else None
+    if obj is None:
+      return ("<collected>", -1, key[1])
+    return (obj.name, obj.serial, key[1])
+
+  def call(self, key: tuple, fn: Callable, args: tuple, kwargs: dict) -> Any:
+    local = self._local
+    stack = getattr(local, "stack", None)
+    if stack is None:
+      stack = local.stack = []
+      local.active = {}
+    active = local.active
+    caller = stack[-1][0] if stack else None
+    frame = [key, 0.0]
+    stack.append(frame)
+    active[key] = active.get(key, 0) + 1
+    failed = False
+    start = time.perf_counter()
+    try:
+      return fn(*args, **kwargs)
+    except BaseException:
+      failed = True
+      raise
+    finally:
+      elapsed = time.perf_counter() - start
+      stack.pop()
+      active[key] -= 1
+      outermost = not active[key]
+      if stack:
+        stack[-1][1] += elapsed
+      # Other threads profile the same slots; the call stacks are per thread.
+      with self._lock:
+        rec = self.stats.get(key)
+        if rec is None:
+          rec = self.stats[key] = _CallStats()
+        rec.calls += 1
+        rec.exceptions += failed
+        rec.self_time += elapsed - frame[1]
+        if outermost:
+          rec.primitive += 1
+          rec.total_time += elapsed
+        if caller is not None:
+          edge = rec.callers.setdefault(caller, [0, 0, 0.0, 0.0])
+          edge[0] += outermost
+          edge[1] += 1
+          edge[2] += elapsed - frame[1]
+          edge[3] += elapsed if outermost else 0.0
+
+  def reset(self) -> None:
+    with self._lock:
+      self.stats.clear()
+
+  def rows(self, sort: str = "total_time") -> List[Dict[str, Any]]:
+    with self._lock:
+      rows = [
+        dict(zip(("object", "serial", "slot"), self._label(key)), calls=rec.calls,
+             self_time=rec.self_time, total_time=rec.total_time, exceptions=rec.exceptions)
+        for key, rec in self.stats.items()
+      ]
+    rows.sort(key=lambda row: row[sort], reverse=True)
+    return rows
+
+  def pstats_dict(self) -> Dict[tuple, tuple]:
+    """The stats in pstats' raw form: (file, line, func) is (object, serial, slot)."""
+    with self._lock:
+      return {
+        self._label(key): (rec.primitive, rec.calls, rec.self_time, rec.total_time,
+                           {self._label(caller): tuple(edge) for caller, edge in rec.callers.items()})
+        for key, rec in self.stats.items()
+      }
+
+  def dump(self, path: Any) -> Path:
+    """Write JSON for a .json path, else a marshal file that pstats.Stats(path) reads."""
+    path = Path(path)
+    if path.suffix == ".json":
+      path.write_text(json.dumps(self.rows(), indent=2) + "\n")
+    else:
+      path.write_bytes(marshal.dumps(self.pstats_dict()))
+    return path
+
+
+def enable_profiling() -> SlotProfiler:
+  """Install a profiler (keeping the current one) and re-wrap methods on next lookup."""
+  global _PROFILER
+  if _PROFILER is None:
+    _PROFILER = SlotProfiler()
+    _invalidate_lookups()
+  return _PROFILER
+
+
+def disable_profiling() -> Optional[SlotProfiler]:
+  """Remove the profiler, returning it with its collected stats."""
+  global _PROFILER
+  profiler, _PROFILER = _PROFILER, None
+  if profiler is not None:
+    _invalidate_lookups()
+  return profiler
+
+
+def current_profiler() -> Optional[SlotProfiler]:
+  return _PROFILER
+
+
+GLOBAL_ENV["enable_profiling"] = enable_profiling
+GLOBAL_ENV["disable_profiling"] = disable_profiling
+GLOBAL_ENV["current_profiler"] = current_profiler
 
 
 def object_link(registry: Dict[int, ProtoObject], child_serial: int, slot_name: str, parent_serial: int) -> None:
@@ -548,7 +2692,8 @@ def object_link(registry: Dict[int, ProtoObject], child_serial: int, slot_name:
   if not child or not parent:
     return
   if slot_name in child.slots:
-    child.slots[slot_name].value = parent
+    child._own_slot(slot_name).value = parent
+    _invalidate_lookups()
   else:
     child.jadd_slot(slot_name, PARENT, repr(parent.name), parent)
 
@@ -559,11 +2704,212 @@ def field_link(registry: Dict[int, ProtoObject], child_serial: int, slot_name: s
   if not child or not target:
     return
   if slot_name in child.slots:
-    child.slots[slot_name].value = target
+    child._own_slot(slot_name).value = target
   else:
     child.jadd_slot(slot_name, FIELD, repr(target.name), target)
 
 
+# --- Command server ---------------------------------------------------------
+# Queries made only of calls to these methods run concurrently on the worker
+# pool under the read side of the image lock; anything else is a mutation and
+# runs on the single writer thread under the write side.
+READ_ONLY_CALLS = frozenset({
+  "objsearch", "sersearch", "display_object", "display_method", "display_objs",
+  "list_objects", "slot_names", "lookup_slot", "tagline", "find", "implementors", "senders", "autosave_stats",
+  "len", "repr", "str", "sorted", "list", "dict", "tuple", "getattr", "hasattr",
+})
+SERVER_WORKERS = 4
+# Console words handled by run_command itself rather than evaluated; they
+# write the image (or end the session), so they always go to the writer.
+PSEUDO_COMMANDS = frozenset({"snapshot", "exit"})
+
+
+def parse_serve_address(address: str, any_host: bool = False) -> Tuple[str, Any]:
+  """Split a --serve address into ("unix", path) or ("tcp", (host, port)).
+
+  Raises ValueError for a malformed port, a path held by something other than
+  a stale socket, or a non-loopback host unless any_host is set.
+  """
+  if address.startswith("unix:") or "/" in address:
+    path = address[5:] if address.startswith("unix:") else address
+    if not path:
+      raise ValueError(f"no socket path in {address!r}")
+    try:
+      mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+      return "unix", path
+    if not stat.S_ISSOCK(mode):
+      raise ValueError(f"{path} exists and is not a socket; refusing to replace it")
+    return "unix", path
+  host, _, port = address.rpartition(":")
+  host = host.strip("[]") or "127.0.0.1"
+  if not port.isdigit() or not 0 < int(port) < 65536:
+    raise ValueError(f"bad port in {address!r}; expected a socket path or [host:]port")
+  if not any_host:
+    try:
+      loopback = host == "localhost" or ipaddress.ip_address(host).is_loopback
+    except ValueError:
+      loopback = False
+    if not loopback:
+      raise ValueError(f"{host} is not a loopback address; pass --serve-any-host to listen on it")
+  return "tcp", (host, int(port))
+
+
+def is_read_only_command(command: str) -> bool:
+  """True for a single expression whose calls are all in READ_ONLY_CALLS."""
+  if command.strip() in PSEUDO_COMMANDS:
+    return False
+  try:
+    tree = ast.parse(command.strip(), mode="eval")
+  except SyntaxError:
+    return False
+  for node in ast.walk(tree):
+    if isinstance(node, (ast.NamedExpr, ast.Lambda, ast.Await, ast.Yield, ast.YieldFrom)):
+      return False
+    if isinstance(node, ast.Call):
+      func = node.func
+      name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+      if name not in READ_ONLY_CALLS:
+        return False
+  return True
+
+
+class _ThreadStdout(io.TextIOBase):
+  """sys.stdout stand-in that sends a thread's prints to its capture buffer, if any."""
+
+  def __init__(self, real) -> None:
+    self.real = real
+    self.local = threading.local()
+
+  def write(self, text: str) -> int:
+    buf = getattr(self.local, "buf", None)
+    return (buf if buf is not None else self.real).write(text)
+
+  def flush(self) -> None:
+    if getattr(self.local, "buf", None) is None:
+      self.real.flush()
+
+  def fileno(self) -> int:
+    return self.real.fileno()
+
+  def isatty(self) -> bool:
+    return self.real.isatty()
+
+  @contextmanager
+  def capture(self):
+    self.local.buf = io.StringIO()
+    try:
+      yield self.local.buf
+    finally:
+      self.local.buf = None
+
+
+def _command_reply(boot: BootObject, command: str) -> Dict[str, Any]:
+  """Run one command; reply with its result and what it printed, or the error."""
+  out = sys.stdout
+  try:
+    if isinstance(out, _ThreadStdout):
+      with out.capture() as buf:
+        result = boot.run_command(command)
+    else:
+      buf = io.StringIO()
+      with redirect_stdout(buf):
+        result = boot.run_command(command)
+  except Exception as exc:
+    return {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+  return {"ok": True, "result": None if result is None else str(result), "output": buf.getvalue()}
+
+
+class CommandServer:
+  """Serve newline-delimited commands against one image over a local socket.
+
+  Each reply is one JSON line: {"ok", "result", "output"} or {"ok": false, "error"}.
+  `exit` closes the connection; the server keeps running.
+  """
+
+  def __init__(
+    self,
+    boot: BootObject,
+    address: str,
+    workers: int = SERVER_WORKERS,
+    replicas: Optional["ReplicaPool"] = None,
+    any_host: bool = False,
+  ) -> None:
+    self.boot = boot
+    self.replicas = replicas
+    self.address = address
+    self.any_host = any_host
+    self.lock = boot.lock
+    self.readers = futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lo-read")
+    self.writer = futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="lo-write")
+    self.unix_path: Optional[str] = None
+    self.server = self._bind(address)
+
+  def _bind(self, address: str) -> "socketserver.BaseServer":
+    outer = self
+
+    class Handler(socketserver.StreamRequestHandler):
+      def handle(self) -> None:
+        for raw in self.rfile:
+          command = raw.decode("utf-8", "replace").strip()
+          if not command:
+            continue
+          reply = outer.submit(command).result()
+          self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+          self.wfile.flush()
+          if reply.get("result") == "EXIT":
+            break
+
+    family, where = parse_serve_address(address, self.any_host)
+    if family == "unix":
+      # parse_serve_address only lets an existing path through if it is a socket.
+      if os.path.lexists(where):
+        os.unlink(where)
+      self.unix_path = where
+      server = socketserver.ThreadingUnixStreamServer(where, Handler)
+    else:
+
+      class TCPServer(socketserver.ThreadingTCPServer):
+        allow_reuse_address = True
+
+      if ":" in where[0]:
+        TCPServer.address_family = socket.AF_INET6
+      server = TCPServer(where, Handler)
+    server.daemon_threads = True
+    return server
+
+  def submit(self, command: str):
+    if is_read_only_command(command):
+      if self.replicas is not None:
+        return self.readers.submit(self.replicas.run, command)
+      return self.readers.submit(self._run, command, self.lock.read)
+    return self.writer.submit(self._run, command, self.lock.write)
+
+  def _run(self, command: str, guard: Callable) -> Dict[str, Any]:
+    with guard():
+      return _command_reply(self.boot, command)
+
+  def serve_forever(self) -> None:
+    if not isinstance(sys.stdout, _ThreadStdout):
+      sys.stdout = _ThreadStdout(sys.stdout)
+    try:
+      self.server.serve_forever()
+    finally:
+      self.close()
+
+  def shutdown(self) -> None:
+    self.server.shutdown()
+
+  def close(self) -> None:
+    self.server.server_close()
+    self.readers.shutdown(wait=True)
+    self.writer.shutdown(wait=True)
+    if isinstance(sys.stdout, _ThreadStdout):
+      sys.stdout = sys.stdout.real
+    if self.unix_path and os.path.exists(self.unix_path):
+      os.unlink(self.unix_path)
+
+
 def keyboard_loop(boot: BootObject) -> None:
   while True:
     try:
@@ -579,22 +2925,467 @@ def keyboard_loop(boot: BootObject) -> None:
       print(result)
 
 
+class _Replica:
+  __slots__ = ("process", "conn", "applied")
+
+  def __init__(self, process: Any, conn: Any, applied: int) -> None:
+    self.process = process
+    self.conn = conn
+    self.applied = applied
+
+
+def _replica_main(boot: BootObject, conn: Any) -> None:
+  """Body of a forked replica: apply change records, answer read-only commands."""
+  boot._journal = None  # the writer owns the journal file
+  boot._replica = True
+  boot._autosaver = None  # its thread stayed behind in the writer
+  boot._loading = 1  # methods it receives were compiled by the writer
+  boot.lock = RWLock()  # the forking thread's hold on the parent's lock did not come along
+  boot._record_sinks = []
+  by_serial = {obj.serial: obj for obj in boot.oblist}
+  while True:
+    try:
+      message = conn.recv()
+    except EOFError:
+      break
+    if message[0] == "stop":
+      break
+    _, records, command = message
+    for record in records:
+      try:
+        boot.apply_record(record, by_serial)
+      except Exception as exc:
+        print(f"replica could not apply {record.get('op')}: {exc}", file=sys.stderr)
+    conn.send(_command_reply(boot, command))
+
+
+class ReplicaPool:
+  """Forked read replicas of one image; this process stays the only writer.
+
+  Replicas are forked once, by start(), after hydrate and share its memory
+  copy-on-write; start the pool before any other thread exists, since a fork
+  copies only the calling thread. Read-only commands (see
+  is_read_only_command) go to an idle replica, which is first sent the
+  change records logged since its previous command; any other command runs
+  here. A full snapshot's renumbering reaches the replicas as a record too.
+  """
+
+  def __init__(self, boot: BootObject, workers: Optional[int] = None) -> None:
+    self.boot = boot
+    self.size = workers or os.cpu_count() or 2
+    self._log: List[dict] = []
+    self._log_lock = threading.Lock()
+    self._idle: "queue.Queue[_Replica]" = queue.Queue()
+    self._replicas: List[_Replica] = []
+
+  def start(self) -> "ReplicaPool":
+    boot = self.boot
+    boot._serial_high = max([boot._serial_high] + [obj.serial for obj in boot.oblist])
+    boot._record_sinks.append(self._record)
+    self._spawn()
+    return self
+
+  def _spawn(self) -> None:
+    context = multiprocessing.get_context("fork")
+    for _ in range(self.size):
+      parent, child = context.Pipe()
+      process = context.Process(target=_replica_main, args=(self.boot, child), daemon=True)
+      # The read lock forks a consistent image; the log lock keeps the writer
+      # from logging a change between the fork and noting how much of the
+      # log the replica already has.
+      with self.boot.lock.read(), self._log_lock:
+        process.start()
+        replica = _Replica(process, parent, len(self._log))
+      child.close()
+      self._replicas.append(replica)
+      self._idle.put(replica)
+
+  def _retire(self, replicas: List[_Replica]) -> None:
+    for replica in replicas:
+      try:
+        replica.conn.send(("stop",))
+      except OSError:
+        pass
+      replica.conn.close()
+      replica.process.join(timeout=5)
+
+  def _record(self, record: dict) -> None:
+    with self._log_lock:
+      self._log.append(record)
+
+  def _pending(self, replica: _Replica) -> List[dict]:
+    with self._log_lock:
+      records = self._log[replica.applied:]
+      replica.applied = len(self._log)
+      low = min(r.applied for r in self._replicas)
+      if low:
+        # Every replica has these; drop them and shift the offsets.
+        del self._log[:low]
+        for r in self._replicas:
+          r.applied -= low
+      return records
+
+  def run(self, command: str) -> Dict[str, Any]:
+    if not is_read_only_command(command):
+      return _command_reply(self.boot, command)
+    replica = self._idle.get()
+    try:
+      # Writers log a multi-record change (a clone, a renumber) under the
+      # write lock, so the read side never drains half of one.
+      with self.boot.lock.read():
+        replica.conn.send(("run", self._pending(replica), command))
+      return replica.conn.recv()
+    finally:
+      self._idle.put(replica)
+
+  def run_many(self, commands: List[str]) -> List[Dict[str, Any]]:
+    """Run commands in order, fanning each run of consecutive reads across the replicas."""
+    results: List[Optional[Dict[str, Any]]] = [None] * len(commands)
+    reads: List[int] = []
+    with futures.ThreadPoolExecutor(max_workers=self.size) as executor:
+      def flush() -> None:
+        for index, reply in zip(reads, executor.map(self.run, [commands[i] for i in reads])):
+          results[index] = reply
+        reads.clear()
+      for index, command in enumerate(commands):
+        if is_read_only_command(command):
+          reads.append(index)
+        else:
+          flush()
+          results[index] = self.run(command)
+      flush()
+    return results
+
+  def stop(self) -> None:
+    if self._record in self.boot._record_sinks:
+      self.boot._record_sinks.remove(self._record)
+    self._retire(self._replicas)
+    self._replicas = []
+
+
+# --- Autosave -----------------------------------------------------------------
+# A burst of edits is saved once it pauses; this caps how many quiet periods
+# a save already due may wait for an edit stream that never pauses.
+AUTOSAVE_MAX_WAITS = 10
+# Boot slots that switch autosave on; setting one starts an idle autosaver.
+AUTOSAVE_SETTINGS = frozenset({"autosave_changes", "autosave_seconds"})
+
+
+class AutoSaver:
+  """Background snapshots once enough changes or time have piled up.
+
+  The boot slots `autosave_changes` (N changes, 0 = off) and
+  `autosave_seconds` (T seconds since the last save, 0 = off) decide when a
+  save is due; `autosave_quiet` is how often they are checked, and a due save
+  waits until the change count stops moving for one such period. Saves run
+  on this thread without shutdown hooks; deltas hold the write lock only
+  while they are captured.
+  """
+
+  def __init__(self, boot: BootObject) -> None:
+    self.boot = boot
+    self.saves = 0
+    self.last_duration: Optional[float] = None
+    self.last_bytes = 0
+    self.last_error: Optional[str] = None
+    self.last_saved: Optional[float] = None
+    self._stop = threading.Event()
+    self._thread: Optional[threading.Thread] = None
+    self._installed_stdout = False
+
+  def _setting(self, name: str, default: float) -> float:
+    slot = self.boot.slots.get(name)
+    return default if slot is None or slot.value is None else slot.value
+
+  def enabled(self) -> bool:
+    return bool(self._setting("autosave_changes", 0) or self._setting("autosave_seconds", 0))
+
+  def start(self) -> "AutoSaver":
+    """Start the saving thread if a trigger is set; otherwise wait for one to be."""
+    if self._thread is not None or self._stop.is_set() or not self.enabled():
+      return self
+    if not isinstance(sys.stdout, _ThreadStdout):
+      sys.stdout = _ThreadStdout(sys.stdout)
+      self._installed_stdout = True
+    self._thread = threading.Thread(target=self._run, name="lo-autosave", daemon=True)
+    self._thread.start()
+    return self
+
+  def stop(self) -> None:
+    self._stop.set()
+    if self._thread is not None:
+      self._thread.join()
+      self._thread = None
+    if self._installed_stdout and isinstance(sys.stdout, _ThreadStdout):
+      sys.stdout = sys.stdout.real
+      self._installed_stdout = False
+
+  def due(self) -> bool:
+    boot = self.boot
+    if not boot._changes:
+      return False
+    changes = self._setting("autosave_changes", 0)
+    seconds = self._setting("autosave_seconds", 0)
+    return bool(
+      (changes and boot._changes >= changes) or (seconds and time.monotonic() - boot._saved_at >= seconds)
+    )
+
+  def _run(self) -> None:
+    seen = None
+    waits = 0
+    while not self._stop.wait(self._setting("autosave_quiet", 1.0)):
+      if not self.due():
+        seen, waits = None, 0
+        continue
+      count = self.boot._changes
+      if count != seen and waits < AUTOSAVE_MAX_WAITS:
+        seen = count
+        waits += 1
+        continue
+      seen, waits = None, 0
+      self.save()
+
+  def save(self) -> None:
+    """Snapshot now on the calling thread, recording the outcome in stats()."""
+    start = time.perf_counter()
+    try:
+      with sys.stdout.capture() if isinstance(sys.stdout, _ThreadStdout) else redirect_stdout(io.StringIO()):
+        self.boot.snapshot(hooks=False)
+    except Exception as exc:
+      self.last_error = f"{type(exc).__name__}: {exc}"
+      print(f"autosave failed: {self.last_error}", file=sys.stderr)
+      return
+    self.saves += 1
+    self.last_duration = time.perf_counter() - start
+    self.last_bytes = self.boot._last_save_bytes
+    self.last_saved = time.time()
+    self.last_error = None
+
+  def stats(self) -> Dict[str, Any]:
+    return {
+      "running": self._thread is not None,
+      "saves": self.saves,
+      "last_duration": self.last_duration,
+      "last_bytes": self.last_bytes,
+      "last_saved": self.last_saved,
+      "last_error": self.last_error,
+      "pending_changes": self.boot._changes,
+      "unwritten_deltas": len(self.boot._unsaved),
+    }
+
+
+def _stdin_queue(loop: "asyncio.AbstractEventLoop") -> "asyncio.Queue":
+  """Feed stdin lines into a queue from a daemon thread (None marks EOF).
+
+  A thread rather than connect_read_pipe: that would put the shared tty in
+  non-blocking mode and break large prints to stdout.
+  """
+  queue: asyncio.Queue = asyncio.Queue()
+
+  def put(item: Optional[str]) -> None:
+    try:
+      loop.call_soon_threadsafe(queue.put_nowait, item)
+    except RuntimeError:
+      pass
+
+  def pump() -> None:
+    for line in sys.stdin:
+      put(line)
+    put(None)
+  threading.Thread(target=pump, name="lo-stdin", daemon=True).start()
+  return queue
+
+
+async def async_repl(boot: BootObject, startup: bool = True, prompt: str = "LiveObjects> ") -> None:
+  """REPL on an asyncio loop: tasks scheduled via boot.spawn/boot.every run between commands."""
+  boot._loop = asyncio.get_running_loop()
+  try:
+    if startup:
+      boot.startup_all()
+      # As in main(): startup hooks redo their writes on every start.
+      if boot.__dict__.get("_journal") is None:
+        boot.open_journal()
+      boot._run_lobby()
+    boot._start_periodic()
+    lines = _stdin_queue(boot._loop)
+    while True:
+      print(prompt, end="", flush=True)
+      line = await lines.get()
+      if line is None:
+        break
+      cmd = line.strip()
+      if not cmd:
+        continue
+      result = None
+      try:
+        result = boot.run_command(cmd)
+        if asyncio.isfuture(result):
+          result = await result
+      except Exception as exc:
+        # A failed task has already been reported by its done callback.
+        if not asyncio.isfuture(result):
+          print(f"{type(exc).__name__}: {exc}")
+        continue
+      if result == "EXIT":
+        break
+      if result is not None:
+        print(result)
+  finally:
+    await boot._cancel_tasks()
+    boot._loop = None
+
+
+class StartupTimer:
+  """Wall time per startup phase, printed to stderr by --timings."""
+
+  def __init__(self, start: float) -> None:
+    self.phases: List[Tuple[str, float]] = []
+    self._last = start
+
+  def mark(self, phase: str) -> None:
+    now = time.perf_counter()
+    self.phases.append((phase, now - self._last))
+    self._last = now
+
+  def report(self) -> None:
+    total = sum(seconds for _, seconds in self.phases)
+    for phase, seconds in self.phases:
+      print(f"{phase:<14} {seconds * 1000:8.2f} ms", file=sys.stderr)
+    print(f"{'total':<14} {total * 1000:8.2f} ms", file=sys.stderr)
+
+
 def main() -> None:
+  timer = StartupTimer(_IMPORT_START)
+  timer.mark("import")
   parser = argparse.ArgumentParser(description="Single-file LiveObjects runtime.")
   parser.add_argument("-c", "--command", help="Semicolon-separated commands to run", default="")
+  parser.add_argument("-f", "--file", help="Python script to run as one compiled batch ('-' reads stdin)")
+  parser.add_argument("--no-method-cache", action="store_true", help="Do not read or write the compiled-method cache file")
+  parser.add_argument("--eager-methods", action="store_true", help="Compile every method at hydrate time and report failures")
+  parser.add_argument("--source-image", action="store_true", help="Hydrate from the source snapshot, ignoring the binary image")
+  parser.add_argument("--mapped", action="store_true", help="Open a memory-mapped image whose objects load on first touch")
+  parser.add_argument("--async", dest="async_repl", action="store_true", help="Use the asyncio REPL so periodic tasks run alongside input")
+  parser.add_argument("--profile", metavar="PATH", help="Profile slot method calls and write them at exit (.json, else pstats)")
+  parser.add_argument("--serve", metavar="ADDRESS", help="Serve commands on a Unix socket path or [host:]port until interrupted")
+  parser.add_argument("--serve-any-host", action="store_true", help="Let --serve listen on a non-loopback host")
+  parser.add_argument("--replicas", type=int, metavar="N", help="Fork N read replicas for -c and --serve read-only commands")
+  parser.add_argument("--fast", action="store_true", help="Defer each object's startup hook until it is first looked up")
+  parser.add_argument("--timings", action="store_true", help="Print a startup-phase timing breakdown to stderr")
   args = parser.parse_args()
-
+  if args.serve:
+    try:
+      parse_serve_address(args.serve, args.serve_any_host)
+    except ValueError as exc:
+      parser.error(f"--serve: {exc}")
+
+  global METHOD_CACHE_ON_DISK, LAZY_METHODS, MAPPED_IMAGE
+  LAZY_METHODS = not args.eager_methods
+  MAPPED_IMAGE = MAPPED_IMAGE or args.mapped
+  METHOD_CACHE_ON_DISK = not args.no_method_cache
+  if METHOD_CACHE_ON_DISK:
+    load_method_cache()
+  timer.mark("method cache")
+
+  if args.profile:
+    atexit.register(enable_profiling().dump, args.profile)
+  load_runtime_prefix()
   boot = BootObject()
   GLOBAL_ENV["boot"] = boot
-  HYDRATE(boot)
-  boot.startup_all()
+  # Loading holds the write lock once, so each slot write just re-enters it.
+  with boot.lock.write(), boot.loading():
+    if args.source_image:
+      loaded = False
+    elif MAPPED_IMAGE:
+      loaded = boot.open_mapped_image()
+    else:
+      loaded = boot.load_image()
+    if not loaded:
+      HYDRATE(boot)
+      timer.mark("hydrate")
+      # A cache only: in a read-only location the next start hydrates again.
+      try:
+        if BINARY_IMAGE:
+          boot.write_image()
+        if MAPPED_IMAGE:
+          boot.write_mapped_image()
+      except OSError as exc:
+        print(f"Warning: image cache not written: {exc}")
+      timer.mark("write image")
+    else:
+      timer.mark("load image")
+    boot.apply_deltas()
+    boot.replay_journal()
+  timer.mark("deltas/journal")
+  if args.eager_methods:
+    for obj_name, slot_name, exc in boot.compile_methods():
+      print(f"method {obj_name}.{slot_name} failed to compile: {exc}")
+  if METHOD_CACHE_ON_DISK:
+    save_method_cache()
+  # The asyncio REPL runs startup hooks on its loop so async hooks become tasks.
+  async_mode = args.async_repl and not (args.file or args.command or args.serve)
+  # Startup hooks redo their writes on every start, so they need no journal;
+  # a session that then changes nothing leaves no journal file behind.
+  # async_repl opens it once its own startup has run.
+  if not async_mode:
+    boot.startup_all(defer=args.fast)
+    boot.open_journal()
+  timer.mark("startup")
+  # Forked now, while this is still the only thread (see ReplicaPool).
+  pool = ReplicaPool(boot, args.replicas).start() if args.replicas and (args.command or args.serve) else None
 
-  if args.command:
-    commands = [chunk for chunk in args.command.split(";") if chunk != ""]
-    boot.run_commands(commands)
-    return
+  try:
+    if args.file:
+      if args.file == "-":
+        exited = boot.run_script(sys.stdin.read(), "<stdin>")
+      else:
+        exited = boot.run_script(Path(args.file).read_text(), args.file)
+      if exited or not args.command:
+        return
+
+    if args.command:
+      commands = [chunk for chunk in args.command.split(";") if chunk != ""]
+      if pool is None:
+        boot.run_commands(commands)
+        return
+      if "exit" in [cmd.strip() for cmd in commands]:
+        commands = commands[: [cmd.strip() for cmd in commands].index("exit")]
+      for reply in pool.run_many(commands):
+        if not reply["ok"]:
+          print(reply["error"])
+          continue
+        print(reply["output"], end="")
+        if reply["result"] is not None:
+          print(reply["result"])
+      return
+
+    if args.timings:
+      timer.report()
+      args.timings = False
+    boot.start_deferred()
+    # Idle unless the autosave_changes or autosave_seconds boot slots are set.
+    boot.start_autosave()
+
+    if args.serve:
+      server = CommandServer(boot, args.serve, replicas=pool, any_host=args.serve_any_host)
+      print(f"Serving on {args.serve}")
+      try:
+        server.serve_forever()
+      except KeyboardInterrupt:
+        pass
+      return
+
+    if async_mode:
+      asyncio.run(async_repl(boot))
+      return
 
-  boot.boot()
+    boot.boot()
+  finally:
+    boot.stop_autosave()
+    if pool is not None:
+      pool.stop()
+    if args.timings:
+      timer.mark("commands")
+      timer.report()
 
 # === LIVEOBJECTS SNAPSHOT ===
 def hydrate(boot: BootObject) -> None:
@@ -635,6 +3426,8 @@ def hydrate(boot: BootObject) -> None:
   #Parents:
   #Methods:
   o1.jadd_slot('find', METHOD, 'lambda self, name_or_serial: self.boot.objsearch(name_or_serial) or self.boot.sersearch(name_or_serial)', None)
+  o1.jadd_slot('implementors', METHOD, 'lambda self, slot_name: self.boot.slot_index().implementors(slot_name)', None)
+  o1.jadd_slot('senders', METHOD, 'lambda self, *tokens: self.boot.slot_index().senders(*tokens)', None)
 
   o2 = boot.fresh('OS')
   o2.serial = 2
@@ -647,9 +3440,9 @@ def hydrate(boot: BootObject) -> None:
   #Parents:
   #Methods:
   o2.jadd_slot('executable_name', METHOD, "lambda self: 'python'", None)
-  o2.jadd_slot('hostname', METHOD, "lambda self: subprocess.check_output(['hostname']).decode().strip()", None)
+  o2.jadd_slot('hostname', METHOD, 'lambda self: _hostname()', None)
   o2.jadd_slot('mswindows', METHOD, 'lambda self: False', None)
-  o2.jadd_slot('pid', METHOD, "lambda self: subprocess.check_output(['bash', '-c', 'echo $$']).decode().strip()", None)
+  o2.jadd_slot('pid', METHOD, 'lambda self: str(os.getpid())', None)
   o2.jadd_slot('program_name', METHOD, 'lambda self: FILEPATH.name', None)
   o2.jadd_slot('system_copy', METHOD, "lambda self: 'cp'", None)
   o2.jadd_slot('uid', METHOD, 'lambda self: 0', None)
@@ -665,7 +3458,7 @@ def hydrate(boot: BootObject) -> None:
   o3.jadd_slot('UniversalTraits*', PARENT, "'UniversalTraits'", None)
   o3.jadd_slot('bootStrap*', PARENT, "'BootObject'", None)
   #Methods:
-  o3.jadd_slot('execute', METHOD, 'lambda self, code: _eval_in_context(self.boot, code)', None)
+  o3.jadd_slot('execute', METHOD, 'lambda self, code: _eval_in_context(self.boot, code, self)', None)
   o3.jadd_slot('tagline', METHOD, "lambda self: 'I execute code strings'", None)
 
   o4 = boot.fresh('Keyboard_input_object')
@@ -712,7 +3505,9 @@ def hydrate(boot: BootObject) -> None:
   o6.jadd_slot('co', METHOD, "lambda self, name: setattr(self, 'current_object', self.boot.objsearch(name)) or self.current_object", None)
   o6.jadd_slot('display_method', METHOD, 'def display_method(self, target_name, slot_name):\n  target = self.boot.objsearch(target_name)\n  if not target:\n    print("No target")\n    return\n  slot = target.slots.get(slot_name)\n  if not slot:\n    print("No slot")\n    return\n  print(slot.source)\n', None)
   o6.jadd_slot('display_object', METHOD, 'def display_object(self, target_name=None):\n  target = self.boot.objsearch(target_name) if target_name else self.current_object\n  if not target:\n    print("No target")\n    return\n  print(f"Object: {target.name}")\n  for slot in sorted(target.slots.values(), key=lambda s: s.name):\n    print(f"  {slot.kind:<6} {slot.name}")\n', None)
+  o6.jadd_slot('gc', METHOD, 'def gc(self, apply=False, compact=False):\n  report = self.boot.collect_garbage(dry_run=not apply, compact=compact)\n  verb = "Would remove" if report["dry_run"] else "Removed"\n  print(f"{report[\'live\']} live objects; {verb} {len(report[\'garbage\'])}")\n  for serial, name in report["garbage"]:\n    print(f"  #{serial} {name}")\n  for name, slot_name, target in report["dangling"]:\n    print(f"  dangling {name}.{slot_name} -> {target}")\n', None)
   o6.jadd_slot('list_objects', METHOD, 'def list_objects(self):\n  for obj in self.boot.oblist:\n    tag = getattr(obj, "tagline", lambda: "")()\n    print(f"{obj.serial}\\t{obj.name}\\t{tag}")\n', None)
+  o6.jadd_slot('profile', METHOD, 'def profile(self, action="report", path=None, limit=20):\n  if action == "start":\n    enable_profiling()\n    return "profiling on"\n  if action == "stop":\n    disable_profiling()\n    return "profiling off"\n  profiler = current_profiler()\n  if profiler is None:\n    return "profiling is off; use profile(\'start\')"\n  if action == "reset":\n    profiler.reset()\n    return None\n  if action == "dump":\n    return str(profiler.dump(path or "liveobjects.pstats"))\n  print(f"{\'calls\':>8} {\'self s\':>10} {\'total s\':>10} {\'exc\':>5}  slot")\n  for row in profiler.rows()[:limit]:\n    print(f"{row[\'calls\']:>8} {row[\'self_time\']:>10.6f} {row[\'total_time\']:>10.6f} {row[\'exceptions\']:>5}  {row[\'object\']}.{row[\'slot\']}")\n', None)
   o6.jadd_slot('startup', METHOD, "lambda self: setattr(self, 'current_object', self.boot.objsearch('Inspector') or self)", None)
   o6.jadd_slot('tagline', METHOD, "lambda self: 'Lists registered objects'", None)
 
@@ -726,7 +3521,7 @@ def hydrate(boot: BootObject) -> None:
   o7.jadd_slot('UniversalTraits*', PARENT, "'UniversalTraits'", None)
   o7.jadd_slot('bootStrap*', PARENT, "'BootObject'", None)
   #Methods:
-  o7.jadd_slot('go', METHOD, 'def go(self):\n  if objc is None:\n    print("Cocoa bridge not available; install pyobjc-core and pyobjc-framework-Cocoa.")\n    return None\n  try:\n    app = NSApplication.sharedApplication()\n  except Exception as exc:\n    print(f"Cocoa init failed: {exc}")\n    return None\n  app_running = False\n  try:\n    app_running = bool(app.isRunning())\n  except Exception:\n    app_running = False\n\n  apps = [o for o in self.boot.prototypes() if getattr(o, "isApplication", None) == "yes"]\n\n  class AppDelegate(objc.lookUpClass("NSObject")):\n    def applicationShouldTerminateAfterLastWindowClosed_(self, app):\n      return True\n\n  class Manager(objc.lookUpClass("NSObject")):\n    def initWithBoot_apps_(self, boot_obj, app_list):\n      self = objc.super(Manager, self).init()\n      if self is None:\n        return None\n      self.boot = boot_obj\n      self.apps = app_list\n      self.table = None\n      self.selected = None\n      return self\n\n    def numberOfRowsInTableView_(self, tableView):\n      return len(self.apps)\n\n    def tableView_objectValueForTableColumn_row_(self, tableView, column, row):\n      obj = self.apps[row]\n      human = getattr(obj, "humanName", obj.name)\n      return human\n\n    def tableViewSelectionDidChange_(self, notification):\n      tv = notification.object()\n      idx = tv.selectedRow()\n      if 0 <= idx < len(self.apps):\n        self.selected = self.apps[idx]\n\n    def launch_(self, sender):\n      if not self.selected:\n        return\n      obj = self.selected\n      obj.go()\n\n    @objc.python_method\n    def build(self) -> NSWindow:\n      app_local = NSApp() or NSApplication.sharedApplication()\n      NSRunningApplication.currentApplication().activateWithOptions_(1 << 1)\n      style = (\n        NSWindowStyleMaskTitled\n        | NSWindowStyleMaskClosable\n        | NSWindowStyleMaskResizable\n        | NSWindowStyleMaskMiniaturizable\n      )\n      window = NSWindow.alloc().initWithContentRect_styleMask_backing_defer_(\n        NSMakeRect(0, 0, 400, 400), style, NSBackingStoreBuffered, False\n      )\n      window.setTitle_("LiveObjects Lobby")\n\n      table = NSTableView.alloc().initWithFrame_(NSMakeRect(0, 30, 400, 370))\n      col = NSTableColumn.alloc().initWithIdentifier_("apps")\n      col.setWidth_(380)\n      table.addTableColumn_(col)\n      table.setHeaderView_(None)\n      self.table = table\n      table.setDelegate_(self)\n      table.setDataSource_(self)\n\n      scroll = NSScrollView.alloc().initWithFrame_(NSMakeRect(0, 30, 400, 370))\n      scroll.setHasVerticalScroller_(True)\n      scroll.setDocumentView_(table)\n\n      launch_btn = NSButton.alloc().initWithFrame_(NSMakeRect(0, 0, 100, 30))\n      launch_btn.setTitle_("Launch")\n      launch_btn.setTarget_(self)\n      launch_btn.setAction_("launch:")\n\n      container = NSView.alloc().initWithFrame_(NSMakeRect(0, 0, 400, 400))\n      scroll.setAutoresizingMask_(NSViewWidthSizable | NSViewHeightSizable)\n      launch_btn.setAutoresizingMask_(NSViewWidthSizable)\n      container.addSubview_(scroll)\n      container.addSubview_(launch_btn)\n\n      window.setContentView_(container)\n      window.center()\n      window.makeKeyAndOrderFront_(None)\n\n      if self.apps:\n        table.selectRowIndexes_byExtendingSelection_(objc.lookUpClass("NSIndexSet").indexSetWithIndex_(0), False)\n        self.selected = self.apps[0]\n      return window\n\n  if not app_running:\n    app.setActivationPolicy_(NSApplicationActivationPolicyRegular)\n    delegate = AppDelegate.alloc().init()\n    app.setDelegate_(delegate)\n  mgr = Manager.alloc().initWithBoot_apps_(self.boot, apps)\n  mgr.build()\n  if not app_running:\n    app.run()\n  return None\n', None)
+  o7.jadd_slot('go', METHOD, 'def go(self):\n  if objc is None:\n    print("Cocoa bridge not available; install pyobjc-core and pyobjc-framework-Cocoa.")\n    return None\n  try:\n    app = NSApplication.sharedApplication()\n  except Exception as exc:\n    print(f"Cocoa init failed: {exc}")\n    return None\n  app_running = False\n  try:\n    app_running = bool(app.isRunning())\n  except Exception:\n    app_running = False\n\n  apps = [o for o in self.boot.prototypes() if getattr(o, "isApplication", None) == "yes"]\n\n  class AppDelegate(objc.lookUpClass("NSObject")):\n    def applicationShouldTerminateAfterLastWindowClosed_(self, app):\n      return True\n\n  class Manager(objc.lookUpClass("NSObject")):\n    def initWithBoot_apps_(self, boot_obj, app_list):\n      self = objc.super(Manager, self).init()\n      if self is None:\n        return None\n      self.boot = boot_obj\n      self.apps = app_list\n      self.table = None\n      self.selected = None\n      return self\n\n    def numberOfRowsInTableView_(self, tableView):\n      return len(self.apps)\n\n    def tableView_objectValueForTableColumn_row_(self, tableView, column, row):\n      obj = self.apps[row]\n      human = getattr(obj, "humanName", obj.name)\n      return human\n\n    def tableViewSelectionDidChange_(self, notification):\n      tv = notification.object()\n      idx = tv.selectedRow()\n      if 0 <= idx < len(self.apps):\n        self.selected = self.apps[idx]\n\n    def launch_(self, sender):\n      if not self.selected:\n        return\n      obj = self.selected\n      obj.go()\n\n    @objc.python_method\n    def build(self) -> NSWindow:\n      app_local = NSApp() or NSApplication.sharedApplication()\n      NSRunningApplication.currentApplication().activateWithOptions_(1 << 1)\n      style = (\n        NSWindowStyleMaskTitled\n        | NSWindowStyleMaskClosable\n        | NSWindowStyleMaskResizable\n        | NSWindowStyleMaskMiniaturizable\n      )\n      window = NSWindow.alloc().initWithContentRect_styleMask_backing_defer_(\n        NSMakeRect(0, 0, 400, 400), style, NSBackingStoreBuffered, False\n      )\n      window.setTitle_("LiveObjects Lobby")\n\n      table = NSTableView.alloc().initWithFrame_(NSMakeRect(0, 30, 400, 370))\n      col = NSTableColumn.alloc().initWithIdentifier_("apps")\n      col.setWidth_(380)\n      table.addTableColumn_(col)\n      table.setHeaderView_(None)\n      self.table = table\n      table.setDelegate_(self)\n      table.setDataSource_(self)\n\n      scroll = NSScrollView.alloc().initWithFrame_(NSMakeRect(0, 30, 400, 370))\n      scroll.setHasVerticalScroller_(True)\n      scroll.setDocumentView_(table)\n\n      launch_btn = NSButton.alloc().initWithFrame_(NSMakeRect(0, 0, 100, 30))\n      launch_btn.setTitle_("Launch")\n      launch_btn.setTarget_(self)\n      launch_btn.setAction_("launch:")\n\n      container = NSView.alloc().initWithFrame_(NSMakeRect(0, 0, 400, 400))\n      scroll.setAutoresizingMask_(NSViewWidthSizable | NSViewHeightSizable)\n      launch_btn.setAutoresizingMask_(NSViewWidthSizable)\n      container.addSubview_(scroll)\n      container.addSubview_(launch_btn)\n\n      window.setContentView_(container)\n      window.center()\n      window.makeKeyAndOrderFront_(None)\n\n      if self.apps:\n        table.selectRowIndexes_byExtendingSelection_(objc.lookUpClass("NSIndexSet").indexSetWithIndex_(0), False)\n        self.selected = self.apps[0]\n      return window\n\n  if not app_running:\n    app.setActivationPolicy_(NSApplicationActivationPolicyRegular)\n    delegate = AppDelegate.alloc().init()\n    app.setDelegate_(delegate)\n  mgr = Manager.alloc().initWithBoot_apps_(self.boot, apps)\n  mgr.build()\n  if not app_running:\n    # Cocoa callbacks take the lock themselves while the event loop runs.\n    with _unlocked():\n      app.run()\n  return None\n', None)
   o7.jadd_slot('tagline', METHOD, "lambda self: 'Entry point placeholder'", None)
 
   o8 = boot.fresh('PrimaBrowser')
@@ -759,9 +3554,9 @@ def hydrate(boot: BootObject) -> None:
   o8.jadd_slot('callback_method_selected', METHOD, 'def callback_method_selected(self, slot_name):\n  if not self.selected_object:\n    return None\n  slot = self.selected_object.slots.get(slot_name)\n  self.selected_method = slot_name\n  if slot:\n    print(slot.source)\n  return slot\n', None)
   o8.jadd_slot('callback_object_selected', METHOD, 'def callback_object_selected(self, target_name):\n  return self.edit_object(target_name)\n', None)
   o8.jadd_slot('callback_update_method', METHOD, 'def callback_update_method(self, source):\n  if not self.selected_method:\n    return None\n  return self.update(self.selected_method, source)\n', None)
-  o8.jadd_slot('check_eval', METHOD, 'def check_eval(self, source):\n  try:\n    return _eval_in_context(self.boot, source)\n  except Exception as exc:\n    print(exc)\n    return None\n', None)
+  o8.jadd_slot('check_eval', METHOD, 'def check_eval(self, source):\n  try:\n    return _eval_in_context(self.boot, source, self)\n  except Exception as exc:\n    print(exc)\n    return None\n', None)
   o8.jadd_slot('clear_methods', METHOD, 'def clear_methods(self):\n  self.selected_method = None\n', None)
-  o8.jadd_slot('display', METHOD, 'def display(self):\n  if not self.selected_object:\n    print("No selected object")\n    return\n  print(f"Object: {self.selected_object.name}")\n  for slot in sorted(self.selected_object.slots.values(), key=lambda s: s.name):\n    print(f"  {slot.kind:<6} {slot.name}")\n', None)
+  o8.jadd_slot('display', METHOD, 'def display(self):\n  if not self.selected_object:\n    print("No selected object")\n    return\n  print(f"Object: {self.selected_object.name}")\n  with self.boot.lock.read():\n    slots = sorted(self.selected_object.slots.values(), key=lambda s: s.name)\n  for slot in slots:\n    print(f"  {slot.kind:<6} {slot.name}")\n', None)
   o8.jadd_slot('display_objs', METHOD, 'def display_objs(self):\n  for obj in self.boot.prototypes():\n    print(obj.name)\n', None)
   o8.jadd_slot('edit_object', METHOD, 'def edit_object(self, target_name):\n  obj = self.boot.objsearch(target_name)\n  self.selected_object = obj\n  if not obj:\n    print("No such object")\n    return None\n  return obj\n', None)
   o8.jadd_slot('go', METHOD, 'def go(self, target_name=None):\n  if target_name:\n    self.edit_object(target_name)\n  else:\n    names = [o.name for o in self.boot.prototypes()]\n    if names:\n      self.edit_object(names[0])\n  self.display()\n', None)
@@ -791,8 +3586,8 @@ def hydrate(boot: BootObject) -> None:
   o9.jadd_slot('UniversalTraits*', PARENT, "'UniversalTraits'", None)
   o9.jadd_slot('bootStrap*', PARENT, "'BootObject'", None)
   #Methods:
-  o9.jadd_slot('callback_clone_object', METHOD, 'def callback_clone_object(self, name):\n  source = self.boot.objsearch(name)\n  if not source:\n    return None\n  clone = self.boot.fresh(f"Clone of {name}")\n  for slot in source.slots.values():\n    if slot.kind == METHOD:\n      clone.jadd_slot(slot.name, METHOD, slot.source, None)\n    elif slot.kind == PARENT:\n      clone.jadd_slot(slot.name, PARENT, slot.source, slot.value)\n    else:\n      clone.jadd_slot(slot.name, FIELD, slot.source, slot.value)\n  return clone\n', None)
-  o9.jadd_slot('callback_delete_object', METHOD, 'def callback_delete_object(self, name):\n  obj = self.boot.objsearch(name)\n  if not obj or obj is self.boot:\n    return None\n  self.boot.oblist = [o for o in self.boot.oblist if o is not obj]\n  self.boot.objects.pop(obj.name, None)\n  return name\n', None)
+  o9.jadd_slot('callback_clone_object', METHOD, 'def callback_clone_object(self, name):\n  source = self.boot.objsearch(name)\n  if not source:\n    return None\n  return self.boot.clone(source, f"Clone of {name}")\n', None)
+  o9.jadd_slot('callback_delete_object', METHOD, 'def callback_delete_object(self, name):\n  obj = self.boot.objsearch(name)\n  if not obj or obj is self.boot:\n    return None\n  self.boot.unregister(obj)\n  return name\n', None)
   o9.jadd_slot('callback_edit_object', METHOD, 'def callback_edit_object(self, name):\n  pb = self.boot.objsearch("PrimaBrowser")\n  if not pb:\n    return None\n  pb.edit_object(name)\n  pb.display()\n  return pb\n', None)
   o9.jadd_slot('callback_new_object', METHOD, 'def callback_new_object(self, name):\n  if not name:\n    return None\n  obj = self.boot.fresh(name)\n  return obj\n', None)
   o9.jadd_slot('callback_object_selected', METHOD, 'def callback_object_selected(self, name):\n  obj = self.boot.objsearch(name)\n  self.selected_object = obj\n  return obj\n', None)
@@ -817,7 +3612,7 @@ def hydrate(boot: BootObject) -> None:
   o10.jadd_slot('UniversalTraits*', PARENT, "'UniversalTraits'", None)
   o10.jadd_slot('bootStrap*', PARENT, "'BootObject'", None)
   #Methods:
-  o10.jadd_slot('go', METHOD, 'def go(self):\n  if objc is None:\n    return None\n  \n  class Mgr(objc.lookUpClass("NSObject")):\n    def initWithBoot_(self, boot_obj):\n      self = objc.super(Mgr, self).init()\n      if self is None:\n        return None\n      self.boot = boot_obj\n      self.objects = [o for o in boot_obj.prototypes()]\n      self.slots = []\n      self.selected_obj = None\n      self.selected_slot = None\n      self.obj_table = None\n      self.slot_table = None\n      self.text_view = None\n      return self\n    \n    def numberOfRowsInTableView_(self, tv):\n      if tv == self.obj_table:\n        return len(self.objects)\n      return len(self.slots)\n    \n    def tableView_objectValueForTableColumn_row_(self, tv, col, row):\n      if tv == self.obj_table:\n        return self.objects[row].name\n      slot = self.slots[row]\n      prefix = "M" if slot.kind == "METHOD" else "F" if slot.kind == "FIELD" else "P"\n      return f"{prefix} {slot.name}"\n    \n    def tableViewSelectionDidChange_(self, notif):\n      tv = notif.object()\n      if tv == self.obj_table:\n        idx = tv.selectedRow()\n        if 0 <= idx < len(self.objects):\n          self._sel_obj(idx)\n      elif tv == self.slot_table:\n        idx = tv.selectedRow()\n        if 0 <= idx < len(self.slots):\n          self._sel_slot(idx)\n    \n    @objc.python_method\n    def _sel_obj(self, idx):\n      self.selected_obj = self.objects[idx]\n      self.slots = sorted(self.selected_obj.slots.values(), key=lambda s: s.name)\n      self.slot_table.reloadData()\n      if self.slots:\n        self.slot_table.selectRowIndexes_byExtendingSelection_(objc.lookUpClass("NSIndexSet").indexSetWithIndex_(0), False)\n        self._sel_slot(0)\n      else:\n        self.selected_slot = None\n        self.text_view.setString_("")\n    \n    @objc.python_method\n    def _sel_slot(self, idx):\n      self.selected_slot = self.slots[idx]\n      slot = self.selected_slot\n      if slot.kind == "METHOD":\n        text = slot.source\n      else:\n        text = slot.source if slot.source else repr(slot.value)\n      self.text_view.setString_(text)\n    \n    def save_(self, sender):\n      if not (self.selected_obj and self.selected_slot):\n        return\n      text = str(self.text_view.string())\n      slot = self.selected_slot\n      if slot.kind == "METHOD":\n        self.selected_obj.jadd_slot(slot.name, "METHOD", text, None)\n      else:\n        try:\n          val = _eval_in_context(self.boot, text)\n        except:\n          val = text\n        self.selected_obj.jadd_slot(slot.name, "FIELD", text, val)\n      self._sel_obj(self.objects.index(self.selected_obj))\n\n  mgr = Mgr.alloc().initWithBoot_(self.boot)\n  \n  w = NSWindow.alloc().initWithContentRect_styleMask_backing_defer_(NSMakeRect(0,0,900,500), NSWindowStyleMaskTitled|NSWindowStyleMaskClosable|NSWindowStyleMaskResizable|NSWindowStyleMaskMiniaturizable, NSBackingStoreBuffered, False)\n  w.setTitle_("LiveObjects Browser")\n  w.setReleasedWhenClosed_(False)\n  \n  split = NSSplitView.alloc().initWithFrame_(w.contentView().frame())\n  split.setDividerStyle_(NSSplitViewDividerStyleThin)\n  split.setVertical_(True)\n  split.setAutoresizingMask_(NSViewWidthSizable | NSViewHeightSizable)\n  w.contentView().addSubview_(split)\n  \n  def mk_tbl(width):\n    t = NSTableView.alloc().initWithFrame_(NSMakeRect(0,0,width,400))\n    c = NSTableColumn.alloc().initWithIdentifier_("col")\n    c.setWidth_(width)\n    t.addTableColumn_(c)\n    t.setHeaderView_(None)\n    return t\n  \n  obj_t = mk_tbl(200)\n  obj_s = NSScrollView.alloc().initWithFrame_(NSMakeRect(0,0,200,500))\n  obj_s.setHasVerticalScroller_(True)\n  obj_s.setDocumentView_(obj_t)\n  mgr.obj_table = obj_t\n  obj_t.setDelegate_(mgr)\n  obj_t.setDataSource_(mgr)\n  \n  slot_t = mk_tbl(250)\n  slot_s = NSScrollView.alloc().initWithFrame_(NSMakeRect(0,0,250,500))\n  slot_s.setHasVerticalScroller_(True)\n  slot_s.setDocumentView_(slot_t)\n  mgr.slot_table = slot_t\n  slot_t.setDelegate_(mgr)\n  slot_t.setDataSource_(mgr)\n  \n  txt = NSTextView.alloc().initWithFrame_(NSMakeRect(0,0,450,450))\n  txt.setAutoresizingMask_(NSViewWidthSizable | NSViewHeightSizable)\n  mgr.text_view = txt\n  txt_s = NSScrollView.alloc().initWithFrame_(NSMakeRect(0,30,450,470))\n  txt_s.setHasVerticalScroller_(True)\n  txt_s.setDocumentView_(txt)\n  \n  btn = NSButton.alloc().initWithFrame_(NSMakeRect(0,0,80,30))\n  btn.setTitle_("Save")\n  btn.setTarget_(mgr)\n  btn.setAction_("save:")\n  \n  right = NSView.alloc().initWithFrame_(NSMakeRect(0,0,450,500))\n  txt_s.setAutoresizingMask_(NSViewWidthSizable | NSViewHeightSizable)\n  btn.setAutoresizingMask_(NSViewWidthSizable)\n  right.addSubview_(txt_s)\n  right.addSubview_(btn)\n  \n  split.addArrangedSubview_(obj_s)\n  split.addArrangedSubview_(slot_s)\n  split.addArrangedSubview_(right)\n  \n  w.center()\n  w.makeKeyAndOrderFront_(None)\n  if mgr.objects:\n    obj_t.selectRowIndexes_byExtendingSelection_(objc.lookUpClass("NSIndexSet").indexSetWithIndex_(0), False)\n    mgr._sel_obj(0)\n  \n  if not hasattr(self.boot, "_windows"): self.boot._windows = []\n  self.boot._windows.append(w)\n  if not hasattr(self.boot, "_managers"): self.boot._managers = []\n  self.boot._managers.append(mgr)\n  return w\n', None)
+  o10.jadd_slot('go', METHOD, 'def go(self):\n  if objc is None:\n    return None\n  \n  class Mgr(objc.lookUpClass("NSObject")):\n    def initWithBoot_(self, boot_obj):\n      self = objc.super(Mgr, self).init()\n      if self is None:\n        return None\n      self.boot = boot_obj\n      self.objects = [o for o in boot_obj.prototypes()]\n      self.slots = []\n      self.selected_obj = None\n      self.selected_slot = None\n      self.obj_table = None\n      self.slot_table = None\n      self.text_view = None\n      return self\n    \n    def numberOfRowsInTableView_(self, tv):\n      if tv == self.obj_table:\n        return len(self.objects)\n      return len(self.slots)\n    \n    def tableView_objectValueForTableColumn_row_(self, tv, col, row):\n      if tv == self.obj_table:\n        return self.objects[row].name\n      slot = self.slots[row]\n      prefix = "M" if slot.kind == "METHOD" else "F" if slot.kind == "FIELD" else "P"\n      return f"{prefix} {slot.name}"\n    \n    def tableViewSelectionDidChange_(self, notif):\n      tv = notif.object()\n      if tv == self.obj_table:\n        idx = tv.selectedRow()\n        if 0 <= idx < len(self.objects):\n          self._sel_obj(idx)\n      elif tv == self.slot_table:\n        idx = tv.selectedRow()\n        if 0 <= idx < len(self.slots):\n          self._sel_slot(idx)\n    \n    @objc.python_method\n    def _sel_obj(self, idx):\n      self.selected_obj = self.objects[idx]\n      with self.boot.lock.read():\n        self.slots = sorted(self.selected_obj.slots.values(), key=lambda s: s.name)\n      self.slot_table.reloadData()\n      if self.slots:\n        self.slot_table.selectRowIndexes_byExtendingSelection_(objc.lookUpClass("NSIndexSet").indexSetWithIndex_(0), False)\n        self._sel_slot(0)\n      else:\n        self.selected_slot = None\n        self.text_view.setString_("")\n    \n    @objc.python_method\n    def _sel_slot(self, idx):\n      self.selected_slot = self.slots[idx]\n      slot = self.selected_slot\n      if slot.kind == "METHOD":\n        text = slot.source\n      else:\n        text = slot.source if slot.source else repr(slot.value)\n      self.text_view.setString_(text)\n    \n    def save_(self, sender):\n      if not (self.selected_obj and self.selected_slot):\n        return\n      text = str(self.text_view.string())\n      slot = self.selected_slot\n      if slot.kind == "METHOD":\n        try:\n          self.selected_obj.jadd_slot(slot.name, "METHOD", text, None)\n        except (SyntaxError, ValueError) as exc:\n          _native_dialog(f"{slot.name} not saved: {exc}")\n          return\n      else:\n        try:\n          val = _eval_in_context(self.boot, text)\n        except:\n          val = text\n        self.selected_obj.jadd_slot(slot.name, "FIELD", text, val)\n      self._sel_obj(self.objects.index(self.selected_obj))\n\n  mgr = Mgr.alloc().initWithBoot_(self.boot)\n  \n  w = NSWindow.alloc().initWithContentRect_styleMask_backing_defer_(NSMakeRect(0,0,900,500), NSWindowStyleMaskTitled|NSWindowStyleMaskClosable|NSWindowStyleMaskResizable|NSWindowStyleMaskMiniaturizable, NSBackingStoreBuffered, False)\n  w.setTitle_("LiveObjects Browser")\n  w.setReleasedWhenClosed_(False)\n  \n  split = NSSplitView.alloc().initWithFrame_(w.contentView().frame())\n  split.setDividerStyle_(NSSplitViewDividerStyleThin)\n  split.setVertical_(True)\n  split.setAutoresizingMask_(NSViewWidthSizable | NSViewHeightSizable)\n  w.contentView().addSubview_(split)\n  \n  def mk_tbl(width):\n    t = NSTableView.alloc().initWithFrame_(NSMakeRect(0,0,width,400))\n    c = NSTableColumn.alloc().initWithIdentifier_("col")\n    c.setWidth_(width)\n    t.addTableColumn_(c)\n    t.setHeaderView_(None)\n    return t\n  \n  obj_t = mk_tbl(200)\n  obj_s = NSScrollView.alloc().initWithFrame_(NSMakeRect(0,0,200,500))\n  obj_s.setHasVerticalScroller_(True)\n  obj_s.setDocumentView_(obj_t)\n  mgr.obj_table = obj_t\n  obj_t.setDelegate_(mgr)\n  obj_t.setDataSource_(mgr)\n  \n  slot_t = mk_tbl(250)\n  slot_s = NSScrollView.alloc().initWithFrame_(NSMakeRect(0,0,250,500))\n  slot_s.setHasVerticalScroller_(True)\n  slot_s.setDocumentView_(slot_t)\n  mgr.slot_table = slot_t\n  slot_t.setDelegate_(mgr)\n  slot_t.setDataSource_(mgr)\n  \n  txt = NSTextView.alloc().initWithFrame_(NSMakeRect(0,0,450,450))\n  txt.setAutoresizingMask_(NSViewWidthSizable | NSViewHeightSizable)\n  mgr.text_view = txt\n  txt_s = NSScrollView.alloc().initWithFrame_(NSMakeRect(0,30,450,470))\n  txt_s.setHasVerticalScroller_(True)\n  txt_s.setDocumentView_(txt)\n  \n  btn = NSButton.alloc().initWithFrame_(NSMakeRect(0,0,80,30))\n  btn.setTitle_("Save")\n  btn.setTarget_(mgr)\n  btn.setAction_("save:")\n  \n  right = NSView.alloc().initWithFrame_(NSMakeRect(0,0,450,500))\n  txt_s.setAutoresizingMask_(NSViewWidthSizable | NSViewHeightSizable)\n  btn.setAutoresizingMask_(NSViewWidthSizable)\n  right.addSubview_(txt_s)\n  right.addSubview_(btn)\n  \n  split.addArrangedSubview_(obj_s)\n  split.addArrangedSubview_(slot_s)\n  split.addArrangedSubview_(right)\n  \n  w.center()\n  w.makeKeyAndOrderFront_(None)\n  if mgr.objects:\n    obj_t.selectRowIndexes_byExtendingSelection_(objc.lookUpClass("NSIndexSet").indexSetWithIndex_(0), False)\n    mgr._sel_obj(0)\n  \n  if not hasattr(self.boot, "_windows"): self.boot._windows = []\n  self.boot._windows.append(w)\n  if not hasattr(self.boot, "_managers"): self.boot._managers = []\n  self.boot._managers.append(mgr)\n  return w\n', None)
 
   o11 = boot.fresh('NativeEvaluator')
   o11.serial = 11
@@ -0,0 +1,28 @@
+import threading
+
+
+class _Script:
+  ran_on = []
+
+  @classmethod
+  def alloc(cls):
+    return cls()
+
+  def initWithSource_(self, source):
+    return self
+
+  def executeAndReturnError_(self, error):
+    _Script.ran_on.append(threading.current_thread())
+    return None, None
+
+
+def test_inproc_only_on_the_main_thread(lo, monkeypatch):
+  monkeypatch.setattr(lo, "NSAppleScript", _Script)
+  service = lo.AppleScriptService()
+  service._osascript = False
+  assert service.backend == "inproc"
+  service.run("return 1")
+  worker = threading.Thread(target=service.run, args=("return 1",))
+  worker.start()
+  worker.join()
+  assert _Script.ran_on == [threading.main_thread()]
@@ -0,0 +1,60 @@
+import asyncio
+import io
+import json
+import shutil
+import subprocess
+import sys
+
+from conftest import RUNTIME
+
+
+def _on_loop(boot, body):
+  async def main():
+    boot._loop = asyncio.get_running_loop()
+    try:
+      return await body()
+    finally:
+      await boot._cancel_tasks()
+      boot._loop = None
+  return asyncio.run(main())
+
+
+def test_settle_passes_tasks_through(boot):
+  async def body():
+    periodic = boot._settle(boot.every(60, lambda: None, "tick"))
+    spawned = boot._settle(boot.spawn(asyncio.sleep(0, "done")))
+    assert isinstance(periodic, asyncio.Task) and periodic.get_name() == "tick"
+    assert boot.spawn(spawned) is spawned
+    return await spawned
+  assert _on_loop(boot, body) == "done"
+
+
+def test_settle_wraps_other_awaitables(boot):
+  class Later:
+    def __await__(self):
+      yield from asyncio.sleep(0).__await__()
+      return 42
+
+  async def body():
+    task = boot._settle(Later())
+    assert isinstance(task, asyncio.Task)
+    return await task
+  assert _on_loop(boot, body) == 42
+  assert boot._settle(Later()) == 42
+
+
+def test_async_repl_journals_only_after_startup(boot, monkeypatch, lo):
+  boot.close_journal()
+  monkeypatch.setattr(sys, "stdin", io.StringIO("boot.objsearch('Inspector').term = 'typed'\n"))
+  asyncio.run(lo.async_repl(boot))
+  records = [json.loads(line) for line in boot._journal_path().read_text().splitlines()]
+  assert [(record["op"], record.get("name")) for record in records] == [("base", None), ("slot", "term")]
+
+
+def test_async_session_without_edits_leaves_no_journal(tmp_path):
+  shutil.copy(RUNTIME, tmp_path / "liveobjects.py")
+  run = subprocess.run(
+    [sys.executable, "liveobjects.py", "--async"], cwd=tmp_path, input="exit\n", capture_output=True, text=True, timeout=60
+  )
+  assert run.returncode == 0, run.stderr
+  assert not (tmp_path / "liveobjects.py.journal").exists()
@@ -0,0 +1,60 @@
+import json
+import sys
+import time
+
+
+def _wait_for_save(saver, timeout=10.0):
+  deadline = time.monotonic() + timeout
+  while saver.saves == 0 and time.monotonic() < deadline:
+    time.sleep(0.02)
+  # Long enough for a second, unwanted save to show up.
+  time.sleep(5 * saver.boot.autosave_quiet)
+
+
+def _journal_records(boot):
+  path = boot._journal_path()
+  return [json.loads(line) for line in path.read_text().splitlines()] if path.exists() else []
+
+
+def _check_one_delta(lo, boot, reopen):
+  assert boot.autosave_stats()["saves"] == 1
+  assert boot._delta_path().read_text().count(lo.DELTA_MARKER) == 1
+  assert [record["op"] for record in _journal_records(boot)] in ([], ["base"])
+  boot.stop_autosave()
+  assert reopen().objsearch("Inspector").term == 3
+
+
+def test_disabled_autosave_starts_no_thread(lo, boot):
+  saver = boot.start_autosave()
+  assert saver.stats()["running"] is False
+  assert not isinstance(sys.stdout, lo._ThreadStdout)
+  boot.stop_autosave()
+
+
+def test_change_count_triggers_one_delta(lo, boot, reopen):
+  boot.autosave_quiet = 0.05
+  boot.snapshot(full=True)
+  saver = boot.start_autosave()
+  boot.autosave_changes = 3
+  assert saver.stats()["running"] is True
+  for value in (1, 2, 3):
+    boot.objsearch("Inspector").term = value
+  _wait_for_save(saver)
+  _check_one_delta(lo, boot, reopen)
+
+
+def test_elapsed_seconds_trigger_one_delta(lo, boot, reopen):
+  boot.autosave_quiet = 0.05
+  boot.autosave_seconds = 0.2
+  boot.snapshot(full=True)
+  saver = boot.start_autosave()
+  boot.objsearch("Inspector").term = 3
+  _wait_for_save(saver)
+  _check_one_delta(lo, boot, reopen)
+
+
+def test_thread_stdout_delegates_to_the_real_stream(lo, tmp_path):
+  with (tmp_path / "out.txt").open("w") as real:
+    wrapped = lo._ThreadStdout(real)
+    assert wrapped.fileno() == real.fileno()
+    assert wrapped.isatty() is False
@@ -0,0 +1,35 @@
+def _source(boot):
+  source = boot.fresh("Source", "source")
+  source.jadd_slot("count", "FIELD", "1", 1)
+  source.jadd_slot("items", "FIELD", "[]", [])
+  return source
+
+
+def test_clone_writes_stay_on_the_clone(boot):
+  source = _source(boot)
+  clone = boot.clone(source, "Copy")
+  assert clone.count == 1 and clone.tagline() == "source"
+  clone.count = 2
+  clone.jadd_slot("extra", "FIELD", "'x'", "x")
+  assert source.count == 1
+  assert "extra" not in source.slots
+
+
+def test_source_writes_do_not_reach_the_clone(boot):
+  source = _source(boot)
+  clone = boot.clone(source)
+  source.count = 5
+  source.jadd_slot("tagline", "METHOD", "lambda self: 'changed'", None)
+  source.delete_slot("items")
+  assert clone.count == 1
+  assert clone.tagline() == "source"
+  assert "items" in clone.slots
+
+
+def test_clone_survives_replay(boot, reopen):
+  source = _source(boot)
+  clone = boot.clone(source, "Copy")
+  clone.count = 3
+  reopened = reopen()
+  assert reopened.objsearch("Copy").count == 3
+  assert reopened.objsearch("Source").count == 1
@@ -0,0 +1,61 @@
+def test_unreachable_objects_are_garbage(boot):
+  lobby = boot.objsearch("Lobby")
+  kept = boot.fresh("Kept")
+  lobby.jadd_slot("kept", "FIELD", "None", kept)
+  child = boot.fresh("Child")
+  child.jadd_slot("parent*", "PARENT", "'Kept'", kept)
+  kept.jadd_slot("child", "FIELD", "None", child)
+  boot.fresh("Orphan")
+  report = boot.collect_garbage()
+  garbage = [name for _, name in report["garbage"]]
+  assert "Orphan" in garbage
+  assert "Kept" not in garbage and "Child" not in garbage
+  assert boot.objsearch("Orphan") is not None
+
+
+def test_sweep_unregisters_and_clears_dangling_links(boot):
+  lobby = boot.objsearch("Lobby")
+  gone = boot.fresh("Gone")
+  lobby.jadd_slot("stale", "FIELD", "None", gone)
+  boot.unregister(gone)
+  boot.fresh("Orphan")
+  report = boot.collect_garbage(dry_run=False)
+  assert ("Lobby", "stale", "Gone") in report["dangling"]
+  assert lobby.stale is None
+  assert boot.objsearch("Orphan") is None
+
+
+def test_extra_roots_keep_objects(boot):
+  boot.fresh("Pinned")
+  report = boot.collect_garbage(roots=["Pinned"])
+  assert "Pinned" not in [name for _, name in report["garbage"]]
+
+
+def test_registry_indexes_follow_register_and_unregister(boot):
+  first = boot.oblist
+  assert boot.oblist is first
+  made = boot.fresh("Registered")
+  assert boot.oblist is not first and boot.oblist[-1] is made
+  assert boot.objsearch("Registered") is made
+  assert all(boot.sersearch(obj.serial) is obj for obj in boot.oblist)
+  boot.unregister(made)
+  assert made not in boot.oblist
+  assert boot.objsearch("Registered") is None and boot.sersearch(made.serial) is None
+  boot.unregister(made)
+  assert len(boot.oblist) == len(first)
+
+
+def test_unregister_never_scans_the_object_list(lo, boot, monkeypatch):
+  older, newer = boot.fresh("Same"), boot.fresh("Same")
+  kept = boot.fresh("Kept")
+  lobby = boot.objsearch("Lobby")
+
+  def scan(self):
+    raise AssertionError("oblist scanned")
+  monkeypatch.setattr(lo.BootObject, "oblist", property(scan))
+  boot.unregister(older)
+  assert boot.objsearch("Same") is newer
+  boot.unregister(kept)
+  assert boot.sersearch(lobby.serial) is lobby
+  monkeypatch.undo()
+  assert [obj.name for obj in boot.oblist].count("Same") == 1
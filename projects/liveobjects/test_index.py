@@ -0,0 +1,52 @@
+def _matches_rebuild(lo, boot):
+  index = boot.slot_index()
+  rebuilt = lo.SlotIndex(boot)
+  assert index.by_name == rebuilt.by_name
+  assert index.by_token == rebuilt.by_token
+  return index
+
+
+def test_index_follows_added_and_deleted_slots(lo, boot):
+  index = boot.slot_index()
+  made = boot.fresh("Indexed")
+  made.jadd_slot("ping", "METHOD", "lambda self: self.boot.objsearch('Lobby')", None)
+  assert made in index.implementors("ping")
+  assert (made, "ping") in index.senders("objsearch", "Lobby")
+  made.jadd_slot("ping", "METHOD", "lambda self: 'pong'", None)
+  assert (made, "ping") not in index.senders("objsearch")
+  assert (made, "ping") in index.senders("pong")
+  _matches_rebuild(lo, boot)
+  made.delete_slot("ping")
+  assert index.implementors("ping") == []
+  assert index.senders("pong") == []
+  _matches_rebuild(lo, boot)
+
+
+def test_index_follows_clones_and_their_writes(lo, boot):
+  index = boot.slot_index()
+  source = boot.fresh("Original")
+  source.jadd_slot("greet", "METHOD", "lambda self: 'hello'", None)
+  clone = boot.clone(source, "Copy")
+  assert index.implementors("greet") == [source, clone]
+  _matches_rebuild(lo, boot)
+  clone.jadd_slot("greet", "METHOD", "lambda self: 'howdy'", None)
+  assert index.senders("hello") == [(source, "greet")]
+  assert index.senders("howdy") == [(clone, "greet")]
+  source.delete_slot("greet")
+  assert index.implementors("greet") == [clone]
+  boot.unregister(clone)
+  assert index.implementors("greet") == []
+  _matches_rebuild(lo, boot)
+
+
+def test_index_survives_renumbering(lo, boot):
+  index = boot.slot_index()
+  boot.unregister(boot.objsearch("NativeDialog"))
+  late = boot.fresh("Late")
+  late.jadd_slot("startup", "METHOD", "lambda self: None", None)
+  boot.snapshot(full=True)
+  assert [obj.serial for obj in boot.oblist] == list(range(len(boot.oblist)))
+  implementors = index.implementors("startup")
+  assert implementors[-1] is late
+  assert [obj.serial for obj in implementors] == sorted(obj.serial for obj in implementors)
+  _matches_rebuild(lo, boot)
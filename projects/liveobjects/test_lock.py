@@ -0,0 +1,69 @@
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def lock(lo):
+  return lo.RWLock()
+
+
+def _other_thread(fn):
+  result = []
+  thread = threading.Thread(target=lambda: result.append(fn()))
+  thread.start()
+  thread.join(timeout=5)
+  assert not thread.is_alive()
+  return result[0]
+
+
+def test_reader_cannot_upgrade(lock):
+  with lock.read():
+    with pytest.raises(RuntimeError):
+      lock.acquire_write()
+    assert lock.reading() and not lock.writing()
+  assert not lock.reading()
+
+
+def test_writer_reenters_and_may_read(lock):
+  with lock.write():
+    with lock.write(), lock.read():
+      assert lock.writing() and lock.reading()
+    assert lock.writing() and not lock.reading()
+  assert not lock.writing()
+
+
+def test_readers_share_and_exclude_writers(lock):
+  wrote = threading.Event()
+  with lock.read():
+    _other_thread(lambda: (lock.acquire_read(), lock.release_read()))
+    writer = threading.Thread(target=lambda: (lock.acquire_write(), wrote.set(), lock.release_write()))
+    writer.start()
+    assert not wrote.wait(0.2)
+  assert wrote.wait(5)
+  writer.join()
+
+
+def test_waiting_writer_goes_before_new_readers(lock):
+  order = []
+  lock.acquire_read()
+  writer = threading.Thread(target=lambda: (lock.acquire_write(), order.append("write"), lock.release_write()))
+  writer.start()
+  while not lock._writers_waiting:
+    pass
+  reader = threading.Thread(target=lambda: (lock.acquire_read(), order.append("read"), lock.release_read()))
+  reader.start()
+  lock.release_read()
+  writer.join(timeout=5)
+  reader.join(timeout=5)
+  assert order == ["write", "read"]
+
+
+def test_released_hands_the_lock_over(lock):
+  with lock.write(), lock.write(), lock.read():
+    with lock.released():
+      assert not lock.writing() and not lock.reading()
+      _other_thread(lambda: (lock.acquire_write(), lock.release_write()))
+    assert lock.writing() and lock.reading()
+    assert lock._depth == 2
+  assert not lock.writing() and not lock.reading()
@@ -0,0 +1,56 @@
+import pytest
+
+
+def _family(boot):
+  base = boot.fresh("Base")
+  base.jadd_slot("greet", "METHOD", "lambda self: 'base'", None)
+  base.jadd_slot("colour", "FIELD", "'red'", "red")
+  other = boot.fresh("Other")
+  other.jadd_slot("greet", "METHOD", "lambda self: 'other'", None)
+  other.jadd_slot("colour", "FIELD", "'blue'", "blue")
+  return base, other
+
+
+def test_delegation_through_star_and_parent_slots(boot):
+  base, other = _family(boot)
+  starred = boot.fresh("Starred")
+  starred.jadd_slot("proto*", "FIELD", "None", base)
+  typed = boot.fresh("Typed")
+  typed.jadd_slot("proto", "PARENT", "None", other)
+  grand = boot.fresh("Grand")
+  grand.jadd_slot("up*", "FIELD", "None", starred)
+  assert starred.greet() == "base" and starred.colour == "red"
+  assert typed.greet() == "other" and typed.colour == "blue"
+  assert grand.greet() == "base"
+  with pytest.raises(AttributeError):
+    grand.missing
+
+
+def test_cache_sees_added_and_deleted_slots(boot):
+  base, _ = _family(boot)
+  child = boot.fresh("Child")
+  child.jadd_slot("proto*", "FIELD", "None", base)
+  assert child.greet() == "base"
+  child.jadd_slot("greet", "METHOD", "lambda self: 'own'", None)
+  assert child.greet() == "own"
+  child.delete_slot("greet")
+  assert child.greet() == "base"
+  base.delete_slot("greet")
+  with pytest.raises(AttributeError):
+    child.greet
+  base.jadd_slot("greet", "METHOD", "lambda self: 'back'", None)
+  assert child.greet() == "back"
+
+
+def test_cache_sees_parent_reassignment(boot):
+  base, other = _family(boot)
+  child = boot.fresh("Child")
+  child.jadd_slot("proto*", "FIELD", "None", base)
+  assert child.colour == "red"
+  setattr(child, "proto*", other)
+  assert child.colour == "blue" and child.greet() == "other"
+  typed = boot.fresh("Typed")
+  typed.jadd_slot("proto", "PARENT", "None", base)
+  assert typed.colour == "red"
+  typed.jadd_slot("proto", "PARENT", "None", other)
+  assert typed.colour == "blue"
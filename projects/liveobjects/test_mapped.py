@@ -0,0 +1,51 @@
+import os
+
+
+def _mapped_boot(lo):
+  fresh = lo.BootObject()
+  with fresh.lock.write(), fresh.loading():
+    assert fresh.open_mapped_image()
+  return fresh
+
+
+def test_objects_load_on_first_touch(lo, boot):
+  lobby = boot.objsearch("Lobby")
+  boot.fresh("Linked").jadd_slot("target", "FIELD", "None", lobby)
+  boot.objsearch("Inspector").term = [1, "two"]
+  boot.write_mapped_image()
+  names = sorted(obj.name for obj in boot.oblist)
+
+  mapped = _mapped_boot(lo)
+  image = mapped._mapped
+  assert sorted(obj.name for obj in mapped.oblist) == names
+  assert image.pending() == len(names) - 1
+  inspector = mapped.objsearch("Inspector")
+  assert inspector.term == [1, "two"]
+  assert image.pending() == len(names) - 2
+  assert mapped.objsearch("Linked").target is mapped.objsearch("Lobby")
+  for obj in mapped.oblist:
+    obj.slots
+  assert image.pending() == 0
+  assert mapped._mapped is None
+
+
+def test_stale_mapped_image_is_rejected(lo, boot):
+  path = boot.write_mapped_image()
+  st = lo.FILEPATH.stat()
+  os.utime(lo.FILEPATH, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+  assert not lo.BootObject().open_mapped_image(path)
+  relaxed = lo.BootObject()
+  with relaxed.lock.write(), relaxed.loading():
+    assert relaxed.open_mapped_image(path, strict=False)
+
+
+def test_corrupt_offset_table_is_rejected(lo, boot):
+  path = boot.write_mapped_image()
+  data = bytearray(path.read_bytes())
+  path.write_bytes(bytes(data[:-10]))
+  assert not lo.BootObject().open_mapped_image(path)
+  data[8:16] = (len(data) + 64).to_bytes(8, "little")
+  path.write_bytes(bytes(data))
+  assert not lo.BootObject().open_mapped_image(path)
+  path.write_bytes(b"not an image at all")
+  assert not lo.BootObject().open_mapped_image(path)
@@ -0,0 +1,42 @@
+import pytest
+
+
+@pytest.fixture
+def browser(boot):
+  browser = boot.objsearch("PrimaBrowser")
+  browser.selected_object = boot.fresh("Edited", "before")
+  return browser
+
+
+def test_edits_compile_eagerly(boot, browser):
+  target = browser.selected_object
+  with pytest.raises(SyntaxError):
+    browser.update("tagline", "lambda self: (")
+  with pytest.raises(SyntaxError):
+    browser.callback_add_method("broken", "def broken(self):\n  return (")
+  assert target.tagline() == "before"
+  assert "broken" not in target.slots
+  browser.update("tagline", "lambda self: 'after'")
+  assert target.slots["tagline"].value is not None
+  assert target.tagline() == "after"
+
+
+def test_loading_keeps_methods_lazy(boot, reopen):
+  target = boot.fresh("Lazy")
+  target.jadd_slot("later", "METHOD", "lambda self: 'compiled'", None)
+  reopened = reopen().objsearch("Lazy")
+  assert reopened.slots["later"].value is None
+  assert reopened.later() == "compiled"
+
+
+def test_full_snapshot_prunes_the_method_cache(lo, boot, monkeypatch):
+  monkeypatch.setattr(lo, "METHOD_CACHE_ON_DISK", True)
+  target = boot.fresh("Cached")
+  target.jadd_slot("old", "METHOD", "lambda self: 'old'", None)
+  stale = lo._method_digest("lambda self: 'old'")[1]
+  target.jadd_slot("old", "METHOD", "lambda self: 'new'", None)
+  assert stale in lo._METHOD_CODE_CACHE
+  boot.snapshot(full=True)
+  assert stale not in lo._METHOD_CODE_CACHE
+  assert lo._method_digest("lambda self: 'new'")[1] in lo._METHOD_CODE_CACHE
+  assert lo.load_method_cache() == len(lo._METHOD_CODE_CACHE)
@@ -0,0 +1,90 @@
+import json
+
+
+def test_journal_round_trip(boot, reopen):
+  boot.objsearch("Inspector").term = {"rows": [1, 2.5, (3, "x")]}
+  boot.fresh("Journaled").jadd_slot("note", "FIELD", "'kept'", "kept")
+  reopened = reopen()
+  assert reopened.objsearch("Inspector").term == {"rows": [1, 2.5, (3, "x")]}
+  assert reopened.objsearch("Journaled").note == "kept"
+
+
+def test_delta_round_trip(boot, reopen):
+  boot.objsearch("Inspector").term = [1, 2, 3]
+  made = boot.fresh("Delta")
+  made.jadd_slot("link", "FIELD", "None", boot.objsearch("Lobby"))
+  boot.snapshot(full=False)
+  assert boot._delta_path().exists()
+  boot.close_journal()
+  boot._journal_path().unlink()
+  reopened = reopen()
+  assert reopened.objsearch("Inspector").term == [1, 2, 3]
+  assert reopened.objsearch("Delta").link is reopened.objsearch("Lobby")
+
+
+def test_replay_after_delete_and_recreate(boot, reopen):
+  first = boot.fresh("Twice")
+  first.jadd_slot("value", "FIELD", "1", 1)
+  boot.unregister(first)
+  second = boot.fresh("Twice")
+  second.jadd_slot("value", "FIELD", "2", 2)
+  reopened = reopen()
+  matches = [obj for obj in reopened.oblist if obj.name == "Twice"]
+  assert len(matches) == 1
+  assert matches[0].value == 2
+
+
+def test_unrepresentable_value_is_saved_as_none(boot, reopen, capsys):
+  boot.objsearch("Inspector").term = object()
+  boot.objsearch("Inspector").current_object = float("inf")
+  boot.snapshot(full=False)
+  boot.objsearch("Inspector").term = object()
+  assert "no literal form" in capsys.readouterr().out
+  reopened = reopen()
+  assert reopened.objsearch("Inspector").term is None
+  assert reopened.objsearch("Inspector").current_object is None
+
+
+def test_bad_journal_record_is_skipped(boot, reopen, capsys):
+  boot.objsearch("Inspector").term = "before"
+  serial = boot.objsearch("Inspector").serial
+  with boot._journal_path().open("a") as handle:
+    bad = {"op": "slot", "obj": serial, "name": "term", "kind": "FIELD", "source": None, "value": "<object>"}
+    handle.write(json.dumps(bad) + "\n")
+  boot.close_journal()
+  reopened = reopen()
+  assert "Skipping journal record" in capsys.readouterr().out
+  assert reopened.objsearch("Inspector").term == "before"
+
+
+def test_journal_file_appears_on_first_write(boot):
+  path = boot._journal_path()
+  boot.objsearch("Lobby").tagline()
+  boot.snapshot(full=False)
+  assert not path.exists()
+  boot.objsearch("Inspector").term = "written"
+  assert json.loads(path.read_text().splitlines()[0]) == {"op": "base", "age": boot.age}
+
+
+def test_unwritable_journal_warns_once(boot, capsys):
+  boot._journal.path = boot._journal_path().with_name("missing") / "journal"
+  boot.objsearch("Inspector").term = 1
+  boot.objsearch("Inspector").term = 2
+  assert capsys.readouterr().out.count("is not writable") == 1
+  assert boot.objsearch("Inspector").term == 2
+
+
+def test_field_assignment_keeps_widgets_and_drops_stale_source(lo, boot, reopen):
+  browser = boot.objsearch("PrimaBrowser")
+  view = object()
+  browser.widget_window = view
+  assert browser.widget_window is view
+  boot.autosave_changes = 2
+  assert boot.slots["autosave_changes"].source is None
+  boot.snapshot(full=True)
+  text = lo.FILEPATH.read_text()
+  assert "jadd_slot('autosave_changes', FIELD, '2', 2)" in text
+  assert "jadd_slot('widget_window', FIELD, 'None', None)" in text
+  reopened = reopen()
+  assert reopened.autosave_changes == 2
+  assert reopened.objsearch("PrimaBrowser").widget_window is None
@@ -0,0 +1,50 @@
+import pstats
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def profiler(lo, boot):
+  profiler = lo.enable_profiling()
+  yield profiler
+  lo.disable_profiling()
+
+
+def _row(profiler, name, slot):
+  return [row for row in profiler.rows() if row["object"] == name and row["slot"] == slot]
+
+
+def test_stats_follow_the_object_across_renumbering(boot, profiler):
+  lobby = boot.objsearch("Lobby")
+  lobby.tagline()
+  boot.unregister(boot.oblist[1])
+  boot.snapshot(full=True)
+  lobby.tagline()
+  rows = _row(profiler, "Lobby", "tagline")
+  assert len(rows) == 1
+  assert rows[0]["calls"] == 2
+  assert rows[0]["serial"] == lobby.serial
+
+
+def test_counts_are_exact_across_threads(boot, profiler):
+  lobby = boot.objsearch("Lobby")
+
+  def work():
+    for _ in range(500):
+      lobby.tagline()
+  threads = [threading.Thread(target=work) for _ in range(4)]
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+  assert _row(profiler, "Lobby", "tagline")[0]["calls"] == 2000
+
+
+def test_dump_loads_with_pstats(boot, profiler, tmp_path):
+  boot.objsearch("Lobby").tagline()
+  path = profiler.dump(tmp_path / "slots.pstats")
+  stats = pstats.Stats(str(path))
+  lobby = boot.objsearch("Lobby")
+  assert stats.stats[("Lobby", lobby.serial, "tagline")][1] == 1
+  stats.sort_stats("cumulative").print_stats(5)
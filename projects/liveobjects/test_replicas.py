@@ -0,0 +1,78 @@
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture
+def pool(lo, boot):
+  pool = lo.ReplicaPool(boot, 2).start()
+  yield pool
+  pool.stop()
+
+
+def test_replicas_see_writes(pool):
+  replies = pool.run_many([
+    "boot.fresh('Seen')",
+    "boot.objsearch('Seen').name",
+    "boot.objsearch('Seen').serial_number",
+  ])
+  assert replies[1]["result"] == "Seen"
+  assert replies[2]["result"] == str(pool.boot.objsearch("Seen").serial)
+
+
+def test_snapshot_runs_on_the_writer(pool, reopen):
+  replies = pool.run_many(["boot.fresh('A1')", "snapshot", "boot.fresh('A2')", "boot.objsearch('A2').name"])
+  assert all(reply["ok"] for reply in replies)
+  assert replies[3]["result"] == "A2"
+  pool.stop()
+  reopened = reopen()
+  assert reopened.objsearch("A1") is not None
+  assert reopened.objsearch("A2") is not None
+
+
+def test_replica_refuses_image_writes(boot):
+  boot._replica = True
+  with pytest.raises(RuntimeError, match="read replica"):
+    boot.snapshot()
+  with pytest.raises(RuntimeError, match="read replica"):
+    boot.write_image()
+
+
+def test_full_snapshot_renumbers_replicas(pool):
+  boot = pool.boot
+  first = boot.oblist[1]
+  replies = pool.run_many([
+    f"boot.unregister(boot.sersearch({first.serial}))",
+    "boot.fresh('Moved')",
+    "boot.snapshot(full=True)",
+    "boot.objsearch('Moved').serial_number",
+    "boot.sersearch(boot.objsearch('Moved').serial).name",
+  ])
+  assert all(reply["ok"] for reply in replies)
+  moved = boot.objsearch("Moved")
+  assert replies[3]["result"] == str(moved.serial) == str(len(boot.oblist) - 1)
+  assert replies[4]["result"] == "Moved"
+
+
+def test_replicas_never_see_half_a_mutation(pool):
+  boot = pool.boot
+  done = threading.Event()
+
+  def mutate():
+    for i in range(40):
+      with boot.lock.write():
+        obj = boot.fresh(f"Pair{i}")
+        obj.jadd_slot("a", "FIELD", repr(i), i)
+        time.sleep(0.002)
+        obj.jadd_slot("b", "FIELD", repr(i), i)
+    done.set()
+
+  writer = threading.Thread(target=mutate)
+  writer.start()
+  replies = []
+  while not done.is_set():
+    replies.append(pool.run("[getattr(o, 'a', None) == getattr(o, 'b', None) for o in boot.oblist]"))
+  writer.join()
+  assert replies and all(reply["ok"] for reply in replies)
+  assert not [reply for reply in replies if "False" in reply["result"]]
@@ -0,0 +1,77 @@
+import gc
+import subprocess
+import sys
+
+import pytest
+
+
+def test_pseudo_commands_only_as_statements(boot, capsys):
+  source = "\n".join([
+    "boot.fresh('Scripted')",
+    "text = '''",
+    "snapshot",
+    "exit",
+    "'''",
+    "boot.objsearch('Scripted').jadd_slot('text', FIELD, repr(text), text)",
+    "if True:",
+    "  snapshot",
+    "exit",
+    "boot.fresh('Unreached')",
+  ])
+  assert boot.run_script(source) is True
+  assert boot.objsearch("Scripted").text == "\nsnapshot\nexit\n"
+  assert boot.objsearch("Unreached") is None
+  assert capsys.readouterr().out.count("Snapshot") == 1
+
+
+def test_script_runs_under_the_write_lock(lo, boot):
+  boot.run_script("held = boot.lock.writing()")
+  assert lo._eval_namespace(boot, boot.objsearch("Command_executor"))["held"] is True
+
+
+def test_exit_in_file_skips_commands(lo, tmp_path):
+  script = tmp_path / "stop.py"
+  script.write_text("exit\n")
+  result = subprocess.run(
+    [sys.executable, str(lo.FILEPATH), "-f", str(script), "-c", "print('after')"],
+    capture_output=True, text=True, cwd=tmp_path, timeout=60,
+  )
+  assert result.returncode == 0, result.stderr
+  assert "after" not in result.stdout
+
+
+def test_each_caller_keeps_its_own_names(lo, boot):
+  lobby, inspector = boot.objsearch("Lobby"), boot.objsearch("Inspector")
+  lo._eval_in_context(boot, "mine = 'lobby'", lobby)
+  lo._eval_in_context(boot, "mine = 'inspector'", inspector)
+  assert lo._eval_in_context(boot, "mine", lobby) == "lobby"
+  assert lo._eval_in_context(boot, "mine", inspector) == "inspector"
+  with pytest.raises(NameError):
+    lo._eval_in_context(boot, "mine")
+  lo.GLOBAL_ENV["shared_later"] = 7
+  try:
+    assert lo._eval_in_context(boot, "shared_later + 1", lobby) == 8
+  finally:
+    del lo.GLOBAL_ENV["shared_later"]
+  assert "shared_later" not in lo._eval_namespace(boot, lobby)
+
+
+def test_namespace_goes_with_its_caller(lo, boot):
+  made = boot.fresh("Transient")
+  lo._eval_in_context(boot, "x = 1", made)
+  before = len(lo._EVAL_CONTEXTS)
+  boot.unregister(made)
+  del made
+  gc.collect()
+  assert len(lo._EVAL_CONTEXTS) == before - 1
+
+
+def test_commands_compile_once(lo, boot):
+  lo._compile_command.cache_clear()
+  for _ in range(3):
+    boot.run_command("  boot.objsearch('Lobby').name  ")
+  boot.run_command("boot.objsearch('Lobby').name")
+  info = lo._compile_command.cache_info()
+  assert (info.misses, info.hits) == (1, 3)
+  assert lo._compile_command("total = 1")[0] == "exec"
+  assert lo._compile_command("total")[0] == "eval"
@@ -0,0 +1,87 @@
+import json
+import shutil
+import socket
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from conftest import RUNTIME
+
+
+def _session(path, commands):
+  with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+    sock.connect(str(path))
+    stream = sock.makefile("rwb")
+    replies = []
+    for command in commands:
+      stream.write(command.encode("utf-8") + b"\n")
+      stream.flush()
+      replies.append(json.loads(stream.readline()))
+    return replies
+
+
+def _serving(lo, boot, path):
+  server = lo.CommandServer(boot, str(path))
+  thread = threading.Thread(target=server.serve_forever, daemon=True)
+  thread.start()
+  return server, thread
+
+
+def test_pseudo_commands_are_not_read_only(lo):
+  assert lo.is_read_only_command("boot.objsearch('Lobby')")
+  assert not lo.is_read_only_command("snapshot")
+  assert not lo.is_read_only_command(" exit ")
+
+
+def test_snapshot_over_socket(lo, boot, reopen, tmp_path):
+  server, thread = _serving(lo, boot, tmp_path / "lo.sock")
+  try:
+    replies = _session(tmp_path / "lo.sock", [
+      "boot.fresh('Served')",
+      "snapshot",
+      "boot.objsearch('Served').name",
+    ])
+  finally:
+    server.shutdown()
+    thread.join(timeout=5)
+  assert [reply["ok"] for reply in replies] == [True, True, True]
+  assert replies[2]["result"] == "Served"
+  assert reopen().objsearch("Served") is not None
+
+
+def test_serve_address_checks(lo, tmp_path):
+  plain = tmp_path / "notes.txt"
+  plain.write_text("keep me")
+  with pytest.raises(ValueError, match="not a socket"):
+    lo.parse_serve_address(str(plain))
+  with pytest.raises(ValueError, match="not a loopback"):
+    lo.parse_serve_address("0.0.0.0:7700")
+  with pytest.raises(ValueError, match="bad port"):
+    lo.parse_serve_address("localhost:http")
+  assert lo.parse_serve_address("0.0.0.0:7700", any_host=True) == ("tcp", ("0.0.0.0", 7700))
+  assert lo.parse_serve_address("7700") == ("tcp", ("127.0.0.1", 7700))
+  assert plain.read_text() == "keep me"
+
+
+def test_stale_socket_is_replaced(lo, boot, tmp_path):
+  path = tmp_path / "lo.sock"
+  with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+    stale.bind(str(path))
+  server, thread = _serving(lo, boot, path)
+  try:
+    assert _session(path, ["boot.objsearch('Lobby').name"])[0]["result"] == "Lobby"
+  finally:
+    server.shutdown()
+    thread.join(timeout=5)
+
+
+def test_bad_serve_address_is_a_usage_error(tmp_path):
+  shutil.copy(RUNTIME, tmp_path / "liveobjects.py")
+  run = subprocess.run(
+    [sys.executable, "liveobjects.py", "--serve", "host:port"], cwd=tmp_path, capture_output=True, text=True, timeout=60
+  )
+  assert run.returncode == 2
+  assert "--serve: bad port" in run.stderr
+  assert "Traceback" not in run.stderr
@@ -0,0 +1,95 @@
+import pytest
+
+
+@pytest.fixture
+def binary(boot):
+  boot.snapshot_format = "binary"
+  boot.snapshot_keep_last = 2
+  boot.snapshot_keep_hourly = 0
+  boot.snapshot_keep_daily = 0
+  return boot
+
+
+def test_binary_backup_rolls_back(binary, reopen, lo):
+  binary.fresh("First")
+  binary.snapshot(full=True)
+  first_age = binary.age
+  binary.fresh("Second")
+  binary.snapshot(full=True)
+  assert binary._image_path(first_age).exists()
+  backup = binary.history().read(binary.age)
+  lo.FILEPATH.write_text(backup)
+  restored = reopen()
+  assert restored.age == first_age
+  assert restored.objsearch("First") is not None
+  assert restored.objsearch("Second") is None
+
+
+def test_stub_refuses_another_image(binary, reopen):
+  binary.snapshot(full=True)
+  binary._image_path(binary.age).write_bytes(binary._image_path().read_bytes())
+  with pytest.raises(RuntimeError, match="not the one this snapshot wrote"):
+    reopen()
+
+
+def test_pruned_backups_drop_their_images(binary):
+  ages = []
+  for name in ("One", "Two", "Three", "Four"):
+    binary.fresh(name)
+    binary.snapshot(full=True)
+    ages.append(binary.age)
+  kept = {entry.get("image") for entry in binary.history().entries}
+  assert not binary._image_path(ages[0]).exists()
+  assert all(binary._image_path(age).exists() for age in kept | {ages[-1]} if age is not None)
+
+
+def test_full_snapshot_numbers_unjournaled_objects_apart(boot, reopen):
+  boot.close_journal()
+  first, second = boot.fresh("Unjournaled1"), boot.fresh("Unjournaled2")
+  assert first.serial == second.serial == -1
+  boot.snapshot(full=True)
+  assert first.serial != second.serial
+  assert boot.sersearch(first.serial) is first and boot.sersearch(second.serial) is second
+  reopened = reopen()
+  assert reopened.objsearch("Unjournaled1").serial_number != reopened.objsearch("Unjournaled2").serial_number
+
+
+def test_source_snapshot_round_trip(boot, reopen, lo):
+  lobby = boot.objsearch("Lobby")
+  made = boot.fresh("Sourced")
+  made.jadd_slot("note", "FIELD", "None", "it's\n'quoted'")
+  made.jadd_slot("table", "FIELD", "None", {"rows": [1, 2.5, (3, "x")], "on": True})
+  made.jadd_slot("home*", "FIELD", "None", lobby)
+  made.jadd_slot("double", "METHOD", "lambda self, n: n * 2", None)
+  copy = boot.clone(made, "SourcedCopy")
+  copy.note = "copied"
+  boot.snapshot(full=True)
+  hydrate = lo.FILEPATH.read_text().rsplit("\n" + lo.SNAPSHOT_MARKER, 1)[1]
+  assert "jadd_slot('double', METHOD" in hydrate and "load_image(" not in hydrate
+  boot.close_journal()
+  # Everything reopened below comes from the source snapshot alone.
+  assert len(boot._journal_path().read_text().splitlines()) == 1
+  assert not boot._delta_path().exists()
+  reopened = reopen()
+  made, copy = reopened.objsearch("Sourced"), reopened.objsearch("SourcedCopy")
+  assert made.note == "it's\n'quoted'"
+  assert made.table == {"rows": [1, 2.5, (3, "x")], "on": True}
+  assert made.slots["home*"].value is reopened.objsearch("Lobby")
+  assert made.tagline() == lobby.tagline()
+  assert made.double(21) == 42
+  assert copy.note == "copied" and copy.double(2) == 4
+  assert sorted(obj.name for obj in reopened.oblist) == sorted(obj.name for obj in boot.oblist)
+
+
+def test_full_snapshot_renumbering_is_stable(boot):
+  boot.unregister(boot.objsearch("NativeDialog"))
+  boot.fresh("Tail")
+  order = [obj.name for obj in boot.oblist]
+  boot.snapshot(full=True)
+  serials = [obj.serial for obj in boot.oblist]
+  assert [obj.name for obj in boot.oblist] == order
+  assert serials == list(range(len(order)))
+  assert all(obj.serial_number == obj.serial for obj in boot.oblist if "serial_number" in obj.slots)
+  boot.snapshot(full=True)
+  assert [obj.serial for obj in boot.oblist] == serials
+  assert all(boot.sersearch(serial).name == name for serial, name in zip(serials, order))
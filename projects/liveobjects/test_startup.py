@@ -0,0 +1,57 @@
+import importlib.util
+import json
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+from conftest import RUNTIME
+
+
+def test_deferred_startup_is_not_journaled(boot):
+  path = boot._journal_path()
+  boot.startup_all(defer=True)
+  inspector = boot.objsearch("Inspector")
+  assert inspector.current_object is inspector
+  boot.start_deferred()
+  assert not boot._pending_startup
+  assert not path.exists()
+  inspector.term = "typed"
+  records = [json.loads(line) for line in path.read_text().splitlines()]
+  assert [record.get("name") for record in records] == [None, "term"]
+
+
+def test_lazy_module_imports_on_first_use(lo, monkeypatch):
+  monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+  module = lo._lazy_module("colorsys")
+  assert sys.modules["colorsys"] is module
+  assert isinstance(module, importlib.util._LazyModule)
+  assert module.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+  assert not isinstance(module, importlib.util._LazyModule)
+  assert lo._lazy_module("colorsys") is module
+
+
+def test_cocoa_proxy_forwards_to_the_loaded_symbol(lo, monkeypatch):
+  monkeypatch.setattr(lo, "_COCOA", {"NSWindowStyleMaskTitled": 1, "NSWindowStyleMaskClosable": 2, "NSApp": None})
+  titled = lo._CocoaProxy("NSWindowStyleMaskTitled")
+  closable = lo._CocoaProxy("NSWindowStyleMaskClosable")
+  assert titled | closable == 3
+  assert titled == 1 and int(closable) == 2
+  assert bool(titled) and not lo._CocoaProxy("NSApp")
+  with pytest.raises(RuntimeError, match="NSApp is not available"):
+    lo._CocoaProxy("NSApp").sharedApplication()
+
+
+def test_fast_timings_reports_each_phase(tmp_path):
+  shutil.copy(RUNTIME, tmp_path / "liveobjects.py")
+  run = subprocess.run(
+    [sys.executable, "liveobjects.py", "--fast", "--timings", "-c", "boot.objsearch('Lobby').name"],
+    cwd=tmp_path, capture_output=True, text=True, timeout=60,
+  )
+  assert run.returncode == 0, run.stderr
+  assert run.stdout.strip().splitlines()[-1] == "Lobby"
+  phases = [line.split()[0] for line in run.stderr.splitlines()]
+  for phase in ("hydrate", "deltas/journal", "startup", "commands", "total"):
+    assert phase in phases
+  assert not (tmp_path / "liveobjects.py.journal").exists()